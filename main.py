@@ -2,24 +2,24 @@
 # main.py — Execução principal do projeto Caminho do Cavalo
 # =============================================================
 
-import json
-import pygame
+# pygame e a interface só são importados ao abrir a primeira tela: importar
+# este módulo (testes, ferramentas) não carrega nada gráfico
 import sys
-from src.tabuleiro import Tabuleiro
-from src.interface_grafica import mostrar_busca_animada
 from src.gerador_tabuleiro import gerar_tabuleiro_aleatorio
+from src.leitor_cenarios import ler_cenarios
+
+CENARIO_FIXO = "cenarios/cenario_basico.json"
 
 
 # ------------------- MENU INICIAL -------------------
 def menu_inicial():
-    pygame.init()
+    import pygame
+    from src.interface_grafica import iniciar_pygame, texto
+    iniciar_pygame()
     largura, altura = 720, 480
     tela = pygame.display.set_mode((largura, altura))
     pygame.display.set_caption("Caminho do Cavalo — Menu Inicial")
 
-    fonte_titulo = pygame.font.SysFont("Arial", 40, bold=True)
-    fonte_botao = pygame.font.SysFont("Arial", 24, bold=True)
-
     botoes = {
         "fixo": pygame.Rect(largura//2 - 160, 160, 320, 60),
         "aleatorio": pygame.Rect(largura//2 - 160, 250, 320, 60),
@@ -41,19 +41,19 @@ def menu_inicial():
                         rodando = False
 
         tela.fill((245, 245, 245))
-        titulo = fonte_titulo.render("Caminho do Cavalo", True, (0, 0, 0))
+        titulo = texto("Caminho do Cavalo", (0, 0, 0), tamanho=40, negrito=True)
         tela.blit(titulo, (largura//2 - titulo.get_width()//2, 70))
 
         for modo, rect in botoes.items():
             hover = rect.collidepoint(pygame.mouse.get_pos())
             cor = (100, 150, 250) if hover else (70, 110, 210)
             pygame.draw.rect(tela, cor, rect, border_radius=12)
-            texto = {
+            rotulo = {
                 "fixo": "Cenário Fixo (JSON)",
                 "aleatorio": "Cenário Aleatório",
                 "sair": "Sair do Jogo"
             }[modo]
-            label = fonte_botao.render(texto, True, (255, 255, 255))
+            label = texto(rotulo, (255, 255, 255), tamanho=24, negrito=True)
             tela.blit(label, (rect.centerx - label.get_width()//2,
                               rect.centery - label.get_height()//2))
         pygame.display.flip()
@@ -65,17 +65,15 @@ def menu_inicial():
 
 # ------------------- EXECUÇÕES -------------------
 def executar_tabuleiro_fixo():
-    """Executa o algoritmo e a interface com o cenário JSON fixo."""
-    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
-        dados = json.load(f)
-    tabuleiro = Tabuleiro.carregar_de_json(dados)
-    inicio = (7, 0)
-    objetivo = (0, 7)
+    """Executa o algoritmo e a interface com o cenário JSON fixo (início/objetivo do arquivo)."""
+    from src.interface_grafica import mostrar_busca_animada
+    tabuleiro, inicio, objetivo, _ = next(ler_cenarios([CENARIO_FIXO]))
     mostrar_busca_animada(tabuleiro, inicio, objetivo, velocidade=0.4)
 
 
 def executar_tabuleiro_aleatorio():
     """Executa o algoritmo e a interface com um tabuleiro gerado aleatoriamente."""
+    from src.interface_grafica import mostrar_busca_animada
     tabuleiro = gerar_tabuleiro_aleatorio()
     inicio = (7, 0)
     objetivo = (0, 7)
@@ -0,0 +1,211 @@
+# =============================================================
+#  benchmark_buscas.py — Benchmark das buscas e heurísticas
+# =============================================================
+#
+#  Uso:
+#    python -m src.benchmark_buscas --saida benchmark.json
+#    python -m src.benchmark_buscas --saida atual.json --comparar benchmark.json
+#
+#  Roda busca_a_estrela sobre tabuleiros sorteados com sementes fixas,
+#  variando tamanho, densidade de barreiras/lama e distância início-objetivo.
+
+from __future__ import annotations
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.tabuleiro import Tabuleiro, Terreno, Coordenada
+from src.busca_a_estrela import busca_a_estrela, HEURISTICAS, MODOS_BUSCA
+from src.gerador_tabuleiro import gerar_tabuleiro_aleatorio
+
+VERSAO_FORMATO = 1
+
+TAMANHOS = (8, 32, 96)
+# nome → (prob_barreira, prob_lama) para gerar_tabuleiro_aleatorio
+DENSIDADES: Dict[str, Tuple[float, float]] = {
+    "livre": (0.0, 0.05),
+    "media": (0.12, 0.18),
+    "densa": (0.25, 0.30),
+}
+DISTANCIAS = ("curta", "media", "longa")
+SEMENTES = (1, 2)
+
+
+@dataclass(frozen=True)
+class CenarioBenchmark:
+    """Um tabuleiro sorteado do benchmark (reprodutível pela semente)."""
+    tamanho: int
+    densidade: str
+    distancia: str
+    semente: int
+
+    @property
+    def nome(self) -> str:
+        return f"{self.tamanho}x{self.tamanho}-{self.densidade}-{self.distancia}-s{self.semente}"
+
+    def montar(self) -> Tuple[Tabuleiro, Coordenada, Coordenada]:
+        prob_barreira, prob_lama = DENSIDADES[self.densidade]
+        tab = gerar_tabuleiro_aleatorio(prob_barreira, prob_lama, linhas=self.tamanho,
+                                        colunas=self.tamanho, semente=self.semente, verboso=False)
+        n = self.tamanho - 1
+        inicio = (n, 0)
+        objetivo = {"curta": (n - n // 4, n // 4),
+                    "media": (n // 2, n // 2),
+                    "longa": (0, n)}[self.distancia]
+        if tab.bloqueado(objetivo):
+            tab.definir_terreno(objetivo, Terreno.TERRA)
+        return tab, inicio, objetivo
+
+
+def cenarios_padrao(rapido: bool = False) -> List[CenarioBenchmark]:
+    """Varredura completa (ou só os tabuleiros pequenos, com rapido=True)."""
+    tamanhos = TAMANHOS[:2] if rapido else TAMANHOS
+    sementes = SEMENTES[:1] if rapido else SEMENTES
+    return [CenarioBenchmark(t, d, dist, s)
+            for t in tamanhos for d in DENSIDADES for dist in DISTANCIAS for s in sementes]
+
+
+# -------------------------------------------------------------
+# Medição
+# -------------------------------------------------------------
+def medir(tab: Tabuleiro, inicio: Coordenada, objetivo: Coordenada,
+          heuristica: str, modo: str = "unidirecional", repeticoes: int = 3) -> dict:
+    """
+    Mede uma busca: melhor tempo de `repeticoes` execuções, nós expandidos,
+    inserções na fila e pico de memória (tracemalloc, numa execução à parte
+    para não distorcer o tempo). Uma execução de aquecimento antes monta as
+    estruturas do tabuleiro (índice, tabelas, marcos), então o tempo é o de
+    regime.
+    """
+    busca_a_estrela(tab, inicio, objetivo, heuristica, modo=modo)
+
+    tempos = []
+    estatisticas: dict = {}
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        caminho, custo = busca_a_estrela(tab, inicio, objetivo, heuristica,
+                                         modo=modo, estatisticas=estatisticas)
+        tempos.append(time.perf_counter() - t0)
+
+    ja_rastreando = tracemalloc.is_tracing()
+    if not ja_rastreando:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    busca_a_estrela(tab, inicio, objetivo, heuristica, modo=modo)
+    pico = tracemalloc.get_traced_memory()[1] - base
+    if not ja_rastreando:
+        tracemalloc.stop()
+
+    return {
+        "custo": custo if caminho else None,
+        "passos": max(len(caminho) - 1, 0),
+        "tempo_s": min(tempos),
+        "expandidos": estatisticas.get("expandidos", 0),
+        "empilhados": estatisticas.get("empilhados", 0),
+        "memoria_pico_kb": round(pico / 1024, 1),
+    }
+
+
+def executar_benchmark(cenarios: List[CenarioBenchmark], heuristicas: List[str],
+                       modos: Tuple[str, ...] = ("unidirecional",),
+                       repeticoes: int = 3) -> Iterator[dict]:
+    """Produz um registro por (cenário, heurística, modo)."""
+    for cenario in cenarios:
+        tab, inicio, objetivo = cenario.montar()
+        for heuristica in heuristicas:
+            for modo in modos:
+                registro = {"cenario": cenario.nome, **asdict(cenario),
+                            "heuristica": heuristica, "modo": modo}
+                registro.update(medir(tab, inicio, objetivo, heuristica, modo, repeticoes))
+                yield registro
+
+
+# -------------------------------------------------------------
+# Comparação com uma linha de base
+# -------------------------------------------------------------
+def _chave(registro: dict) -> Tuple[str, str, str]:
+    return registro["cenario"], registro["heuristica"], registro["modo"]
+
+
+# diferenças abaixo disso são ruído de medição, qualquer que seja o percentual
+PISO_TEMPO_S = 0.002
+PISO_MEMORIA_KB = 16.0
+
+
+def comparar(atual: List[dict], base: List[dict], tolerancia_tempo: float = 0.25,
+             tolerancia_memoria: float = 0.25) -> List[str]:
+    """
+    Lista as regressões de `atual` em relação a `base`. Expansões e inserções
+    são determinísticas: qualquer aumento conta. Tempo e memória só contam
+    acima da tolerância relativa e do piso absoluto; o custo do caminho deve
+    ser idêntico.
+    """
+    referencia = {_chave(r): r for r in base}
+    regressoes = []
+    for r in atual:
+        b = referencia.get(_chave(r))
+        if b is None:
+            continue
+        nome = "/".join(_chave(r))
+        if r["custo"] != b["custo"]:
+            regressoes.append(f"{nome}: custo {b['custo']} → {r['custo']}")
+        for campo in ("expandidos", "empilhados"):
+            if r[campo] > b[campo]:
+                regressoes.append(f"{nome}: {campo} {b[campo]} → {r[campo]}")
+        for campo, tolerancia, piso in (("tempo_s", tolerancia_tempo, PISO_TEMPO_S),
+                                        ("memoria_pico_kb", tolerancia_memoria, PISO_MEMORIA_KB)):
+            if b[campo] > 0 and r[campo] - b[campo] > max(b[campo] * tolerancia, piso):
+                regressoes.append(f"{nome}: {campo} {b[campo]:.4g} → {r[campo]:.4g} "
+                                  f"(+{100 * (r[campo] / b[campo] - 1):.0f}%)")
+    return regressoes
+
+
+# -------------------------------------------------------------
+# Linha de comando
+# -------------------------------------------------------------
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.benchmark_buscas",
+                                     description="Benchmark de busca_a_estrela e heurísticas.")
+    parser.add_argument("--saida", default="benchmark.json", help="arquivo JSON de resultados")
+    parser.add_argument("--comparar", metavar="BASE", help="JSON de uma execução anterior")
+    parser.add_argument("--heuristicas", nargs="+", default=sorted(HEURISTICAS),
+                        choices=sorted(HEURISTICAS))
+    parser.add_argument("--modos", nargs="+", default=["unidirecional"], choices=MODOS_BUSCA)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--tolerancia", type=float, default=0.25,
+                        help="aumento relativo de tempo/memória aceito na comparação")
+    parser.add_argument("--rapido", action="store_true", help="só os tabuleiros pequenos")
+    args = parser.parse_args(argv)
+
+    resultados = []
+    for registro in executar_benchmark(cenarios_padrao(args.rapido), args.heuristicas,
+                                       tuple(args.modos), args.repeticoes):
+        resultados.append(registro)
+        print(f"{registro['cenario']:<28} {registro['heuristica']:<10} {registro['modo']:<14} "
+              f"{registro['tempo_s'] * 1000:9.2f} ms  {registro['expandidos']:7d} exp  "
+              f"{registro['empilhados']:7d} emp  {registro['memoria_pico_kb']:9.1f} KB")
+
+    with open(args.saida, "w", encoding="utf-8") as f:
+        json.dump({"versao": VERSAO_FORMATO, "python": platform.python_version(),
+                   "resultados": resultados}, f, ensure_ascii=False, indent=1)
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            base = json.load(f)["resultados"]
+        regressoes = comparar(resultados, base, args.tolerancia, args.tolerancia)
+        for linha in regressoes:
+            print(f"[✖] {linha}")
+        if regressoes:
+            return 1
+        print("[✔] Nenhuma regressão em relação à linha de base.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
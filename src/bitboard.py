@@ -0,0 +1,134 @@
+# =============================================================
+#  bitboard.py — Tabuleiros pequenos (até 64 casas) como bits
+# =============================================================
+
+from __future__ import annotations
+from array import array
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+from src.tabuleiro import Tabuleiro, Coordenada, MOVIMENTOS_CAVALO, TERRENOS_POR_CODIGO, INFINITO
+
+# o bit i representa a casa de id i (linha * colunas + coluna)
+MAX_CASAS_BITBOARD = 64
+
+
+def cabe_em_bitboard(linhas: int, colunas: int) -> bool:
+    """True se o tabuleiro cabe num inteiro de 64 bits (o 8x8 clássico cabe)."""
+    return linhas * colunas <= MAX_CASAS_BITBOARD
+
+
+# -------------------------------------------------------------
+# Saltos do cavalo por deslocamento de bits
+# -------------------------------------------------------------
+@lru_cache(maxsize=64)
+def _deslocamentos(linhas: int, colunas: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Para cada salto (dl, dc): (deslocamento em bits, máscara das casas de
+    origem cujo salto cai dentro do tabuleiro).
+    """
+    if not cabe_em_bitboard(linhas, colunas):
+        raise ValueError(f"Tabuleiro {linhas}x{colunas} não cabe em {MAX_CASAS_BITBOARD} bits")
+    resultado = []
+    for dl, dc in MOVIMENTOS_CAVALO:
+        mascara = 0
+        for l in range(max(0, -dl), min(linhas, linhas - dl)):
+            for c in range(max(0, -dc), min(colunas, colunas - dc)):
+                mascara |= 1 << (l * colunas + c)
+        resultado.append((dl * colunas + dc, mascara))
+    return tuple(resultado)
+
+
+def saltos(conjunto: int, linhas: int = 8, colunas: int = 8) -> int:
+    """Todas as casas atingidas por um salto a partir de qualquer casa do conjunto."""
+    destino = 0
+    for desloc, mascara in _deslocamentos(linhas, colunas):
+        origem = conjunto & mascara
+        destino |= origem << desloc if desloc > 0 else origem >> -desloc
+    return destino
+
+
+@lru_cache(maxsize=64)
+def ataques_cavalo(linhas: int = 8, colunas: int = 8) -> Tuple[int, ...]:
+    """Tabela casa → bitboard dos saltos a partir dela."""
+    return tuple(saltos(1 << casa, linhas, colunas) for casa in range(linhas * colunas))
+
+
+def casas_do_conjunto(conjunto: int) -> List[int]:
+    """Ids das casas com bit ligado, em ordem crescente."""
+    casas = []
+    while conjunto:
+        menor = conjunto & -conjunto
+        casas.append(menor.bit_length() - 1)
+        conjunto ^= menor
+    return casas
+
+
+# -------------------------------------------------------------
+# Tabuleiro em bits
+# -------------------------------------------------------------
+class Bitboards:
+    """
+    Um inteiro por classe de terreno (por_codigo) e um com as casas
+    intransponíveis (barreiras, segundo a tabela de custos do tabuleiro).
+    Obtenha com bitboards(tabuleiro), que guarda o resultado no tabuleiro.
+    """
+    __slots__ = ("linhas", "colunas", "por_codigo", "barreiras", "livres")
+
+    def __init__(self, tabuleiro: Tabuleiro):
+        self.linhas, self.colunas = tabuleiro.linhas, tabuleiro.colunas
+        _deslocamentos(self.linhas, self.colunas)  # valida o tamanho
+        codigos = np.frombuffer(tabuleiro.celulas, dtype=np.uint8)
+        self.por_codigo = tuple(
+            int.from_bytes(np.packbits(codigos == k, bitorder="little").tobytes(), "little")
+            for k in range(len(TERRENOS_POR_CODIGO)))
+        tabela = tabuleiro.tabela_custos()
+        self.barreiras = 0
+        for k, conjunto in enumerate(self.por_codigo):
+            if tabela[k] == INFINITO:
+                self.barreiras |= conjunto
+        self.livres = ((1 << (self.linhas * self.colunas)) - 1) & ~self.barreiras
+
+    def saltos(self, conjunto: int) -> int:
+        """Saltos a partir do conjunto, sem as barreiras."""
+        return saltos(conjunto, self.linhas, self.colunas) & self.livres
+
+    def alcancavel(self, inicio: Coordenada, objetivo: Coordenada) -> bool:
+        """BFS bit a bit: o cavalo chega ao objetivo desviando das barreiras?"""
+        alvo = 1 << (objetivo[0] * self.colunas + objetivo[1])
+        fronteira = visitados = 1 << (inicio[0] * self.colunas + inicio[1])
+        if fronteira == alvo:
+            return True
+        while fronteira:
+            fronteira = self.saltos(fronteira) & ~visitados
+            if fronteira & alvo:
+                return True
+            visitados |= fronteira
+        return False
+
+    def distancias(self, raiz: Coordenada) -> array:
+        """
+        Saltos mínimos entre cada casa e `raiz` desviando das barreiras
+        (-1 = inalcançável), no mesmo formato de movimentos_com_barreiras:
+        barreiras recebem distância mas não propagam; a raiz sempre propaga.
+        """
+        dist = array("i", [-1]) * (self.linhas * self.colunas)
+        raiz_bit = 1 << (raiz[0] * self.colunas + raiz[1])
+        dist[raiz[0] * self.colunas + raiz[1]] = 0
+        fronteira = visitados = raiz_bit
+        nivel = 0
+        while fronteira:
+            nivel += 1
+            camada = saltos(fronteira, self.linhas, self.colunas) & ~visitados
+            visitados |= camada
+            for casa in casas_do_conjunto(camada):
+                dist[casa] = nivel
+            fronteira = camada & self.livres
+        return dist
+
+
+def bitboards(tabuleiro: Tabuleiro) -> Bitboards:
+    """Bitboards do tabuleiro, guardados nele até a próxima alteração."""
+    return tabuleiro.derivado("bitboards", lambda: Bitboards(tabuleiro))
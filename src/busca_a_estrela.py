@@ -5,23 +5,14 @@
 from __future__ import annotations
 import heapq
 import math
-from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional
+import time
+from array import array
+from typing import Callable, Dict, List, Tuple, Optional
 from collections import deque
-from src.tabuleiro import Tabuleiro, Coordenada
-from src.cavalo import Cavalo
-
-
-# -------------------------------------------------------------
-# Estrutura de um nó na busca
-# -------------------------------------------------------------
-@dataclass(order=True)
-class No:
-    f: float
-    posicao: Coordenada = field(compare=False)
-    g: float = field(compare=False)
-    h: float = field(compare=False)
-    pai: Optional[Coordenada] = field(compare=False, default=None)
+from src.tabuleiro import Tabuleiro, Coordenada, INFINITO
+from src.distancias_cavalo import movimentos_cavalo_vazio, movimentos_com_barreiras
+from src.marcos_alt import marcos_alt
+from src.filas_prioridade import criar_fila
 
 
 # =============================================================
@@ -83,7 +74,6 @@ def heuristica_h2(atual, objetivo, tabuleiro):
     movimentos = movimentos_minimos_cavalo(x1, y1, x2, y2)
 
     # custo médio dos terrenos transitáveis (ignorando bloqueios)
-    custos_validos = [c for linha in tabuleiro.grade for c in linha if not isinstance(c, str)]
     custo_medio = tabuleiro.menor_custo_transponivel() * 1.5  # ajuste moderado
 
     return movimentos * custo_medio
@@ -104,59 +94,429 @@ def heuristica_nula(atual, objetivo, tabuleiro):
     return 0.0
 
 
+# -------------------------------------------------------------
+# Heurística Exata — saltos reais no tabuleiro vazio
+# -------------------------------------------------------------
+def heuristica_exata(atual, objetivo, tabuleiro):
+    """
+    Heurística Exata (tabuleiro vazio)
+    Número exato de saltos do cavalo até o objetivo num tabuleiro vazio do
+    mesmo tamanho (tabela pré-computada, considera bordas e cantos)
+    multiplicado pelo custo mínimo de terreno.
+
+    - Admissível: sim, nenhum caminho real usa menos saltos.
+    - Mais informativa que H1; corrige a fórmula de H2 perto das bordas.
+    """
+    dist = movimentos_cavalo_vazio(tabuleiro.linhas, tabuleiro.colunas, tuple(objetivo))
+    movimentos = dist[tabuleiro.id_casa(atual)]
+    return movimentos * tabuleiro.menor_custo_transponivel() if movimentos >= 0 else INFINITO
+
+
+# -------------------------------------------------------------
+# Heurística com Barreiras — BFS sobre o tabuleiro real
+# -------------------------------------------------------------
+def heuristica_barreiras(atual, objetivo, tabuleiro):
+    """
+    Heurística com Barreiras
+    Saltos mínimos até o objetivo desviando das barreiras reais (um BFS a
+    partir do objetivo, feito uma vez e guardado no tabuleiro) multiplicados
+    pelo custo mínimo de terreno.
+
+    - Admissível: sim, ignora apenas a diferença de custo entre terrenos.
+    - Bem mais informativa que H2 em tabuleiros com muitas barreiras; casas
+      sem caminho recebem inf.
+    """
+    dist = movimentos_com_barreiras(tabuleiro, tuple(objetivo))
+    movimentos = dist[tabuleiro.id_casa(atual)]
+    return movimentos * tabuleiro.menor_custo_transponivel() if movimentos >= 0 else INFINITO
+
+
+# -------------------------------------------------------------
+# Heurística ALT — marcos + desigualdade triangular
+# -------------------------------------------------------------
+def heuristica_alt(atual, objetivo, tabuleiro):
+    """
+    Heurística ALT (landmarks)
+    Usa as distâncias exatas de/para K marcos (pré-computadas uma vez e
+    guardadas no tabuleiro) e o maior limite da desigualdade triangular.
+
+    - Admissível e consistente: os limites vêm de custos reais do tabuleiro.
+    - Considera lama e barreiras; a pré-computação só se paga com consultas repetidas.
+    """
+    h = marcos_alt(tabuleiro).heuristica(tuple(objetivo))
+    return h(tabuleiro.id_casa(atual))
+
+
+HEURISTICAS = {
+    "h1": heuristica_h1,
+    "h2": heuristica_h2,
+    "nula": heuristica_nula,
+    "exata": heuristica_exata,
+    "barreiras": heuristica_barreiras,
+    "alt": heuristica_alt,
+}
+
+
+def preparar_heuristica(tipo_heuristica: str,
+                        tabuleiro: Tabuleiro,
+                        objetivo: Coordenada,
+                        reverso: bool = False) -> Callable[[int], float]:
+    """
+    Prepara a heurística para uma busca rumo a `objetivo` e a devolve como
+    função do id da casa. Tabelas e BFS são calculados aqui, uma vez por
+    busca, e não a cada avaliação. Com reverso=True a estimativa é do custo
+    de `objetivo` até a casa (busca de volta do modo bidirecional); só muda
+    algo para heurísticas direcionais, como a ALT.
+    """
+    colunas = tabuleiro.colunas
+    if tipo_heuristica == "alt":
+        return marcos_alt(tabuleiro).heuristica(tuple(objetivo), reverso)
+    if tipo_heuristica in ("exata", "barreiras"):
+        if tipo_heuristica == "exata":
+            dist = movimentos_cavalo_vazio(tabuleiro.linhas, colunas, tuple(objetivo))
+        else:
+            dist = movimentos_com_barreiras(tabuleiro, tuple(objetivo))
+        menor = tabuleiro.menor_custo_transponivel()
+        return lambda casa: dist[casa] * menor if dist[casa] >= 0 else INFINITO
+    if tipo_heuristica == "nula":
+        return lambda casa: 0.0
+    func = HEURISTICAS.get(tipo_heuristica, heuristica_h1)
+    return lambda casa: func(divmod(casa, colunas), objetivo, tabuleiro)
+
+MODOS_BUSCA = ("unidirecional", "bidirecional")
+
+
+# -------------------------------------------------------------
+# Observadores da busca (instrumentação opcional)
+# -------------------------------------------------------------
+class ObservadorBusca:
+    """
+    Ganchos chamados pela busca; todos vazios por padrão, basta sobrescrever
+    os de interesse. Sem observador a busca não faz nenhuma dessas chamadas.
+    As posições chegam como (linha, coluna).
+    """
+
+    def ao_iniciar(self, inicio: Coordenada, objetivo: Coordenada) -> None:
+        pass
+
+    def ao_empilhar(self, pos: Coordenada, g: float, f: float) -> None:
+        pass
+
+    def ao_desempilhar(self, pos: Coordenada, g: float) -> None:
+        pass
+
+    def ao_expandir(self, pos: Coordenada, g: float) -> None:
+        pass
+
+    def ao_objetivo(self, caminho: List[Coordenada], custo: float) -> None:
+        pass
+
+    def ao_concluir(self, caminho: List[Coordenada], custo: float) -> None:
+        pass
+
+
+class ColetorExplorados(ObservadorBusca):
+    """Guarda as casas expandidas e as inseridas na fila, em ordem (animações)."""
+
+    def __init__(self, explorados: Optional[List[Coordenada]] = None,
+                 fronteira: Optional[List[Coordenada]] = None):
+        self.explorados = explorados if explorados is not None else []
+        self.fronteira = fronteira if fronteira is not None else []
+
+    def ao_empilhar(self, pos, g, f):
+        self.fronteira.append(pos)
+
+    def ao_expandir(self, pos, g):
+        self.explorados.append(pos)
+
+
+class MedidorBusca(ObservadorBusca):
+    """Contadores de eventos e tempo de parede da última busca observada."""
+
+    def __init__(self):
+        self.empilhados = self.desempilhados = self.expandidos = 0
+        self.tempo_s = 0.0
+        self._t0 = 0.0
+
+    def ao_iniciar(self, inicio, objetivo):
+        self.empilhados = self.desempilhados = self.expandidos = 0
+        self._t0 = time.perf_counter()
+
+    def ao_empilhar(self, pos, g, f):
+        self.empilhados += 1
+
+    def ao_desempilhar(self, pos, g):
+        self.desempilhados += 1
+
+    def ao_expandir(self, pos, g):
+        self.expandidos += 1
+
+    def ao_concluir(self, caminho, custo):
+        self.tempo_s = time.perf_counter() - self._t0
+
+    def como_dict(self) -> Dict[str, float]:
+        return {"empilhados": self.empilhados, "desempilhados": self.desempilhados,
+                "expandidos": self.expandidos, "tempo_s": self.tempo_s}
+
+
+class ObservadoresMultiplos(ObservadorBusca):
+    """Repassa cada evento a vários observadores, na ordem dada."""
+
+    def __init__(self, *observadores: ObservadorBusca):
+        self.observadores = observadores
+
+    def ao_iniciar(self, inicio, objetivo):
+        for o in self.observadores:
+            o.ao_iniciar(inicio, objetivo)
+
+    def ao_empilhar(self, pos, g, f):
+        for o in self.observadores:
+            o.ao_empilhar(pos, g, f)
+
+    def ao_desempilhar(self, pos, g):
+        for o in self.observadores:
+            o.ao_desempilhar(pos, g)
+
+    def ao_expandir(self, pos, g):
+        for o in self.observadores:
+            o.ao_expandir(pos, g)
+
+    def ao_objetivo(self, caminho, custo):
+        for o in self.observadores:
+            o.ao_objetivo(caminho, custo)
+
+    def ao_concluir(self, caminho, custo):
+        for o in self.observadores:
+            o.ao_concluir(caminho, custo)
+
+
+def _juntar_observadores(observador: Optional[ObservadorBusca],
+                         explorados: Optional[List[Coordenada]]) -> Optional[ObservadorBusca]:
+    """O parâmetro `explorados` é só um atalho para um ColetorExplorados."""
+    if explorados is None:
+        return observador
+    coletor = ColetorExplorados(explorados)
+    return coletor if observador is None else ObservadoresMultiplos(observador, coletor)
+
+
 # -------------------------------------------------------------
 # Algoritmo A* com escolha de heurística
 # -------------------------------------------------------------
 def busca_a_estrela(tabuleiro: Tabuleiro,
                     inicio: Coordenada,
                     objetivo: Coordenada,
-                    tipo_heuristica: str = "h1") -> Tuple[List[Coordenada], float]:
+                    tipo_heuristica: str = "h1",
+                    modo: str = "unidirecional",
+                    estatisticas: Optional[dict] = None,
+                    explorados: Optional[List[Coordenada]] = None,
+                    observador: Optional[ObservadorBusca] = None,
+                    fila: str = "auto",
+                    desempate: str = "nenhum") -> Tuple[List[Coordenada], float]:
     """
     Executa o algoritmo A* no tabuleiro com a heurística selecionada.
-    Parâmetro tipo_heuristica pode ser: "h1", "h2" ou "nula".
+    Este é o único laço de A* do projeto: a interface gráfica, o cache e os
+    relatórios usam esta função.
+    Parâmetro tipo_heuristica pode ser: "h1", "h2", "nula", "exata", "barreiras" ou "alt".
+    Parâmetro modo pode ser: "unidirecional" ou "bidirecional".
+    Se `estatisticas` for um dicionário, recebe o número de nós expandidos
+    ("expandidos" e, no modo bidirecional, "expandidos_ida"/"expandidos_volta")
+    e de inserções na fila de prioridade ("empilhados").
+    Se `explorados` for uma lista, recebe as casas na ordem em que foram expandidas.
+    Se `observador` (ObservadorBusca) for dado, recebe os eventos de
+    empilhar/desempilhar/expandir/objetivo; sem ele nenhum evento é gerado.
+    `fila` escolhe a lista aberta ("auto", "binaria", "baldes" ou "radix", ver
+    filas_prioridade) e `desempate` a ordem entre f iguais ("maior_g",
+    "menor_g" ou "nenhum"); o modo bidirecional usa sempre o heap binário.
     Retorna (caminho, custo_total).
     """
-    heuristicas = {
-        "h1": heuristica_h1,
-        "h2": heuristica_h2,
-        "nula": heuristica_nula
-    }
-    func_heuristica = heuristicas.get(tipo_heuristica, heuristica_h1)
-
-    fila_aberta: List[No] = []
-    heapq.heappush(fila_aberta, No(0, inicio, 0, 0, None))
-
-    custo_g: Dict[Coordenada, float] = {inicio: 0}
-    pais: Dict[Coordenada, Optional[Coordenada]] = {inicio: None}
-    visitados: set[Coordenada] = set()
+    if modo == "bidirecional":
+        return busca_bidirecional(tabuleiro, inicio, objetivo, tipo_heuristica,
+                                  estatisticas, explorados, observador)
+    if modo != "unidirecional":
+        raise ValueError(f"Modo de busca desconhecido: {modo!r} (use {MODOS_BUSCA})")
+    obs = _juntar_observadores(observador, explorados)
+
+    func_heuristica = preparar_heuristica(tipo_heuristica, tabuleiro, objetivo)
+    fila_aberta = criar_fila(fila, tabuleiro, tipo_heuristica, desempate)
+
+    # vizinhança pré-computada do tabuleiro (ids planos + custo de entrada)
+    colunas = tabuleiro.colunas
+    indice = tabuleiro.indice_cavalo()
+    inicios, alvos, custos_entrada = indice.inicios, indice.alvos, indice.custos
+    id_objetivo = tabuleiro.id_casa(objetivo)
+    id_inicio = tabuleiro.id_casa(inicio)
+
+    # g, pai e fechado em vetores planos indexados pelo id da casa
+    n = tabuleiro.linhas * colunas
+    custo_g = array("d", [INFINITO]) * n
+    pais = array("i", [-1]) * n
+    visitados = bytearray(n)
+    custo_g[id_inicio] = 0.0
+
+    inserir, remover = fila_aberta.inserir, fila_aberta.remover
+    inserir(0.0, 0.0, id_inicio)
+    empilhados, expandidos = 1, 0
+    if obs is not None:
+        obs.ao_iniciar(inicio, objetivo)
+        obs.ao_empilhar(inicio, 0.0, 0.0)
 
     while fila_aberta:
-        atual = heapq.heappop(fila_aberta)
-        pos = atual.posicao
+        casa = remover()
+        g_atual = custo_g[casa]
+        if obs is not None:
+            obs.ao_desempilhar(divmod(casa, colunas), g_atual)
+        if visitados[casa]:
+            continue
+        if obs is not None:
+            obs.ao_expandir(divmod(casa, colunas), g_atual)
 
         # chegou ao objetivo
-        if pos == objetivo:
-            caminho = reconstruir_caminho(pais, pos)
-            return caminho, atual.g
+        if casa == id_objetivo:
+            if estatisticas is not None:
+                estatisticas["expandidos"] = expandidos
+                estatisticas["empilhados"] = empilhados
+            caminho = [divmod(c, colunas) for c in reconstruir_ids_vetor(pais, casa)]
+            if obs is not None:
+                obs.ao_objetivo(caminho, g_atual)
+                obs.ao_concluir(caminho, g_atual)
+            return caminho, g_atual
+
+        visitados[casa] = 1
+        expandidos += 1
+
+        for k in range(inicios[casa], inicios[casa + 1]):
+            novo_custo = g_atual + custos_entrada[k]  # barreira → inf, nunca melhora
+            viz = alvos[k]
+            if novo_custo < custo_g[viz]:
+                custo_g[viz] = novo_custo
+                pais[viz] = casa
+                f = novo_custo + func_heuristica(viz)
+                if f < INFINITO:  # h infinito: o objetivo é inalcançável dali
+                    inserir(f, novo_custo, viz)
+                    empilhados += 1
+                    if obs is not None:
+                        obs.ao_empilhar(divmod(viz, colunas), novo_custo, f)
+
+    if estatisticas is not None:
+        estatisticas["expandidos"] = expandidos
+        estatisticas["empilhados"] = empilhados
+    if obs is not None:
+        obs.ao_concluir([], INFINITO)
+    return [], float("inf")
 
-        if pos in visitados:
-            continue
-        visitados.add(pos)
 
-        cavalo = Cavalo(pos)
-        for viz in cavalo.movimentos_possiveis(tabuleiro):
-            if tabuleiro.bloqueado(viz):
+# -------------------------------------------------------------
+# A* bidirecional (encontro no meio)
+# -------------------------------------------------------------
+def busca_bidirecional(tabuleiro: Tabuleiro,
+                       inicio: Coordenada,
+                       objetivo: Coordenada,
+                       tipo_heuristica: str = "h1",
+                       estatisticas: Optional[dict] = None,
+                       explorados: Optional[List[Coordenada]] = None,
+                       observador: Optional[ObservadorBusca] = None) -> Tuple[List[Coordenada], float]:
+    """
+    A* bidirecional: uma busca parte do início e outra, reversa, do objetivo.
+
+    Como os saltos do cavalo são simétricos e o custo é cobrado ao ENTRAR na
+    casa, a aresta reversa v → u custa custo(v). A cada relaxamento atualiza-se
+    mu = melhor g_ida(x) + g_volta(x) já visto; a busca para quando o menor f
+    de uma das filas atinge mu (com a heurística nula, também quando a soma
+    dos topos atinge mu). Com heurísticas consistentes o custo é ótimo.
+    Retorna (caminho, custo_total), como busca_a_estrela.
+    """
+    heuristica_zero = tipo_heuristica == "nula"
+    obs = _juntar_observadores(observador, explorados)
+
+    colunas = tabuleiro.colunas
+    indice = tabuleiro.indice_cavalo()
+    inicios, alvos, custos_entrada = indice.inicios, indice.alvos, indice.custos
+    tabela, celulas = indice.tabela, tabuleiro.celulas
+    id_inicio = tabuleiro.id_casa(inicio)
+    id_objetivo = tabuleiro.id_casa(objetivo)
+
+    # [0] = ida (início → objetivo), [1] = volta (objetivo → início)
+    heuristicas = (preparar_heuristica(tipo_heuristica, tabuleiro, objetivo),
+                   preparar_heuristica(tipo_heuristica, tabuleiro, inicio, reverso=True))
+    g = ({id_inicio: 0.0}, {id_objetivo: 0.0})
+    pais: Tuple[Dict[int, Optional[int]], ...] = ({id_inicio: None}, {id_objetivo: None})
+    fechados: Tuple[set, set] = (set(), set())
+    filas: Tuple[list, list] = ([(0.0, 0.0, id_inicio)], [(0.0, 0.0, id_objetivo)])
+
+    empilhados = 2
+    if obs is not None:
+        obs.ao_iniciar(inicio, objetivo)
+        obs.ao_empilhar(inicio, 0.0, 0.0)
+        obs.ao_empilhar(objetivo, 0.0, 0.0)
+    melhor_custo = 0.0 if id_inicio == id_objetivo else INFINITO
+    encontro = id_inicio if id_inicio == id_objetivo else None
+
+    while filas[0] and filas[1]:
+        topo_ida, topo_volta = filas[0][0][0], filas[1][0][0]
+        if max(topo_ida, topo_volta) >= melhor_custo:
+            break
+        if heuristica_zero and topo_ida + topo_volta >= melhor_custo:
+            break
+
+        # expande o lado com a fronteira menor
+        lado = 0 if len(filas[0]) <= len(filas[1]) else 1
+        fila, g_lado, g_outro = filas[lado], g[lado], g[1 - lado]
+        _, g_atual, casa = heapq.heappop(fila)
+        if obs is not None:
+            obs.ao_desempilhar(divmod(casa, colunas), g_atual)
+        if casa in fechados[lado] or g_atual > g_lado[casa]:
+            continue
+        fechados[lado].add(casa)
+        if obs is not None:
+            obs.ao_expandir(divmod(casa, colunas), g_atual)
+
+        if lado == 0:
+            vizinhos = ((alvos[k], custos_entrada[k]) for k in range(inicios[casa], inicios[casa + 1]))
+        else:
+            # volta: predecessores u de `casa`; entrar em `casa` custa o mesmo para todos.
+            # Uma barreira só pode anteceder `casa` se for o próprio início.
+            custo_casa = tabela[celulas[casa]]
+            if custo_casa == INFINITO:
                 continue
-
-            novo_custo = atual.g + tabuleiro.custo(viz)
-            if viz not in custo_g or novo_custo < custo_g[viz]:
-                custo_g[viz] = novo_custo
-                h = func_heuristica(viz, objetivo, tabuleiro)
-                f = novo_custo + h
-                heapq.heappush(fila_aberta, No(f, viz, novo_custo, h, pos))
-                pais[viz] = pos
-
-    return [], float("inf")
+            vizinhos = ((u, custo_casa) for u in alvos[inicios[casa]:inicios[casa + 1]]
+                        if u == id_inicio or tabela[celulas[u]] != INFINITO)
+
+        for viz, custo in vizinhos:
+            novo_g = g_atual + custo
+            if novo_g < g_lado.get(viz, INFINITO):
+                g_lado[viz] = novo_g
+                pais[lado][viz] = casa
+                h = heuristicas[lado](viz)
+                heapq.heappush(fila, (novo_g + h, novo_g, viz))
+                empilhados += 1
+                if obs is not None:
+                    obs.ao_empilhar(divmod(viz, colunas), novo_g, novo_g + h)
+                if viz in g_outro and novo_g + g_outro[viz] < melhor_custo:
+                    melhor_custo = novo_g + g_outro[viz]
+                    encontro = viz
+
+    if estatisticas is not None:
+        estatisticas["expandidos_ida"] = len(fechados[0])
+        estatisticas["expandidos_volta"] = len(fechados[1])
+        estatisticas["expandidos"] = len(fechados[0]) + len(fechados[1])
+        estatisticas["empilhados"] = empilhados
+
+    if encontro is None:
+        if obs is not None:
+            obs.ao_concluir([], INFINITO)
+        return [], float("inf")
+
+    # início → encontro pelos pais da ida; encontro → objetivo pelos "pais" da volta
+    ids = reconstruir_ids(pais[0], encontro)
+    atual = pais[1].get(encontro)
+    while atual is not None:
+        ids.append(atual)
+        atual = pais[1].get(atual)
+    caminho = [divmod(c, colunas) for c in ids]
+    if obs is not None:
+        obs.ao_objetivo(caminho, melhor_custo)
+        obs.ao_concluir(caminho, melhor_custo)
+    return caminho, melhor_custo
 
 
 # -------------------------------------------------------------
@@ -172,3 +532,25 @@ def reconstruir_caminho(pais: Dict[Coordenada, Optional[Coordenada]],
         atual = pais.get(atual)
     caminho.reverse()
     return caminho
+
+
+def reconstruir_ids(pais: Dict[int, Optional[int]], destino: int) -> List[int]:
+    """Mesma reconstrução, sobre ids planos de casas (ver Tabuleiro.id_casa)."""
+    caminho: List[int] = []
+    atual: Optional[int] = destino
+    while atual is not None:
+        caminho.append(atual)
+        atual = pais.get(atual)
+    caminho.reverse()
+    return caminho
+
+
+def reconstruir_ids_vetor(pais: array, destino: int) -> List[int]:
+    """Mesma reconstrução, com os pais num vetor plano (-1 = sem pai)."""
+    caminho: List[int] = []
+    atual = destino
+    while atual >= 0:
+        caminho.append(atual)
+        atual = pais[atual]
+    caminho.reverse()
+    return caminho
@@ -0,0 +1,144 @@
+# =============================================================
+#  cache_buscas.py — Cache LRU de resultados do A*
+# =============================================================
+
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from src.tabuleiro import (Tabuleiro, Coordenada, SIMETRIA_INVERSA,
+                           aplicar_simetria, dimensoes_simetria)
+from src.busca_a_estrela import busca_a_estrela, ColetorExplorados
+
+Resultado = Tuple[List[Coordenada], float, List[Coordenada]]  # (caminho, custo, explorados)
+
+# heurísticas admissíveis: o custo não depende da orientação do tabuleiro, então
+# o resultado de um tabuleiro girado ou espelhado serve. h1 e h2 não são (o custo
+# pode mudar com a orientação) e só reaproveitam a mesma orientação.
+HEURISTICAS_OTIMAS = frozenset({"nula", "exata", "barreiras", "alt"})
+
+
+class CacheBuscas:
+    """
+    Cache LRU limitado de (caminho, custo, explorados).
+
+    A chave é (impressão Zobrist, dimensões, início, objetivo, heurística, modo,
+    tabela de custos). Para as HEURISTICAS_OTIMAS a chave fica na orientação
+    canônica: entre as 8 simetrias do tabuleiro usa-se a de menor impressão.
+    Assim, um tabuleiro girado ou espelhado reaproveita o resultado, que é
+    devolvido já na orientação de quem perguntou, com o mesmo custo de uma
+    busca direta; o caminho pode ser outro de mesmo custo e `explorados` é a
+    ordem de expansão da busca original levada para essa orientação (a de
+    uma busca direta pode ser outra). As demais heurísticas usam a orientação
+    de quem perguntou e devolvem exatamente o que busca_a_estrela daria.
+    """
+
+    def __init__(self, capacidade: int = 256):
+        if capacidade <= 0:
+            raise ValueError("A capacidade do cache deve ser positiva")
+        self.capacidade = capacidade
+        self._entradas: "OrderedDict[tuple, Resultado]" = OrderedDict()
+        # buscas em segundo plano (linha_do_tempo) guardam de outra thread
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.faltas = 0
+        self.remocoes = 0
+
+    # ---------- Chaves canônicas ----------
+    @staticmethod
+    def _chave(tabuleiro: Tabuleiro, s: int, impressao: int, inicio: Coordenada,
+               objetivo: Coordenada, tipo_heuristica: str, modo: str) -> tuple:
+        linhas, colunas = tabuleiro.linhas, tabuleiro.colunas
+        return (impressao, dimensoes_simetria(s, linhas, colunas),
+                aplicar_simetria(s, tuple(inicio), linhas, colunas),
+                aplicar_simetria(s, tuple(objetivo), linhas, colunas),
+                tipo_heuristica, modo, tabuleiro.tabela_custos())
+
+    @staticmethod
+    def _transformar(s: int, posicoes: List[Coordenada], linhas: int, colunas: int) -> List[Coordenada]:
+        return [aplicar_simetria(s, p, linhas, colunas) for p in posicoes]
+
+    # ---------- Consulta ----------
+    @staticmethod
+    def _orientacoes(tabuleiro: Tabuleiro, tipo_heuristica: str) -> Tuple[int, List[int]]:
+        impressoes = tabuleiro.impressoes_simetricas()
+        if tipo_heuristica not in HEURISTICAS_OTIMAS:
+            return impressoes[0], [0]  # só a orientação de quem perguntou
+        canonica = min(impressoes)
+        return canonica, [s for s, imp in enumerate(impressoes) if imp == canonica]
+
+    def consultar(self, tabuleiro: Tabuleiro, inicio: Coordenada, objetivo: Coordenada,
+                  tipo_heuristica: str = "h1", modo: str = "unidirecional") -> Optional[Resultado]:
+        """Resultado guardado para a consulta (na orientação pedida) ou None; conta acertos e faltas."""
+        canonica, orientacoes = self._orientacoes(tabuleiro, tipo_heuristica)
+        # tabuleiros simétricos têm mais de uma orientação canônica: tenta todas
+        for s in orientacoes:
+            chave = self._chave(tabuleiro, s, canonica, inicio, objetivo, tipo_heuristica, modo)
+            with self._trava:
+                resultado = self._entradas.get(chave)
+                if resultado is not None:
+                    self._entradas.move_to_end(chave)
+                    self.acertos += 1
+            if resultado is not None:
+                # volta da orientação canônica para a de quem perguntou
+                linhas, colunas = dimensoes_simetria(s, tabuleiro.linhas, tabuleiro.colunas)
+                inversa = SIMETRIA_INVERSA[s]
+                caminho, custo, explorados = resultado
+                return (self._transformar(inversa, caminho, linhas, colunas), custo,
+                        self._transformar(inversa, explorados, linhas, colunas))
+        with self._trava:
+            self.faltas += 1
+        return None
+
+    def guardar(self, tabuleiro: Tabuleiro, inicio: Coordenada, objetivo: Coordenada,
+                tipo_heuristica: str, modo: str, resultado: Resultado) -> None:
+        """Guarda (caminho, custo, explorados) calculados fora do cache."""
+        canonica, orientacoes = self._orientacoes(tabuleiro, tipo_heuristica)
+        s = orientacoes[0]
+        chave = self._chave(tabuleiro, s, canonica, inicio, objetivo, tipo_heuristica, modo)
+        linhas, colunas = tabuleiro.linhas, tabuleiro.colunas
+        caminho, custo, explorados = resultado
+        entrada = (self._transformar(s, caminho, linhas, colunas), custo,
+                   self._transformar(s, explorados, linhas, colunas))
+        with self._trava:
+            self._entradas[chave] = entrada
+            if len(self._entradas) > self.capacidade:
+                self._entradas.popitem(last=False)
+                self.remocoes += 1
+
+    def buscar(self, tabuleiro: Tabuleiro, inicio: Coordenada, objetivo: Coordenada,
+               tipo_heuristica: str = "h1", modo: str = "unidirecional") -> Resultado:
+        """Mesmo contrato de busca_a_estrela, mais a lista de casas expandidas."""
+        resultado = self.consultar(tabuleiro, inicio, objetivo, tipo_heuristica, modo)
+        if resultado is not None:
+            return resultado
+        coletor = ColetorExplorados()
+        caminho, custo = busca_a_estrela(tabuleiro, inicio, objetivo, tipo_heuristica,
+                                         modo=modo, observador=coletor)
+        self.guardar(tabuleiro, inicio, objetivo, tipo_heuristica, modo,
+                     (caminho, custo, coletor.explorados))
+        return list(caminho), custo, list(coletor.explorados)
+
+    # ---------- Manutenção ----------
+    def estatisticas(self) -> Dict[str, int]:
+        """Contadores de acertos, faltas e remoções por LRU."""
+        return {"acertos": self.acertos, "faltas": self.faltas,
+                "remocoes": self.remocoes, "entradas": len(self._entradas),
+                "capacidade": self.capacidade}
+
+    def limpar(self) -> None:
+        """Esvazia o cache e zera os contadores."""
+        with self._trava:
+            self._entradas.clear()
+            self.acertos = self.faltas = self.remocoes = 0
+
+
+# cache compartilhado pelo processo (interface gráfica, lotes)
+CACHE_PADRAO = CacheBuscas()
+
+
+def busca_com_cache(tabuleiro: Tabuleiro, inicio: Coordenada, objetivo: Coordenada,
+                    tipo_heuristica: str = "h1", modo: str = "unidirecional") -> Resultado:
+    """busca_a_estrela com o cache compartilhado; retorna (caminho, custo, explorados)."""
+    return CACHE_PADRAO.buscar(tabuleiro, inicio, objetivo, tipo_heuristica, modo)
@@ -0,0 +1,152 @@
+# =============================================================
+#  campo_distancias.py — Campo de custos até um objetivo fixo
+# =============================================================
+
+from __future__ import annotations
+import heapq
+from array import array
+from typing import List, Optional, Tuple
+
+from src.tabuleiro import Tabuleiro, Coordenada, INFINITO
+
+
+# -------------------------------------------------------------
+# Dijkstra sobre o grafo do cavalo (ids planos)
+# -------------------------------------------------------------
+def dijkstra_reverso(tabuleiro: Tabuleiro, objetivo: Coordenada) -> Tuple[array, array]:
+    """
+    Dijkstra a partir do objetivo sobre as arestas invertidas.
+
+    Retorna (custo_ate_objetivo, sucessor), ambos indexados pelo id da casa.
+    Entrar em v custa custo(v), então a aresta reversa v → u custa custo(v).
+    Barreiras recebem custo (podem ser o início), mas nunca são expandidas,
+    pois nenhum caminho passa por elas. sucessor = -1 onde não há próximo passo.
+    """
+    indice = tabuleiro.indice_cavalo()
+    inicios, alvos, tabela = indice.inicios, indice.alvos, indice.tabela
+    celulas = tabuleiro.celulas
+    n = tabuleiro.linhas * tabuleiro.colunas
+
+    dist = array("d", [INFINITO]) * n
+    sucessor = array("i", [-1]) * n
+    raiz = tabuleiro.id_casa(objetivo)
+    dist[raiz] = 0.0
+    fila = [(0.0, raiz)]
+
+    while fila:
+        d, v = heapq.heappop(fila)
+        if d > dist[v]:
+            continue
+        custo_v = tabela[celulas[v]]
+        if custo_v == INFINITO:
+            continue
+        novo = d + custo_v
+        for u in alvos[inicios[v]:inicios[v + 1]]:
+            if novo < dist[u]:
+                dist[u] = novo
+                sucessor[u] = v
+                heapq.heappush(fila, (novo, u))
+
+    return dist, sucessor
+
+
+def dijkstra_direto(tabuleiro: Tabuleiro, origem: Coordenada) -> Tuple[array, array]:
+    """
+    Dijkstra a partir da origem (sentido normal do cavalo).
+    Retorna (custo_desde_origem, pai), indexados pelo id da casa; pai = -1 na
+    origem e nas casas inalcançáveis.
+    """
+    indice = tabuleiro.indice_cavalo()
+    inicios, alvos, custos = indice.inicios, indice.alvos, indice.custos
+    n = tabuleiro.linhas * tabuleiro.colunas
+
+    dist = array("d", [INFINITO]) * n
+    pai = array("i", [-1]) * n
+    raiz = tabuleiro.id_casa(origem)
+    dist[raiz] = 0.0
+    fila = [(0.0, raiz)]
+
+    while fila:
+        d, u = heapq.heappop(fila)
+        if d > dist[u]:
+            continue
+        for k in range(inicios[u], inicios[u + 1]):
+            novo = d + custos[k]
+            v = alvos[k]
+            if novo < dist[v]:
+                dist[v] = novo
+                pai[v] = u
+                heapq.heappush(fila, (novo, v))
+
+    return dist, pai
+
+
+# -------------------------------------------------------------
+# Campo de distâncias enraizado no objetivo
+# -------------------------------------------------------------
+class CampoDistancias:
+    """
+    Custo ótimo de cada casa até `objetivo` e o próximo passo a partir dela.
+
+    Um único Dijkstra reverso responde a qualquer número de inícios: o caminho
+    de uma casa sai seguindo os sucessores, em O(tamanho do caminho). Se o
+    tabuleiro mudar (definir_terreno ou tabela de custos), o campo é
+    recalculado na próxima consulta.
+    """
+
+    def __init__(self, tabuleiro: Tabuleiro, objetivo: Coordenada):
+        self.tabuleiro = tabuleiro
+        self.objetivo = objetivo
+        self._calcular()
+
+    def _calcular(self) -> None:
+        self.custos, self.sucessores = dijkstra_reverso(self.tabuleiro, self.objetivo)
+        self._versao = self.tabuleiro.versao
+        self._tabela = self.tabuleiro.tabela_custos()
+
+    @property
+    def valido(self) -> bool:
+        """False se o tabuleiro mudou depois do último cálculo."""
+        return (self._versao == self.tabuleiro.versao
+                and self._tabela == self.tabuleiro.tabela_custos())
+
+    def _atualizar(self) -> None:
+        if not self.valido:
+            self._calcular()
+
+    def custo(self, inicio: Coordenada) -> float:
+        """Custo ótimo de `inicio` até o objetivo (inf se inalcançável)."""
+        self._atualizar()
+        return self.custos[self.tabuleiro.id_casa(inicio)]
+
+    def proximo_passo(self, pos: Coordenada) -> Optional[Coordenada]:
+        """Próxima casa no caminho ótimo a partir de `pos` (None no objetivo ou sem caminho)."""
+        self._atualizar()
+        seguinte = self.sucessores[self.tabuleiro.id_casa(pos)]
+        return self.tabuleiro.pos_casa(seguinte) if seguinte >= 0 else None
+
+    def caminho(self, inicio: Coordenada) -> Tuple[List[Coordenada], float]:
+        """Retorna (caminho, custo_total) de `inicio` até o objetivo, como busca_a_estrela."""
+        self._atualizar()
+        casa = self.tabuleiro.id_casa(inicio)
+        custo = self.custos[casa]
+        if custo == INFINITO:
+            return [], float("inf")
+        colunas = self.tabuleiro.colunas
+        sucessores = self.sucessores
+        caminho = [divmod(casa, colunas)]
+        while sucessores[casa] >= 0:
+            casa = sucessores[casa]
+            caminho.append(divmod(casa, colunas))
+        return caminho, custo
+
+
+def campo_distancias(tabuleiro: Tabuleiro, objetivo: Coordenada) -> CampoDistancias:
+    """
+    Retorna o campo de distâncias do objetivo, guardado no próprio tabuleiro:
+    consultas repetidas ao mesmo objetivo pagam o Dijkstra uma única vez.
+    Os campos dos objetivos menos recentes são descartados (ver
+    Tabuleiro.derivado, por_objetivo).
+    """
+    return tabuleiro.derivado(("campo_distancias", objetivo),
+                              lambda: CampoDistancias(tabuleiro, objetivo), por_objetivo=True)
@@ -3,7 +3,8 @@
 # =============================================================
 
 from typing import List, Tuple
-from src.tabuleiro import Tabuleiro, Coordenada, dentro_dos_limites
+from src.tabuleiro import Tabuleiro, Coordenada, MOVIMENTOS_CAVALO
+from src.bitboard import ataques_cavalo, bitboards
 
 # -------------------------------------------------------------
 # Classe Cavalo
@@ -12,12 +13,7 @@ class Cavalo:
     """Representa o cavalo e seus movimentos possíveis em um tabuleiro."""
     
     # todos os deslocamentos possíveis em L (linha, coluna)
-    MOVIMENTOS: List[Coordenada] = [
-        (-2, -1), (-2,  1),
-        (-1, -2), (-1,  2),
-        ( 1, -2), ( 1,  2),
-        ( 2, -1), ( 2,  1)
-    ]
+    MOVIMENTOS: List[Coordenada] = MOVIMENTOS_CAVALO
 
     def __init__(self, pos_inicial: Coordenada):
         self.posicao = pos_inicial
@@ -26,13 +22,15 @@ class Cavalo:
         """
         Retorna as casas válidas para onde o cavalo pode se mover.
         Ignora casas fora do tabuleiro e casas bloqueadas (barreiras).
+        Lê do índice de vizinhança pré-computado do tabuleiro.
         """
-        linha, coluna = self.posicao
-        destinos: List[Coordenada] = []
-
-        for dl, dc in self.MOVIMENTOS:
-            nova_pos = (linha + dl, coluna + dc)
-            if dentro_dos_limites(nova_pos) and not tabuleiro.bloqueado(nova_pos):
-                destinos.append(nova_pos)
+        return tabuleiro.vizinhos_cavalo(self.posicao)
 
-        return destinos
+    def ataques(self, tabuleiro: Tabuleiro) -> int:
+        """
+        Mesmas casas de movimentos_possiveis como bitboard (bit = id da casa),
+        para tabuleiros de até 64 casas.
+        """
+        linha, coluna = self.posicao
+        ataques = ataques_cavalo(tabuleiro.linhas, tabuleiro.colunas)[linha * tabuleiro.colunas + coluna]
+        return ataques & bitboards(tabuleiro).livres
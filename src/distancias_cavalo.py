@@ -0,0 +1,127 @@
+# =============================================================
+#  distancias_cavalo.py — Distâncias exatas em saltos de cavalo
+# =============================================================
+
+from __future__ import annotations
+import threading
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.tabuleiro import Tabuleiro, Coordenada, MOVIMENTOS_CAVALO
+from src.bitboard import bitboards, cabe_em_bitboard
+
+# acima disso a tabela completa (todas as origens × todos os destinos) fica grande demais
+LIMITE_TABELA_COMPLETA = 32 * 32
+# cache de movimentos_cavalo_vazio: no máximo tantas tabelas e tantas casas no
+# total (4 bytes cada; 16 Mi casas = 64 MB, uma tabela 4096x4096). A tabela
+# mais recente fica sempre, mesmo que sozinha passe do limite.
+TABELAS_VAZIO_MAXIMO = 128
+CASAS_VAZIO_MAXIMO = 16 * 1024 * 1024
+
+
+# -------------------------------------------------------------
+# BFS do cavalo por camadas (fronteira vetorizada)
+# -------------------------------------------------------------
+def bfs_cavalo(linhas: int, colunas: int, raiz: Coordenada,
+               barreiras: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Número mínimo de saltos entre cada casa e `raiz` (int32 por id; -1 = inalcançável).
+
+    Com `barreiras` (máscara plana), os saltos intermediários não podem
+    passar por barreiras; a própria casa de partida pode ser uma barreira
+    (ela nunca é "entrada"), por isso barreiras recebem distância mas não
+    propagam. A raiz sempre propaga. Como os saltos são simétricos, o valor
+    vale nos dois sentidos.
+    """
+    dist = np.full(linhas * colunas, -1, dtype=np.int32)
+    origem = raiz[0] * colunas + raiz[1]
+    dist[origem] = 0
+    fronteira = np.array([origem], dtype=np.int64)
+    nivel = 0
+    while fronteira.size:
+        nivel += 1
+        lin, col = np.divmod(fronteira, colunas)
+        candidatos = []
+        for dl, dc in MOVIMENTOS_CAVALO:
+            nl, nc = lin + dl, col + dc
+            ok = (nl >= 0) & (nl < linhas) & (nc >= 0) & (nc < colunas)
+            candidatos.append(nl[ok] * colunas + nc[ok])
+        novos = np.unique(np.concatenate(candidatos))
+        novos = novos[dist[novos] < 0]
+        dist[novos] = nivel
+        if barreiras is not None:
+            novos = novos[~barreiras[novos]]
+        fronteira = novos
+    return dist
+
+
+# -------------------------------------------------------------
+# Tabelas exatas para o tabuleiro vazio
+# -------------------------------------------------------------
+_tabelas_vazio: "OrderedDict[Tuple[int, int, Coordenada], array]" = OrderedDict()
+_casas_vazio = 0
+_trava_vazio = threading.Lock()
+
+
+def movimentos_cavalo_vazio(linhas: int, colunas: int, objetivo: Coordenada) -> array:
+    """
+    Saltos exatos de cada casa até `objetivo` num tabuleiro vazio linhas x colunas
+    (considera bordas e cantos). Resultado em cache LRU por (tamanho, objetivo),
+    limitado pelo total de casas (CASAS_VAZIO_MAXIMO), não só pelo número de tabelas.
+    """
+    global _casas_vazio
+    chave = (linhas, colunas, tuple(objetivo))
+    with _trava_vazio:
+        dist = _tabelas_vazio.get(chave)
+        if dist is not None:
+            _tabelas_vazio.move_to_end(chave)
+            return dist
+    dist = array("i", bfs_cavalo(linhas, colunas, chave[2]).tobytes())
+    with _trava_vazio:
+        if chave not in _tabelas_vazio:  # outra thread pode ter calculado junto
+            _tabelas_vazio[chave] = dist
+            _casas_vazio += len(dist)
+        while len(_tabelas_vazio) > 1 and (len(_tabelas_vazio) > TABELAS_VAZIO_MAXIMO
+                                          or _casas_vazio > CASAS_VAZIO_MAXIMO):
+            _casas_vazio -= len(_tabelas_vazio.popitem(last=False)[1])
+    return dist
+
+
+@lru_cache(maxsize=8)
+def tabela_movimentos_cavalo(linhas: int, colunas: int) -> np.ndarray:
+    """
+    Tabela completa de saltos exatos num tabuleiro vazio: tabela[origem, destino]
+    por id de casa (-1 = inalcançável). Calculada uma vez por tamanho.
+    Limitada a LIMITE_TABELA_COMPLETA casas; acima disso use movimentos_cavalo_vazio.
+    """
+    n = linhas * colunas
+    if n > LIMITE_TABELA_COMPLETA:
+        raise ValueError(f"Tabela completa limitada a {LIMITE_TABELA_COMPLETA} casas "
+                         f"(pedido: {linhas}x{colunas})")
+    tabela = np.stack([bfs_cavalo(linhas, colunas, divmod(destino, colunas))
+                       for destino in range(n)], axis=1)
+    tabela.flags.writeable = False
+    return tabela
+
+
+# -------------------------------------------------------------
+# Distâncias sobre as barreiras reais do tabuleiro
+# -------------------------------------------------------------
+def movimentos_com_barreiras(tabuleiro: Tabuleiro, objetivo: Coordenada) -> array:
+    """
+    Saltos mínimos de cada casa até `objetivo` desviando das barreiras do
+    tabuleiro (-1 = inalcançável). Guardado no tabuleiro até a próxima
+    alteração de terreno. Tabuleiros de até 64 casas usam a BFS em bits.
+    """
+    def construir():
+        if cabe_em_bitboard(tabuleiro.linhas, tabuleiro.colunas):
+            return bitboards(tabuleiro).distancias(objetivo)
+        barreiras = tabuleiro.mascara_barreiras().ravel()
+        dist = bfs_cavalo(tabuleiro.linhas, tabuleiro.colunas, objetivo, barreiras)
+        return array("i", dist.tobytes())
+
+    return tabuleiro.derivado(("movimentos_com_barreiras", objetivo), construir, por_objetivo=True)
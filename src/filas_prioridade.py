@@ -0,0 +1,202 @@
+# =============================================================
+#  filas_prioridade.py — Filas de prioridade para a lista aberta do A*
+# =============================================================
+
+from __future__ import annotations
+import heapq
+from fractions import Fraction
+from math import gcd
+from typing import Iterable, List, Optional
+
+from src.tabuleiro import Tabuleiro, INFINITO
+
+DESEMPATES = ("maior_g", "menor_g", "nenhum")
+# quanta menores que menor_custo / LIMITE_QUANTUM criariam baldes demais
+LIMITE_QUANTUM = 64
+
+
+def _chave_desempate(desempate: str):
+    if desempate not in DESEMPATES:
+        raise ValueError(f"Desempate desconhecido: {desempate!r} (use {DESEMPATES})")
+    if desempate == "maior_g":
+        return lambda g: -g
+    if desempate == "menor_g":
+        return lambda g: g
+    return None
+
+
+# -------------------------------------------------------------
+# Heap binário (heapq)
+# -------------------------------------------------------------
+class FilaBinaria:
+    """Heap binário de tuplas (f, desempate, casa). Serve para quaisquer custos."""
+    __slots__ = ("_heap", "_desempate")
+
+    def __init__(self, desempate: str = "nenhum"):
+        self._heap: list = []
+        self._desempate = _chave_desempate(desempate)
+
+    def inserir(self, f: float, g: float, casa: int) -> None:
+        heapq.heappush(self._heap, (f, self._desempate(g) if self._desempate else 0, casa))
+
+    def remover(self) -> int:
+        return heapq.heappop(self._heap)[2]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+# -------------------------------------------------------------
+# Fila de baldes (Dial)
+# -------------------------------------------------------------
+class FilaBaldes:
+    """
+    Fila de Dial: um balde por valor de f, que precisa ser múltiplo exato do
+    quantum. Inserir e remover são O(1) amortizado. Um f abaixo do cursor (o
+    que heurísticas inconsistentes como H1/H2 podem produzir) só faz o cursor
+    voltar, então a ordem continua exata.
+    """
+    __slots__ = ("_quantum", "_baldes", "_cursor", "_tamanho", "_desempate")
+
+    def __init__(self, quantum: float, desempate: str = "nenhum"):
+        self._quantum = quantum
+        self._baldes: List[list] = []
+        self._cursor = 0
+        self._tamanho = 0
+        self._desempate = _chave_desempate(desempate)
+
+    def inserir(self, f: float, g: float, casa: int) -> None:
+        k = round(f / self._quantum)
+        baldes = self._baldes
+        if k >= len(baldes):
+            baldes.extend([] for _ in range(k + 1 - len(baldes)))
+        if self._desempate is None:
+            baldes[k].append(casa)  # pilha: o mais recente sai primeiro
+        else:
+            heapq.heappush(baldes[k], (self._desempate(g), casa))
+        if k < self._cursor:
+            self._cursor = k
+        self._tamanho += 1
+
+    def remover(self) -> int:
+        baldes, cursor = self._baldes, self._cursor
+        while not baldes[cursor]:
+            cursor += 1
+        self._cursor = cursor
+        self._tamanho -= 1
+        if self._desempate is None:
+            return baldes[cursor].pop()
+        return heapq.heappop(baldes[cursor])[1]
+
+    def __len__(self) -> int:
+        return self._tamanho
+
+
+# -------------------------------------------------------------
+# Heap radix
+# -------------------------------------------------------------
+class FilaRadix:
+    """
+    Heap radix sobre chaves inteiras (f / quantum). Exige chaves monótonas:
+    uma chave abaixo da última removida é elevada a ela (pathmax), o que
+    mantém o A* correto com heurísticas consistentes; com H1/H2 a ordem é
+    só aproximada. Cada item muda de balde O(log C) vezes no total.
+    """
+    __slots__ = ("_quantum", "_baldes", "_ultimo", "_tamanho", "_desempate")
+
+    def __init__(self, quantum: float, desempate: str = "nenhum"):
+        self._quantum = quantum
+        self._baldes: List[list] = [[] for _ in range(65)]
+        self._ultimo = 0
+        self._tamanho = 0
+        self._desempate = _chave_desempate(desempate)
+
+    def _colocar(self, item: tuple) -> None:
+        i = (item[0] ^ self._ultimo).bit_length()
+        if i == 0 and self._desempate is not None:
+            heapq.heappush(self._baldes[0], item[1:])
+        else:
+            self._baldes[i].append(item if i else item[1:])
+
+    def inserir(self, f: float, g: float, casa: int) -> None:
+        k = max(round(f / self._quantum), self._ultimo)
+        self._colocar((k, self._desempate(g) if self._desempate else 0, casa))
+        self._tamanho += 1
+
+    def remover(self) -> int:
+        baldes = self._baldes
+        if not baldes[0]:
+            i = 1
+            while not baldes[i]:
+                i += 1
+            itens, baldes[i] = baldes[i], []
+            self._ultimo = min(itens)[0]
+            for item in itens:
+                self._colocar(item)
+        self._tamanho -= 1
+        if self._desempate is None:
+            return baldes[0].pop()[1]
+        return heapq.heappop(baldes[0])[1]
+
+    def __len__(self) -> int:
+        return self._tamanho
+
+
+FILAS = ("auto", "binaria", "baldes", "radix")
+
+
+# -------------------------------------------------------------
+# Escolha da fila
+# -------------------------------------------------------------
+def quantum_exato(valores: Iterable[float]) -> Optional[float]:
+    """
+    Maior q tal que todo valor é múltiplo inteiro exato de q (MDC em frações
+    exatas dos floats), ou None se não houver valores finitos positivos.
+    """
+    fracoes = [Fraction(v) for v in valores if 0 < v < INFINITO]
+    if not fracoes:
+        return None
+    denominador = 1
+    for fr in fracoes:
+        denominador = denominador * fr.denominator // gcd(denominador, fr.denominator)
+    numerador = 0
+    for fr in fracoes:
+        numerador = gcd(numerador, int(fr * denominador))
+    return numerador / denominador
+
+
+def quantum_busca(tabuleiro: Tabuleiro, tipo_heuristica: str) -> Optional[float]:
+    """
+    Quantum de f = g + h para a busca, se existir e for utilizável: os custos
+    de entrada e as escalas das heurísticas (custo mínimo; 1,5 × custo mínimo
+    na H2) precisam ser múltiplos dele, e ele não pode ser pequeno demais.
+    """
+    custos = [c for c in tabuleiro.tabela_custos() if 0 < c < INFINITO]
+    if not custos:
+        return None
+    menor = tabuleiro.menor_custo_transponivel()
+    escalas = {"h1": [menor], "h2": [menor * 1.5], "exata": [menor], "barreiras": [menor]}
+    q = quantum_exato(custos + escalas.get(tipo_heuristica, []))
+    if q is None or q < min(custos) / LIMITE_QUANTUM:
+        return None
+    return q
+
+
+def criar_fila(tipo: str, tabuleiro: Tabuleiro, tipo_heuristica: str, desempate: str = "nenhum"):
+    """
+    Cria a lista aberta. "auto" usa a fila de baldes quando os valores de f
+    caem num quantum utilizável e o heap binário caso contrário. "baldes" e
+    "radix" pedidos explicitamente sem quantum válido recusam com ValueError.
+    """
+    if tipo not in FILAS:
+        raise ValueError(f"Fila desconhecida: {tipo!r} (use {FILAS})")
+    if tipo == "binaria":
+        return FilaBinaria(desempate)
+    q = quantum_busca(tabuleiro, tipo_heuristica)
+    if tipo == "auto":
+        return FilaBaldes(q, desempate) if q is not None else FilaBinaria(desempate)
+    if q is None:
+        raise ValueError(f"Fila {tipo!r} exige custos múltiplos de um quantum comum")
+    if tipo == "baldes":
+        return FilaBaldes(q, desempate)
+    return FilaRadix(q, desempate)
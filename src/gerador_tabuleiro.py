@@ -3,52 +3,118 @@
 # =============================================================
 
 import random
-from src.tabuleiro import Tabuleiro, Terreno, CUSTOS_PADRAO
-from src.busca_a_estrela import busca_a_estrela
+from typing import List, Optional
 
-def gerar_tabuleiro_aleatorio(prob_barreira=0.12, prob_lama=0.18, prob_estrada=0.25, max_tentativas=50):
+import numpy as np
+from src.tabuleiro import (Tabuleiro, Terreno, Coordenada, CUSTOS_PADRAO, CODIGO_TERRENO,
+                           TAMANHO_PADRAO, MOVIMENTOS_CAVALO)
+from src.distancias_cavalo import bfs_cavalo
+from src.bitboard import bitboards, cabe_em_bitboard
+
+
+def caminho_existe(tabuleiro: Tabuleiro, inicio: Coordenada, objetivo: Coordenada) -> bool:
+    """
+    Verificação rápida de jogabilidade: BFS do cavalo por camadas (em bits
+    até 64 casas, vetorizada acima disso) desviando das barreiras. Não
+    calcula custos, só se o objetivo é alcançável.
+    """
+    if tabuleiro.bloqueado(objetivo):
+        return False
+    if cabe_em_bitboard(tabuleiro.linhas, tabuleiro.colunas):
+        return bitboards(tabuleiro).alcancavel(inicio, objetivo)
+    barreiras = tabuleiro.mascara_barreiras().ravel()
+    dist = bfs_cavalo(tabuleiro.linhas, tabuleiro.colunas, inicio, barreiras)
+    return bool(dist[tabuleiro.id_casa(objetivo)] >= 0)
+
+
+def corredor_cavalo(linhas: int, colunas: int, inicio: Coordenada, objetivo: Coordenada,
+                    rng: np.random.Generator) -> List[Coordenada]:
     """
-    Gera um tabuleiro aleatório 8x8 com terrenos variados.
-    Garante que exista um caminho possível do início (7,0) ao objetivo (0,7).
+    Sequência de saltos de `inicio` a `objetivo` passando por uma casa
+    intermediária sorteada: em cada trecho, um caminho mínimo sorteado entre
+    os possíveis no tabuleiro vazio. ValueError se o cavalo não alcança o objetivo.
+    As tabelas de distância servem só a este corredor: são calculadas com
+    bfs_cavalo, fora do cache de movimentos_cavalo_vazio.
     """
-    inicio = (7, 0)
-    objetivo = (0, 7)
+    def trecho(origem: Coordenada, destino: Coordenada, dist: np.ndarray) -> List[Coordenada]:
+        if dist[origem[0] * colunas + origem[1]] < 0:
+            raise ValueError(f"O cavalo não vai de {origem} a {destino} num tabuleiro {linhas}x{colunas}")
+        casas = [origem]
+        l, c = origem
+        while (l, c) != destino:
+            restante = dist[l * colunas + c]
+            opcoes = [(l + dl, c + dc) for dl, dc in MOVIMENTOS_CAVALO
+                      if 0 <= l + dl < linhas and 0 <= c + dc < colunas
+                      and dist[(l + dl) * colunas + c + dc] == restante - 1]
+            l, c = opcoes[rng.integers(len(opcoes))]
+            casas.append((l, c))
+        return casas
+
+    # casa intermediária que alcança o objetivo (no pior caso, o próprio início)
+    ate_objetivo = bfs_cavalo(linhas, colunas, tuple(objetivo))
+    intermediaria = tuple(inicio)
+    for _ in range(8):
+        candidata = (int(rng.integers(linhas)), int(rng.integers(colunas)))
+        if ate_objetivo[candidata[0] * colunas + candidata[1]] >= 0:
+            intermediaria = candidata
+            break
+    ate_intermediaria = bfs_cavalo(linhas, colunas, intermediaria)
+    return (trecho(tuple(inicio), intermediaria, ate_intermediaria)
+            + trecho(intermediaria, tuple(objetivo), ate_objetivo)[1:])
+
+
+def gerar_tabuleiro_aleatorio(prob_barreira=0.12, prob_lama=0.18, prob_estrada=0.25, max_tentativas=50,
+                              linhas=TAMANHO_PADRAO, colunas=TAMANHO_PADRAO,
+                              semente: Optional[int] = None, corredor: bool = False,
+                              verboso: bool = True):
+    """
+    Gera um tabuleiro aleatório linhas x colunas com terrenos variados.
+    Garante que exista um caminho possível do início (canto inferior esquerdo)
+    ao objetivo (canto superior direito).
+
+    - semente: torna o sorteio reprodutível (sem ela, deriva de `random`).
+    - corredor=True: garante o caminho por construção, abrindo um corredor de
+      saltos sorteado antes de aceitar o tabuleiro (uma única tentativa).
+      Sem corredor, sorteia até max_tentativas vezes e testa com caminho_existe.
+    - verboso=False: não imprime nada (lotes, benchmarks).
+    """
+    inicio = (linhas - 1, 0)
+    objetivo = (0, colunas - 1)
+
+    # limiares acumulados → código de terreno (sorteio vetorizado)
+    limites = np.cumsum([prob_barreira, prob_lama, prob_estrada])
+    codigos = np.array([CODIGO_TERRENO[Terreno.BARREIRA], CODIGO_TERRENO[Terreno.LAMA],
+                        CODIGO_TERRENO[Terreno.ESTRADA], CODIGO_TERRENO[Terreno.TERRA]],
+                       dtype=np.uint8)
+    # sem semente, parte de `random`, para que random.seed continue reprodutível
+    rng = np.random.default_rng(random.getrandbits(64) if semente is None else semente)
 
     for tentativa in range(1, max_tentativas + 1):
-        grid = []
-
-        # cria a matriz com terrenos aleatórios
-        for lin in range(8):
-            linha = []
-            for col in range(8):
-                r = random.random()
-                if r < prob_barreira:
-                    linha.append(Terreno.BARREIRA)
-                elif r < prob_barreira + prob_lama:
-                    linha.append(Terreno.LAMA)
-                elif r < prob_barreira + prob_lama + prob_estrada:
-                    linha.append(Terreno.ESTRADA)
-                else:
-                    linha.append(Terreno.TERRA)
-            grid.append(linha)
+        # cria a grade (plana) com terrenos aleatórios
+        sorteio = rng.random(linhas * colunas)
+        grade = codigos[np.searchsorted(limites, sorteio, side="right")]
+
+        if corredor:
+            # barreiras no corredor viram terra; o resto do sorteio é mantido
+            casas = np.array([l * colunas + c for l, c in
+                              corredor_cavalo(linhas, colunas, inicio, objetivo, rng)])
+            no_corredor = grade[casas]
+            grade[casas] = np.where(no_corredor == CODIGO_TERRENO[Terreno.BARREIRA],
+                                    CODIGO_TERRENO[Terreno.TERRA], no_corredor)
 
         # cria objeto Tabuleiro com custos padrão
-        tabuleiro = Tabuleiro(grid, dict(CUSTOS_PADRAO))
+        tabuleiro = Tabuleiro(linhas, colunas, bytearray(grade.tobytes()), dict(CUSTOS_PADRAO))
 
         # garante início e fim livres
-        tabuleiro.grade[inicio[0]][inicio[1]] = Terreno.TERRA
-        tabuleiro.grade[objetivo[0]][objetivo[1]] = Terreno.TERRA
-
-        # tenta encontrar caminho
-        caminho, custo = busca_a_estrela(tabuleiro, inicio, objetivo)
+        tabuleiro.definir_terreno(inicio, Terreno.TERRA)
+        tabuleiro.definir_terreno(objetivo, Terreno.TERRA)
 
-        if caminho and custo < float("inf"):
-            print(f"[✔] Tabuleiro válido encontrado (tentativa {tentativa}) — Custo estimado: {custo:.2f}")
+        if corredor or caminho_existe(tabuleiro, inicio, objetivo):
+            if verboso:
+                print(f"[✔] Tabuleiro válido encontrado (tentativa {tentativa})")
             return tabuleiro
-        else:
-            print(f"[✖] Tentativa {tentativa}: tabuleiro inviável, gerando novo...")
 
     # fallback — terreno livre se todas falharem
-    print("[⚠] Nenhum tabuleiro válido encontrado após várias tentativas. Gerando terreno livre.")
-    grid = [[Terreno.TERRA for _ in range(8)] for _ in range(8)]
-    return Tabuleiro(grid, dict(CUSTOS_PADRAO))
+    if verboso:
+        print(f"[⚠] Nenhum tabuleiro válido após {max_tentativas} tentativas. Gerando terreno livre.")
+    return Tabuleiro.vazio(Terreno.TERRA, linhas, colunas)
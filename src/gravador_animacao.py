@@ -0,0 +1,431 @@
+# =============================================================
+#  gravador_animacao.py — Animações de busca gravadas sem janela
+# =============================================================
+#
+#  Uso:
+#    python -m src.gravador_animacao cenarios/cenario_basico.json --saida animacoes/
+#    python -m src.gravador_animacao cenarios/ --comparar --formato gif --processos 4
+#    python -m src.gravador_animacao corpus.jsonl --so-final          # miniaturas
+#
+#  Desenha com o mesmo código da interface (camada_estatica, QuadroBusca,
+#  fundo_comparativo) numa superfície fora da tela, com o driver de vídeo
+#  "dummy" do SDL: sem janela, sem laço de eventos e sem esperas, então cada
+#  quadro sai tão rápido quanto a CPU permite. Cada cenário vira uma pasta
+#  de PNGs numerados ou um GIF animado; lotes podem ser gravados em vários
+#  processos.
+#
+#  O GIF é escrito aqui mesmo (sem dependências além de numpy): paleta fixa
+#  de 252 cores, e cada quadro guarda só o retângulo que mudou, o mesmo que
+#  QuadroBusca devolve para pygame.display.update.
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import struct
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import replace
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+import pygame
+
+from src.tabuleiro import Tabuleiro, Coordenada
+from src.busca_a_estrela import HEURISTICAS, MODOS_BUSCA
+from src.cache_buscas import busca_com_cache
+from src.leitor_cenarios import ler_cenarios
+from src.relatorio_custos import montar_relatorio
+from src.interface_grafica import (ESTILO_COMPARATIVO, ESTILO_PRINCIPAL, MARGEM_CAMADA, QuadroBusca,
+                                   carregar_cavalo, fundo_comparativo, imagem)
+
+FORMATOS = ("png", "gif")
+# tabuleiros grandes têm as casas reduzidas para caber neste lado (em pixels)
+LADO_MAXIMO = 1024
+MENOR_CELULA = 2
+# tempo de exibição, no GIF, do quadro final (caminho desenhado)
+DURACAO_FINAL = 2.0
+# tarefas em voo por processo de trabalho (como no resolvedor_lote)
+TAREFAS_POR_PROCESSO = 4
+
+
+def iniciar_sem_janela() -> None:
+    """
+    Inicia o vídeo do pygame (driver "dummy", se nenhum outro foi escolhido)
+    com uma tela de 1x1: basta para convert() e para renderizar textos.
+    """
+    if not pygame.display.get_init():
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+    pygame.font.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+
+def estilo_para(tabuleiro: Tabuleiro, estilo, lado_maximo: int = LADO_MAXIMO):
+    """O estilo com as casas (e pontos e linhas) reduzidos para o tabuleiro caber em lado_maximo."""
+    maior = max(tabuleiro.linhas, tabuleiro.colunas)
+    celula = max(MENOR_CELULA, min(estilo.celula, lado_maximo // maior))
+    if celula == estilo.celula:
+        return estilo
+    escala = celula / estilo.celula
+    return replace(estilo, celula=celula,
+                   raio_explorado=max(1, round(estilo.raio_explorado * escala)),
+                   raio_caminho=max(1, round(estilo.raio_caminho * escala)),
+                   largura_linha=max(1, round(estilo.largura_linha * escala)),
+                   numerar_caminho=estilo.numerar_caminho and celula >= 24)
+
+
+def _cavalo(estilo):
+    if estilo.celula >= ESTILO_PRINCIPAL.celula:
+        return carregar_cavalo()
+    lado = (ESTILO_PRINCIPAL.celula - 8) * estilo.celula // ESTILO_PRINCIPAL.celula
+    return imagem("cavalo.png", max(1, lado))
+
+
+# -------------------------------------------------------------
+# Saídas: PNGs numerados ou GIF animado
+# -------------------------------------------------------------
+class QuadrosPNG:
+    """Cada quadro vira pasta/quadro_00000.png, quadro_00001.png, ..."""
+
+    def __init__(self, pasta: str, tamanho: Tuple[int, int]):
+        os.makedirs(pasta, exist_ok=True)
+        self.pasta = pasta
+        self.quadros = 0
+
+    def gravar(self, tela: pygame.Surface, sujos: List[pygame.Rect], duracao: float) -> None:
+        pygame.image.save(tela, os.path.join(self.pasta, f"quadro_{self.quadros:05d}.png"))
+        self.quadros += 1
+
+    def fechar(self) -> None:
+        pass
+
+
+# paleta fixa 6 × 7 × 6 (o verde, a que o olho é mais sensível, tem um nível a mais)
+PALETA_GIF = bytes(
+    [round(r * 255 / 5), round(g * 255 / 6), round(b * 255 / 5)][i]
+    for r in range(6) for g in range(7) for b in range(6) for i in range(3)
+).ljust(256 * 3, b"\0")
+
+
+def _indices_paleta(rgb: np.ndarray) -> np.ndarray:
+    """Pixels (altura, largura, 3) → índices da PALETA_GIF, cor mais próxima por canal."""
+    rgb = rgb.astype(np.uint16)
+    r = (rgb[..., 0] * 5 + 127) // 255
+    g = (rgb[..., 1] * 6 + 127) // 255
+    b = (rgb[..., 2] * 5 + 127) // 255
+    return (r * 42 + g * 6 + b).astype(np.uint8)
+
+
+def _lzw_gif(indices: bytes, bits_minimo: int = 8) -> bytes:
+    """Compressão LZW de tamanho de código variável (até 12 bits) do formato GIF."""
+    limpar = 1 << bits_minimo
+    fim = limpar + 1
+    tamanho, proximo, limite = bits_minimo + 1, fim + 1, 1 << (bits_minimo + 1)
+    codigos, tamanhos = [limpar], [tamanho]
+    emitir, emitir_tamanho = codigos.append, tamanhos.append
+    dicionario = {}
+    consultar = dicionario.get
+    prefixo = indices[0]
+    for indice in indices[1:]:
+        chave = (prefixo << 8) | indice
+        codigo = consultar(chave)
+        if codigo is not None:
+            prefixo = codigo
+            continue
+        emitir(prefixo)
+        emitir_tamanho(tamanho)
+        if proximo < 4096:
+            if proximo == limite:
+                tamanho += 1
+                limite <<= 1
+            dicionario[chave] = proximo
+            proximo += 1
+        else:  # tabela cheia: recomeça
+            emitir(limpar)
+            emitir_tamanho(tamanho)
+            dicionario.clear()
+            tamanho, proximo, limite = bits_minimo + 1, fim + 1, 1 << (bits_minimo + 1)
+        prefixo = indice
+    emitir(prefixo)
+    emitir_tamanho(tamanho)
+    if proximo == limite and tamanho < 12:  # o decodificador cresce ao ler o último código
+        tamanho += 1
+    emitir(fim)
+    emitir_tamanho(tamanho)
+
+    # empacota os códigos, bit menos significativo primeiro
+    codigos_np = np.array(codigos, dtype=np.uint16)
+    tamanhos_np = np.array(tamanhos, dtype=np.uint8)
+    bits = (codigos_np[:, None] >> np.arange(12, dtype=np.uint16)) & 1
+    bits = bits[np.arange(12) < tamanhos_np[:, None]]
+    return np.packbits(bits.astype(np.uint8), bitorder="little").tobytes()
+
+
+class GifAnimado:
+    """
+    GIF animado gravado quadro a quadro. O primeiro quadro é a tela inteira;
+    os seguintes, só o menor retângulo (dentro dos sujos) em que algum pixel
+    mudou, desenhado por cima do anterior.
+    """
+
+    def __init__(self, caminho: str, tamanho: Tuple[int, int]):
+        pasta = os.path.dirname(caminho)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        self.arquivo = open(caminho, "wb")
+        self.tela = pygame.Rect((0, 0), tamanho)
+        self.quadros = 0
+        self._anterior: Optional[np.ndarray] = None  # índices da paleta já na imagem
+        self.arquivo.write(b"GIF89a" + struct.pack("<HHBBB", *tamanho, 0xF7, 0, 0) + PALETA_GIF)
+        # repetição infinita
+        self.arquivo.write(b"\x21\xFF\x0BNETSCAPE2.0\x03\x01\x00\x00\x00")
+
+    def gravar(self, tela: pygame.Surface, sujos: List[pygame.Rect], duracao: float) -> None:
+        if self._anterior is None or not sujos:
+            area = self.tela.copy()
+        else:
+            area = sujos[0].unionall(sujos[1:]).clip(self.tela)
+        pixels = pygame.surfarray.pixels3d(tela)[area.left:area.right, area.top:area.bottom]
+        indices = _indices_paleta(pixels.transpose(1, 0, 2))
+        del pixels  # libera a trava da superfície
+        if self._anterior is None:
+            self._anterior = indices
+        else:
+            # encolhe a área para o que realmente mudou (o caminho final, por exemplo)
+            regiao = self._anterior[area.top:area.bottom, area.left:area.right]
+            linhas, colunas = np.nonzero(regiao != indices)
+            if len(linhas) == 0:
+                linhas, colunas = np.zeros(1, int), np.zeros(1, int)
+            topo, esquerda = linhas.min(), colunas.min()
+            altura, largura = linhas.max() - topo + 1, colunas.max() - esquerda + 1
+            regiao[...] = indices
+            indices = indices[topo:topo + altura, esquerda:esquerda + largura]
+            area = pygame.Rect(area.left + esquerda, area.top + topo, largura, altura)
+        dados = _lzw_gif(indices.tobytes())
+        centesimos = max(2, round(duracao * 100))  # navegadores tratam < 2 como 10
+        f = self.arquivo
+        f.write(b"\x21\xF9\x04" + struct.pack("<BHBB", 0x04, centesimos, 0, 0))  # manter quadro
+        f.write(b"\x2C" + struct.pack("<HHHHB", area.x, area.y, area.width, area.height, 0))
+        f.write(b"\x08")
+        for i in range(0, len(dados), 255):
+            bloco = dados[i:i + 255]
+            f.write(bytes([len(bloco)]) + bloco)
+        f.write(b"\x00")
+        self.quadros += 1
+
+    def fechar(self) -> None:
+        self.arquivo.write(b"\x3B")
+        self.arquivo.close()
+
+
+def _abrir_saida(destino: str, formato: str, tamanho: Tuple[int, int]):
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconhecido: {formato!r} (use {FORMATOS})")
+    return GifAnimado(destino, tamanho) if formato == "gif" else QuadrosPNG(destino, tamanho)
+
+
+# -------------------------------------------------------------
+# Gravação
+# -------------------------------------------------------------
+def _animar(tela, quadros, inicio, saida, passo: int, duracao: float, apenas_final: bool) -> int:
+    """
+    Grava as etapas 0, passo, 2·passo... da animação e o quadro final com o
+    caminho. `quadros`: [(QuadroBusca, explorados, caminho)].
+    """
+    if passo < 1:
+        raise ValueError("passo deve ser pelo menos 1")
+    total = max(len(explorados) for _, explorados, _ in quadros)
+    if not apenas_final:
+        for etapa in range(0, total, passo):
+            sujos = []
+            for quadro, explorados, _ in quadros:
+                pos = explorados[min(etapa, len(explorados)-1)] if explorados else inicio
+                sujos += quadro.desenhar(tela, explorados, etapa, pos)
+            saida.gravar(tela, sujos, duracao)
+    sujos = []
+    for quadro, explorados, caminho in quadros:
+        sujos += quadro.desenhar(tela, explorados, total, caminho[-1] if caminho else inicio, caminho)
+    saida.gravar(tela, sujos, DURACAO_FINAL)
+    return saida.quadros
+
+
+def gravar_busca(tabuleiro: Tabuleiro, inicio: Coordenada, objetivo: Coordenada, destino: str,
+                 heuristica: str = "h2", modo: str = "unidirecional", formato: str = "png",
+                 passo: int = 1, duracao: float = 0.1, apenas_final: bool = False) -> int:
+    """
+    Grava a animação de uma busca (tabuleiro, casas expandidas, cavalo e
+    caminho final, como na tela principal) em `destino`: uma pasta de PNGs
+    ou um arquivo .gif. `passo` pula etapas (tabuleiros grandes), `duracao`
+    é o tempo de cada quadro no GIF e apenas_final grava só o último quadro
+    (miniatura). Devolve o número de quadros gravados.
+    """
+    iniciar_sem_janela()
+    caminho, _, explorados = busca_com_cache(tabuleiro, inicio, objetivo, heuristica, modo)
+    estilo = estilo_para(tabuleiro, ESTILO_PRINCIPAL)
+    quadro = QuadroBusca(tabuleiro, inicio, objetivo, estilo, MARGEM_CAMADA, MARGEM_CAMADA,
+                         _cavalo(estilo))
+    tela = pygame.Surface(quadro.retangulo.size).convert()
+    saida = _abrir_saida(destino, formato, tela.get_size())
+    try:
+        return _animar(tela, [(quadro, explorados, caminho)], inicio, saida, passo, duracao, apenas_final)
+    finally:
+        saida.fechar()
+
+
+def gravar_comparacao(tabuleiro: Tabuleiro, inicio: Coordenada, objetivo: Coordenada, destino: str,
+                      modo: str = "unidirecional", formato: str = "png", passo: int = 1,
+                      duracao: float = 0.1, apenas_final: bool = False) -> int:
+    """Como gravar_busca, para a comparação H1 × H2 lado a lado (como no modo comparativo)."""
+    iniciar_sem_janela()
+    estilo = estilo_para(tabuleiro, ESTILO_COMPARATIVO, LADO_MAXIMO // 2)
+    largura_tab, altura_tab = tabuleiro.colunas * estilo.celula, tabuleiro.linhas * estilo.celula
+    topo = 120
+    largura_total = max(760, 2 * largura_tab + 80 + 2 * (MARGEM_CAMADA + 20))
+    altura_total = topo + altura_tab + MARGEM_CAMADA + 50
+    x1 = (largura_total - 2 * largura_tab - 80) // 2
+    xs = (x1, x1 + largura_tab + 80)
+
+    cavalo = _cavalo(estilo)
+    quadros, relatorios = [], []
+    for x, heuristica in zip(xs, ("h1", "h2")):
+        caminho, custo, explorados = busca_com_cache(tabuleiro, inicio, objetivo, heuristica, modo)
+        relatorios.append(montar_relatorio(tabuleiro, caminho, custo, heuristica, len(explorados)))
+        quadros.append((QuadroBusca(tabuleiro, inicio, objetivo, estilo, x, topo, cavalo),
+                        explorados, caminho))
+    tela = fundo_comparativo((largura_total, altura_total), xs, largura_tab,
+                             topo + altura_tab + MARGEM_CAMADA + 10, relatorios)
+    saida = _abrir_saida(destino, formato, tela.get_size())
+    try:
+        return _animar(tela, quadros, inicio, saida, passo, duracao, apenas_final)
+    finally:
+        saida.fechar()
+
+
+# -------------------------------------------------------------
+# Lotes (um cenário por tarefa, em processos de trabalho)
+# -------------------------------------------------------------
+# (arquivo, linha, tabuleiro, início, objetivo, destino, opções de gravação)
+Tarefa = Tuple[str, int, Tabuleiro, Coordenada, Coordenada, str, dict]
+
+
+def gravar_tarefa(tarefa: Tarefa) -> dict:
+    arquivo, linha, tabuleiro, inicio, objetivo, destino, opcoes = tarefa
+    opcoes = dict(opcoes)
+    comparar = opcoes.pop("comparar", False)
+    t0 = time.perf_counter()
+    if comparar:
+        quadros = gravar_comparacao(tabuleiro, inicio, objetivo, destino, **opcoes)
+    else:
+        quadros = gravar_busca(tabuleiro, inicio, objetivo, destino, **opcoes)
+    return {"arquivo": arquivo, "linha": linha, "saida": destino, "quadros": quadros,
+            "tempo_s": round(time.perf_counter() - t0, 6)}
+
+
+def nome_saida(fonte: str, linha: int, formato: str) -> str:
+    """Nome do resultado de um cenário: <arquivo sem extensão>-<linha>[.gif]."""
+    base = "entrada" if fonte == "-" else os.path.basename(os.path.normpath(fonte))
+    base = base.split(".")[0] or "cenario"
+    return f"{base}-{linha:04d}" + (".gif" if formato == "gif" else "")
+
+
+def _sem_colisao(nome: str, usados: Set[str]) -> str:
+    """
+    `nome`, ou `<nome>-2`, `<nome>-3`... se já saiu para outro cenário do
+    lote (mesmo arquivo em pastas diferentes, c.json e c.jsonl...).
+    """
+    raiz, extensao = os.path.splitext(nome)
+    candidato, n = nome, 1
+    while candidato in usados:
+        n += 1
+        candidato = f"{raiz}-{n}{extensao}"
+    usados.add(candidato)
+    return candidato
+
+
+def gravar_lote(caminhos: Iterable[str], pasta: str, heuristica: str = "h2",
+                modo: str = "unidirecional", comparar: bool = False, formato: str = "png",
+                passo: int = 1, duracao: float = 0.1, apenas_final: bool = False,
+                processos: Optional[int] = None) -> Iterator[dict]:
+    """
+    Grava a animação de cada cenário das fontes em `pasta` e produz um
+    registro por cenário, na ordem de entrada ({"arquivo", "linha", "erro"}
+    para os inválidos). processos=None usa todos os núcleos; processos=1
+    grava no próprio processo. Fontes que dariam o mesmo nome de saída
+    recebem um sufixo (-2, -3...), na ordem de entrada.
+    """
+    if heuristica not in HEURISTICAS:
+        raise ValueError(f"Heurística desconhecida: {heuristica!r}")
+    if modo not in MODOS_BUSCA:
+        raise ValueError(f"Modo de busca desconhecido: {modo!r} (use {MODOS_BUSCA})")
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconhecido: {formato!r} (use {FORMATOS})")
+    processos = processos or os.cpu_count() or 1
+    opcoes = {"modo": modo, "formato": formato, "passo": passo, "duracao": duracao,
+              "apenas_final": apenas_final, "comparar": comparar}
+    if not comparar:
+        opcoes["heuristica"] = heuristica
+
+    pendentes: deque = deque()
+    usados: Set[str] = set()  # nomes de saída já dados neste lote
+
+    def ao_erro(fonte: str, linha: int, mensagem: str) -> None:
+        pendentes.append({"arquivo": fonte, "linha": linha, "erro": mensagem})
+
+    executor = (ProcessPoolExecutor(max_workers=processos, initializer=iniciar_sem_janela)
+                if processos > 1 else None)
+    limite = TAREFAS_POR_PROCESSO * processos
+    try:
+        for tabuleiro, inicio, objetivo, meta in ler_cenarios(caminhos, ao_erro):
+            nome = _sem_colisao(nome_saida(meta["fonte"], meta["linha"], formato), usados)
+            destino = os.path.join(pasta, nome)
+            tarefa = (meta["fonte"], meta["linha"], tabuleiro, inicio, objetivo, destino, opcoes)
+            pendentes.append(executor.submit(gravar_tarefa, tarefa) if executor
+                             else gravar_tarefa(tarefa))
+            while pendentes and (len(pendentes) > limite or not isinstance(pendentes[0], Future)):
+                item = pendentes.popleft()
+                yield item.result() if isinstance(item, Future) else item
+        while pendentes:
+            item = pendentes.popleft()
+            yield item.result() if isinstance(item, Future) else item
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+# -------------------------------------------------------------
+# Linha de comando
+# -------------------------------------------------------------
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.gravador_animacao",
+        description="Grava animações de busca (PNGs numerados ou GIF) sem abrir janela.")
+    parser.add_argument("caminhos", nargs="+",
+                        help="arquivos .json/.jsonl(.gz)/.tabb, diretórios ou - (entrada padrão)")
+    parser.add_argument("--saida", default="animacoes", help="pasta de destino (padrão: animacoes)")
+    parser.add_argument("--heuristica", default="h2", choices=sorted(HEURISTICAS))
+    parser.add_argument("--modo", default="unidirecional", choices=MODOS_BUSCA)
+    parser.add_argument("--comparar", action="store_true", help="H1 × H2 lado a lado")
+    parser.add_argument("--formato", default="png", choices=FORMATOS)
+    parser.add_argument("--passo", type=int, default=1, help="grava uma a cada N etapas")
+    parser.add_argument("--duracao", type=float, default=0.1, help="segundos por quadro no GIF")
+    parser.add_argument("--so-final", action="store_true",
+                        help="só o quadro final, com o caminho (miniatura)")
+    parser.add_argument("--processos", type=int, default=None,
+                        help="processos de trabalho (padrão: todos os núcleos)")
+    args = parser.parse_args(argv)
+
+    falhas = 0
+    for registro in gravar_lote(args.caminhos, args.saida, args.heuristica, args.modo, args.comparar,
+                                args.formato, args.passo, args.duracao, args.so_final,
+                                args.processos):
+        falhas += "erro" in registro
+        print(json.dumps(registro, ensure_ascii=False), flush=True)
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
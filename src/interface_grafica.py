@@ -2,9 +2,13 @@
 # interface_grafica.py — Interface otimizada com comparação H1 x H2
 # =============================================================
 
-import os, time, pygame, io, sys
+import os, pygame
+from collections import OrderedDict
+from dataclasses import dataclass
 from src.gerador_tabuleiro import gerar_tabuleiro_aleatorio
 from src.tabuleiro import Tabuleiro, Terreno
+from src.busca_a_estrela import busca_a_estrela, ColetorExplorados
+from src.linha_do_tempo import BuscaEmSegundoPlano, LinhaDoTempo
 
 # -------------------- CONFIGURAÇÕES VISUAIS --------------------
 CELULA = 65
@@ -13,7 +17,8 @@ BARRA_STATUS_H = 40
 MARGEM_EXTERNA = 25
 AREA_ROTULO = 28
 SETA_TAM = 18
-VELOCIDADE_PADRAO = 0.35
+VELOCIDADE_PADRAO = 0.35  # segundos por casa expandida, na velocidade 1x
+QUADROS_POR_SEGUNDO = 60
 os.environ["SDL_VIDEO_CENTERED"] = "1"
 
 def origem_tabuleiro():
@@ -25,16 +30,62 @@ LARGURA = (2*MARGEM_EXTERNA)+(2*AREA_ROTULO)+(BOARD_N*CELULA)
 ALTURA  = BARRA_STATUS_H+(2*MARGEM_EXTERNA)+(2*AREA_ROTULO)+(BOARD_N*CELULA)
 
 
+def iniciar_pygame():
+    """
+    Só o que as telas usam (vídeo e fontes): pygame.init() também abriria
+    o áudio e o joystick a cada troca de tela.
+    """
+    pygame.display.init()
+    pygame.font.init()
+
+
+# ------------------- CACHE DE FONTES E TEXTOS -------------------
+# Fontes do SysFont morrem com pygame.quit() (usá-las depois derruba o
+# processo), então esse cache é esvaziado no quit. Textos renderizados são
+# superfícies comuns e sobrevivem às trocas de tela.
+_fontes = {}
+_textos = OrderedDict()
+LIMITE_TEXTOS = 1024
+
+
+def _esquecer_fontes():
+    _fontes.clear()
+
+
+def fonte(nome="Arial", tamanho=18, negrito=False):
+    """pygame.font.SysFont guardado por (nome, tamanho, negrito)."""
+    chave = (nome, tamanho, negrito)
+    f = _fontes.get(chave)
+    if f is None:
+        if not _fontes:
+            pygame.register_quit(_esquecer_fontes)  # vale só para o próximo quit
+        f = _fontes[chave] = pygame.font.SysFont(nome, tamanho, bold=negrito)
+    return f
+
+
+def texto(conteudo, cor, nome="Arial", tamanho=18, negrito=False):
+    """
+    Superfície do texto renderizado, guardada (LRU) por conteúdo, cor e fonte.
+    Para rótulos e títulos; textos que mudam a cada quadro usam fonte().render.
+    """
+    chave = (conteudo, cor, nome, tamanho, negrito)
+    sup = _textos.get(chave)
+    if sup is None:
+        sup = _textos[chave] = fonte(nome, tamanho, negrito).render(conteudo, True, cor)
+        if len(_textos) > LIMITE_TEXTOS:
+            _textos.popitem(last=False)
+    else:
+        _textos.move_to_end(chave)
+    return sup
+
+
 # ------------------- TELA DE SELEÇÃO DE HEURÍSTICA -------------------
 def selecionar_heuristica():
-    pygame.init()
+    iniciar_pygame()
     largura, altura = 820, 590
     tela = pygame.display.set_mode((largura, altura), pygame.RESIZABLE)
     pygame.display.set_caption("Seleção de Heurística")
 
-    fonte_titulo = pygame.font.SysFont("Arial", 36, bold=True)
-    fonte_botao = pygame.font.SysFont("Arial", 22, bold=True)
-
     botoes = {
         "h1": pygame.Rect(largura//2 - 230, 170, 460, 60),
         "h2": pygame.Rect(largura//2 - 230, 260, 460, 60),
@@ -42,6 +93,13 @@ def selecionar_heuristica():
         "comparar": pygame.Rect(largura//2 - 230, 440, 460, 60),
         "voltar": pygame.Rect(largura//2 - 230, 520, 460, 60)
     }
+    rotulos = {
+        "h1": "H1 - Fraca (Distância × Custo Mínimo)",
+        "h2": "H2 - Forte (Movimentos × Custo Mínimo)",
+        "nula": "Sem Heurística (Dijkstra)",
+        "comparar": "Comparar H1 × H2 (modo visual)",
+        "voltar": "Voltar ao Menu"
+    }
 
     escolha = None
     clock = pygame.time.Clock()
@@ -60,22 +118,15 @@ def selecionar_heuristica():
                             rodando = False
 
         tela.fill((245,245,245))
-        titulo = fonte_titulo.render("Escolha a heurística para o A*", True, (0,0,0))
+        titulo = texto("Escolha a heurística para o A*", (0,0,0), tamanho=36, negrito=True)
         tela.blit(titulo, (largura//2 - titulo.get_width()//2, 70))
         for heur, rect in botoes.items():
             hover = rect.collidepoint(pygame.mouse.get_pos())
             cor = (120,160,240) if hover else (80,120,200)
             pygame.draw.rect(tela, cor, rect, border_radius=15)
-            label = {
-                "h1": "H1 - Fraca (Distância × Custo Mínimo)",
-                "h2": "H2 - Forte (Movimentos × Custo Mínimo)",
-                "nula": "Sem Heurística (Dijkstra)",
-                "comparar": "Comparar H1 × H2 (modo visual)",
-                "voltar": "Voltar ao Menu"
-            }[heur]
-            texto = fonte_botao.render(label, True, (255,255,255))
-            tela.blit(texto, (rect.centerx - texto.get_width()//2,
-                              rect.centery - texto.get_height()//2))
+            rotulo = texto(rotulos[heur], (255,255,255), tamanho=22, negrito=True)
+            tela.blit(rotulo, (rect.centerx - rotulo.get_width()//2,
+                               rect.centery - rotulo.get_height()//2))
         pygame.display.flip()
         clock.tick(30)
 
@@ -86,77 +137,301 @@ def selecionar_heuristica():
 
 # ------------------- BUSCA A* (ANIMADA) -------------------
 def busca_a_estrela_animado(tabuleiro, inicio, objetivo, tipo_heuristica="h1"):
-    import heapq
-    from src.busca_a_estrela import (
-        No, reconstruir_caminho, heuristica_h1, heuristica_h2, heuristica_nula
-    )
-    from src.cavalo import Cavalo
-
-    heuristicas = {"h1": heuristica_h1, "h2": heuristica_h2, "nula": heuristica_nula}
-    h_func = heuristicas.get(tipo_heuristica, heuristica_h1)
-
-    fila = []
-    heapq.heappush(fila, No(0, inicio, 0, 0, None))
-    g = {inicio: 0}
-    pais = {inicio: None}
-    explorados = []
-    fronteira = []
-
-    while fila:
-        atual = heapq.heappop(fila)
-        pos = atual.posicao
-        explorados.append(pos)
-        if pos == objetivo:
-            caminho = reconstruir_caminho(pais, pos)
-            return caminho, atual.g, explorados, fronteira
-        cavalo = Cavalo(pos)
-        for viz in cavalo.movimentos_possiveis(tabuleiro):
-            if tabuleiro.bloqueado(viz): continue
-            novo_g = atual.g + tabuleiro.custo(viz)
-            if viz not in g or novo_g < g[viz]:
-                g[viz] = novo_g
-                h = h_func(viz, objetivo, tabuleiro)
-                f = novo_g + h
-                heapq.heappush(fila, No(f, viz, novo_g, h, pos))
-                pais[viz] = pos
-                fronteira.append(viz)
-
-    return [], float("inf"), explorados, fronteira
+    """Roda busca_a_estrela coletando as casas expandidas e a fronteira para a animação."""
+    coletor = ColetorExplorados()
+    caminho, custo = busca_a_estrela(tabuleiro, inicio, objetivo, tipo_heuristica,
+                                     observador=coletor)
+    return caminho, custo, coletor.explorados, coletor.fronteira
 
 
 # ------------------- CARREGAMENTO DE IMAGENS -------------------
+# Cada arquivo é lido do disco uma vez e cada tamanho escalado uma vez por
+# processo: trocar de tela ("Voltar") ou de tabuleiro ("R") não relê os PNGs.
+# As superfícies convertidas sobrevivem ao pygame.quit() entre as telas.
+PASTA_ASSETS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+_originais = {}
+_imagens = {}
+
+
+def imagem(nome, tamanho):
+    """assets/<nome> escalado para tamanho x tamanho (guardado por nome e tamanho); None se não existe."""
+    chave = (nome, tamanho)
+    if chave not in _imagens:
+        if nome not in _originais:
+            caminho = os.path.join(PASTA_ASSETS, nome)
+            try:
+                _originais[nome] = pygame.image.load(caminho) if os.path.exists(caminho) else None
+            except pygame.error:
+                _originais[nome] = None
+        original = _originais[nome]
+        _imagens[chave] = (pygame.transform.smoothscale(original.convert_alpha(), (tamanho, tamanho))
+                           if original is not None else None)
+    return _imagens[chave]
+
+
+def esquecer_imagens():
+    """Esvazia o cache de imagens (os arquivos voltam a ser lidos do disco)."""
+    _originais.clear()
+    _imagens.clear()
+
+
 def carregar_imagens_terreno(tam):
-    pasta = "assets"
-    imgs = {}
-    def load(nome):
-        caminho = os.path.join(pasta, nome)
-        if os.path.exists(caminho):
-            img = pygame.image.load(caminho).convert_alpha()
-            return pygame.transform.smoothscale(img, (tam, tam))
-        return None
-    imgs[Terreno.ESTRADA] = load("areia.png")
-    imgs[Terreno.LAMA] = load("lama.png")
-    imgs[Terreno.BARREIRA] = load("barreira.png")
-    imgs[Terreno.TERRA] = None
-    imgs["inicio"] = load("inicio.png")
-    imgs["chegada"] = load("chegada.png")
-    return imgs
+    return {
+        Terreno.ESTRADA: imagem("areia.png", tam),
+        Terreno.LAMA: imagem("lama.png", tam),
+        Terreno.BARREIRA: imagem("barreira.png", tam),
+        Terreno.TERRA: None,
+        "inicio": imagem("inicio.png", tam),
+        "chegada": imagem("chegada.png", tam),
+    }
 
 
 def carregar_cavalo():
-    try:
-        img = pygame.image.load("assets/cavalo.png").convert_alpha()
-        return pygame.transform.smoothscale(img, (CELULA - 8, CELULA - 8))
-    except:
-        return None
+    return imagem("cavalo.png", CELULA - 8)
+
+
+# ------------------- CAMADA ESTÁTICA DO TABULEIRO -------------------
+@dataclass(frozen=True)
+class EstiloTabuleiro:
+    """Aparência de um tabuleiro na tela (faz parte da chave do cache da camada)."""
+    celula: int
+    cor_clara: tuple
+    cor_escura: tuple
+    cor_fundo: tuple
+    tamanho_rotulo: int
+    rotulo_topo: int        # distância dos rótulos de coluna acima das casas
+    rotulo_esquerda: int    # distância dos rótulos de linha à esquerda das casas
+    borda: bool
+    raio_explorado: int
+    cor_explorado: tuple
+    raio_caminho: int
+    largura_linha: int
+    numerar_caminho: bool
+    manter_explorados: bool  # ao terminar, os explorados continuam na tela
+
+ESTILO_PRINCIPAL = EstiloTabuleiro(
+    celula=CELULA, cor_clara=(245, 222, 179), cor_escura=(101, 67, 33), cor_fundo=(255, 255, 255),
+    tamanho_rotulo=18, rotulo_topo=AREA_ROTULO, rotulo_esquerda=AREA_ROTULO - 5, borda=True,
+    raio_explorado=6, cor_explorado=(220, 0, 0), raio_caminho=10, largura_linha=4,
+    numerar_caminho=True, manter_explorados=False)
+
+ESTILO_COMPARATIVO = EstiloTabuleiro(
+    celula=48, cor_clara=(255, 255, 255), cor_escura=(0, 0, 0), cor_fundo=(240, 240, 240),
+    tamanho_rotulo=14, rotulo_topo=20, rotulo_esquerda=20, borda=False,
+    raio_explorado=5, cor_explorado=(255, 0, 0), raio_caminho=6, largura_linha=3,
+    numerar_caminho=False, manter_explorados=True)
+
+# a camada inclui uma moldura para rótulos e borda em volta das casas
+MARGEM_CAMADA = AREA_ROTULO
+COR_CAMINHO = (255, 255, 0)
+
+
+def camada_estatica(tabuleiro, inicio, objetivo, estilo):
+    """
+    Superfície com tudo o que não muda durante a animação: casas, imagens de
+    terreno, rótulos, borda, início e chegada. Desenhada uma vez por
+    tabuleiro e estilo e guardada no próprio tabuleiro (descartada quando
+    um terreno muda).
+    """
+    return tabuleiro.derivado(("camada_gui", estilo, tuple(inicio), tuple(objetivo)),
+                              lambda: _desenhar_camada(tabuleiro, inicio, objetivo, estilo),
+                              por_objetivo=True)
+
+
+def _desenhar_camada(tabuleiro, inicio, objetivo, estilo):
+    c, m = estilo.celula, MARGEM_CAMADA
+    linhas, colunas = tabuleiro.linhas, tabuleiro.colunas
+    camada = pygame.Surface((colunas*c + 2*m, linhas*c + 2*m)).convert()
+    camada.fill(estilo.cor_fundo)
+    imgs = carregar_imagens_terreno(c)
+    for lin in range(linhas):
+        for col in range(colunas):
+            cor = estilo.cor_clara if (lin+col)%2==0 else estilo.cor_escura
+            pygame.draw.rect(camada, cor, (m+col*c, m+lin*c, c, c))
+            img = imgs.get(tabuleiro.tipo_terreno((lin, col)))
+            if img: camada.blit(img, (m+col*c, m+lin*c))
+
+    # rótulos: letras nas colunas, números nas linhas (1 embaixo, como no xadrez)
+    for col in range(colunas):
+        letra = texto(chr(ord("A") + col), (0,0,0), tamanho=estilo.tamanho_rotulo, negrito=True)
+        x = m + col*c + c//2 - letra.get_width()//2
+        camada.blit(letra, (x, m - estilo.rotulo_topo))
+        camada.blit(letra, (x, m + linhas*c + 5))
+    for lin in range(linhas):
+        num = texto(str(linhas - lin), (0,0,0), tamanho=estilo.tamanho_rotulo, negrito=True)
+        y = m + lin*c + c//2 - num.get_height()//2
+        camada.blit(num, (m - estilo.rotulo_esquerda, y))
+        camada.blit(num, (m + colunas*c + 8, y))
+
+    if estilo.borda:
+        pygame.draw.rect(camada, (80, 50, 20), (m - 4, m - 4, colunas*c + 8, linhas*c + 8), 6)
+        pygame.draw.rect(camada, (212, 175, 55), (m, m, colunas*c, linhas*c), 4)
+
+    if imgs.get("inicio"):
+        camada.blit(imgs["inicio"], (m + inicio[1]*c, m + inicio[0]*c))
+    if imgs.get("chegada"):
+        camada.blit(imgs["chegada"], (m + objetivo[1]*c, m + objetivo[0]*c))
+    return camada
+
+
+class QuadroBusca:
+    """
+    Um tabuleiro animado na tela. A camada estática vem do cache e os pontos
+    explorados são acumulados numa cópia dela, então cada quadro só desenha o
+    que mudou (pontos novos e o cavalo) e devolve os retângulos sujos para
+    pygame.display.update. (x0, y0) é o canto da primeira casa na tela.
+    """
+
+    def __init__(self, tabuleiro, inicio, objetivo, estilo, x0, y0, cavalo_img=None):
+        self.estilo = estilo
+        self.fundo = camada_estatica(tabuleiro, inicio, objetivo, estilo)
+        self.retangulo = self.fundo.get_rect(topleft=(x0 - MARGEM_CAMADA, y0 - MARGEM_CAMADA))
+        self.cavalo_img = cavalo_img
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Volta ao início da animação (sem explorados nem caminho)."""
+        self._camada = self.fundo.copy()  # fundo + explorados já mostrados
+        self._mostrados = 0
+        self.finalizado = False
+        self._cavalo = None               # retângulo do cavalo, em coordenadas da camada
+        self._completo = True             # o próximo desenho cobre o quadro inteiro
+
+    def invalidar(self):
+        """A tela foi apagada por outra coisa: o próximo desenho cobre o quadro inteiro."""
+        self._completo = True
+
+    def _centro(self, pos):
+        c, m = self.estilo.celula, MARGEM_CAMADA
+        return m + pos[1]*c + c//2, m + pos[0]*c + c//2
+
+    def _retangulo_cavalo(self, pos):
+        if self.cavalo_img is None:
+            return None
+        return self.cavalo_img.get_rect(center=self._centro(pos))
+
+    def desenhar(self, tela, explorados, etapa, pos_cavalo, caminho=None):
+        """
+        Atualiza o quadro até `etapa` casas exploradas, com o cavalo em
+        `pos_cavalo`. Com `caminho`, a busca terminou: o caminho final é
+        desenhado por cima (e, sem manter_explorados, os explorados somem).
+        Devolve os retângulos da tela que mudaram.
+        """
+        sujos = []
+        if caminho is not None:
+            if not self.finalizado:
+                if self.estilo.manter_explorados:
+                    self._marcar(explorados, len(explorados), [])
+                else:
+                    self._camada = self.fundo.copy()
+                cavalo = self._retangulo_cavalo(pos_cavalo)
+                if cavalo is not None:
+                    self._camada.blit(self.cavalo_img, cavalo)
+                self._desenhar_caminho(caminho)
+                self.finalizado, self._cavalo, self._completo = True, None, True
+        else:
+            if etapa < self._mostrados or self.finalizado:
+                self.reiniciar()
+            self._marcar(explorados, etapa, sujos)
+
+        if self._completo:
+            tela.blit(self._camada, self.retangulo)
+            sujos = [self.retangulo.copy()]
+            self._completo = False
+        else:
+            if self._cavalo is not None:
+                sujos.append(self._cavalo)
+            for r in sujos:  # copia da camada (apaga também o cavalo anterior)
+                tela.blit(self._camada, r.move(self.retangulo.topleft), area=r)
+            sujos = [r.move(self.retangulo.topleft) for r in sujos]
+
+        if not self.finalizado:
+            self._cavalo = self._retangulo_cavalo(pos_cavalo)
+            if self._cavalo is not None:
+                sujos.append(tela.blit(self.cavalo_img, self._cavalo.move(self.retangulo.topleft)))
+        return sujos
+
+    def desenhar_rota(self, tela, rota):
+        """
+        Mostra uma rota_pontos.RotaPontos já calculada: o caminho costurado
+        e, em cada ponto de passagem, um anel com a posição dele na ordem.
+        Devolve o retângulo da tela que mudou.
+        """
+        self.reiniciar()
+        self._desenhar_caminho(rota.caminho)
+        raio = self.estilo.celula // 2 - 2
+        for n, pos in enumerate(rota.visitados, start=1):
+            cx, cy = self._centro(pos)
+            pygame.draw.circle(self._camada, (0, 0, 0), (cx, cy), raio, 3)
+            num = texto(str(n), (0, 0, 0), tamanho=18, negrito=True)
+            self._camada.blit(num, (cx + raio - num.get_width(), cy - raio))
+        self.finalizado = True
+        tela.blit(self._camada, self.retangulo)
+        self._completo = False
+        return self.retangulo.copy()
+
+    def _marcar(self, explorados, etapa, sujos):
+        r = self.estilo.raio_explorado
+        ate = min(etapa, len(explorados))
+        for pos in explorados[self._mostrados:ate]:
+            cx, cy = self._centro(pos)
+            pygame.draw.circle(self._camada, self.estilo.cor_explorado, (cx, cy), r)
+            sujos.append(pygame.Rect(cx - r, cy - r, 2*r + 1, 2*r + 1))
+        self._mostrados = max(self._mostrados, ate)
+
+    def _desenhar_caminho(self, caminho):
+        e = self.estilo
+        centros = [self._centro(pos) for pos in caminho]
+        for i, (cx1, cy1) in enumerate(centros):
+            pygame.draw.circle(self._camada, COR_CAMINHO, (cx1, cy1), e.raio_caminho)
+            if e.numerar_caminho:
+                num = texto(str(i+1), (0,0,0), tamanho=22, negrito=True)
+                self._camada.blit(num, (cx1 - num.get_width()//2, cy1 - num.get_height()//2))
+            if i < len(centros)-1:
+                pygame.draw.line(self._camada, COR_CAMINHO, (cx1, cy1), centros[i+1], e.largura_linha)
+
+
+def desenhar_botao(tela, rect, rotulo, tamanho, negrito=False):
+    """Botão azul com realce sob o mouse; devolve o retângulo (sujo)."""
+    hover = rect.collidepoint(pygame.mouse.get_pos())
+    pygame.draw.rect(tela, (100,150,255) if hover else (70,120,200), rect, border_radius=8)
+    txt = texto(rotulo, (255,255,255), tamanho=tamanho, negrito=negrito)
+    tela.blit(txt, (rect.centerx - txt.get_width()//2, rect.centery - txt.get_height()//2))
+    return rect
+
+
+# ------------------- CONTROLE DA ANIMAÇÃO -------------------
+def tratar_tecla_animacao(linha, tecla):
+    """
+    Teclas comuns às telas animadas: ESPAÇO pausa, ←/→ passo a passo,
+    ↑/↓ (ou +/-) velocidade, F/END mostra tudo. Devolve False se a tecla
+    não for de controle da animação.
+    """
+    if tecla == pygame.K_SPACE:
+        linha.alternar_pausa()
+    elif tecla == pygame.K_RIGHT:
+        linha.passo(1)
+    elif tecla == pygame.K_LEFT:
+        linha.passo(-1)
+    elif tecla in (pygame.K_UP, pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+        linha.acelerar()
+    elif tecla in (pygame.K_DOWN, pygame.K_MINUS, pygame.K_KP_MINUS):
+        linha.desacelerar()
+    elif tecla in (pygame.K_f, pygame.K_END):
+        linha.avancar_ate_o_fim()
+    else:
+        return False
+    return True
 
 
 # ------------------- RELATÓRIO SOBREPOSTO -------------------
-def mostrar_relatorio_sobreposto_texto(tela, texto, titulo="Relatório"):
-    fonte = pygame.font.SysFont("Consolas", 14)
-    fonte_titulo = pygame.font.SysFont("Arial", 24, bold=True)
+def mostrar_relatorio_sobreposto_texto(tela, texto_relatorio, titulo="Relatório"):
     largura, altura = tela.get_size()
-    linhas = texto.split("\n")
+    # cada linha é renderizada uma vez; o scroll só muda onde ela é colada
+    fonte_linhas = fonte("Consolas", 14)
+    linhas = [fonte_linhas.render(linha, True, (20, 20, 20)) for linha in texto_relatorio.split("\n")]
+    titulo_txt = texto(titulo, (0, 0, 0), tamanho=24, negrito=True)
+    txt_btn = texto("Voltar", (255, 255, 255), tamanho=24, negrito=True)
     scroll_y = 0
     botao_rect = pygame.Rect(largura//2 - 80, altura - 60, 160, 40)
     clock = pygame.time.Clock()
@@ -172,22 +447,19 @@ def mostrar_relatorio_sobreposto_texto(tela, texto, titulo="Relatório"):
                     rodando = False
             elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
                 if botao_rect.collidepoint(e.pos):
-                    rodando = False 
+                    rodando = False
                     return
 
         tela.fill((245, 245, 245))
-        titulo_txt = fonte_titulo.render(titulo, True, (0, 0, 0))
         tela.blit(titulo_txt, (largura//2 - titulo_txt.get_width()//2, 20))
         y = 70 + scroll_y
-
-        for linha in linhas:
-            txt = fonte.render(linha, True, (20, 20, 20))
-            tela.blit(txt, (40, y))
+        for txt in linhas:
+            if -20 < y < altura:
+                tela.blit(txt, (40, y))
             y += 20
 
         # Desenhando o botão Voltar
         pygame.draw.rect(tela, (80, 120, 200), botao_rect, border_radius=10)
-        txt_btn = fonte_titulo.render("Voltar", True, (255, 255, 255))
         tela.blit(txt_btn, (botao_rect.centerx - txt_btn.get_width()//2,
                             botao_rect.centery - txt_btn.get_height()//2))
 
@@ -196,120 +468,96 @@ def mostrar_relatorio_sobreposto_texto(tela, texto, titulo="Relatório"):
 
 
 # ------------------- MODO COMPARATIVO -------------------
-def comparar_heuristicas(tabuleiro: Tabuleiro, inicio, objetivo, velocidade=0.35):
-    import heapq
-    from src.busca_a_estrela import No, reconstruir_caminho, heuristica_h1, heuristica_h2
-    from src.cavalo import Cavalo
-    from src.relatorio_custos import gerar_relatorio_caminho
+def fundo_comparativo(tamanho, xs, largura_tab, y_resultados, relatorios=(None, None)):
+    """
+    Fundo da comparação H1 × H2 (título, nomes e, com os relatórios, custo e
+    nós de cada busca): o que não muda durante a animação. `xs` é a coluna
+    da primeira casa de cada tabuleiro.
+    """
+    largura_total, altura_total = tamanho
+    fundo = pygame.Surface(tamanho).convert()
+    fundo.fill((240,240,240))
+    pygame.draw.rect(fundo, (30,30,30), (0,0,largura_total,60))
+    titulo = texto("Comparação Visual — H1 (esquerda) × H2 (direita)", (255,255,255), tamanho=24, negrito=True)
+    fundo.blit(titulo, (largura_total//2 - titulo.get_width()//2, 15))
+    for x_off, nome, cor in zip(xs, ("H1 - Fraca", "H2 - Forte"), ((60,120,255), (255,120,60))):
+        nome_txt = texto(nome, cor, tamanho=24, negrito=True)
+        fundo.blit(nome_txt, (x_off + largura_tab//2 - nome_txt.get_width()//2, 70))
+    for x_off, nome, r in zip(xs, ("H1", "H2"), relatorios):
+        resultado = (f"{nome} → Custo {r.custo_total:.2f} | Nós {r.expandidos}" if r
+                     else f"{nome} → buscando...")
+        fundo.blit(texto(resultado, (0,0,0), tamanho=18, negrito=True), (x_off, y_resultados))
+    return fundo
+
+
+def comparar_heuristicas(tabuleiro: Tabuleiro, inicio, objetivo, velocidade=VELOCIDADE_PADRAO):
+    from src.relatorio_custos import montar_relatorio, formatar_texto, formatar_comparativo
     from src.gerador_tabuleiro import gerar_tabuleiro_aleatorio
 
-    def executar_busca(tab, heur):
-        fila = []
-        heapq.heappush(fila, No(0, inicio, 0, 0, None))
-        g = {inicio: 0}
-        pais = {inicio: None}
-        explorados = []
-        while fila:
-            atual = heapq.heappop(fila)
-            pos = atual.posicao
-            explorados.append(pos)
-            if pos == objetivo:
-                caminho = reconstruir_caminho(pais, pos)
-                return caminho, atual.g, explorados
-            cavalo = Cavalo(pos)
-            for viz in cavalo.movimentos_possiveis(tab):
-                if tabuleiro.bloqueado(viz): continue
-                novo_g = atual.g + tabuleiro.custo(viz)
-                if viz not in g or novo_g < g[viz]:
-                    g[viz] = novo_g
-                    h = heur(viz, objetivo, tabuleiro)
-                    f = novo_g + h
-                    heapq.heappush(fila, No(f, viz, novo_g, h, pos))
-                    pais[viz] = pos
-        return [], float("inf"), explorados
-
     # função que desenha e trata eventos (permite recursão p/ "R")
     def executar_comparativo(tab):
-        pygame.init()
+        iniciar_pygame()
         largura_total, altura_total = 1150, 700
         tela = pygame.display.set_mode((largura_total, altura_total))
         pygame.display.set_caption("Comparativo de Heurísticas — H1 × H2")
-        fonte_titulo = pygame.font.SysFont("Arial", 24, bold=True)
-        fonte_info = pygame.font.SysFont("Arial", 18, bold=True)
-        fonte_hint = pygame.font.SysFont("Arial", 16)
         clock = pygame.time.Clock()
-        celula, margem, offset_y = 48, 40, 120
+        celula, offset_y = ESTILO_COMPARATIVO.celula, 120
         largura_tab = 8 * celula
-        imgs = carregar_imagens_terreno(celula)
         cavalo_img = carregar_cavalo()
 
         # Centralizar os tabuleiros
         tabuleiro_h1_x = (largura_total - 2 * largura_tab - 40) // 2
         tabuleiro_h2_x = tabuleiro_h1_x + largura_tab + 80
 
-        # execuções
-        c1, custo1, e1 = executar_busca(tab, heuristica_h1); 
-        c2, custo2, e2 = executar_busca(tab, heuristica_h2); 
-        
-        etapa, max_etapas, terminou = 0, max(len(e1), len(e2)), False
+        # as duas buscas rodam em segundo plano (na hora, se já estiverem no cache)
+        buscas = [BuscaEmSegundoPlano(tab, inicio, objetivo, "h1"),
+                  BuscaEmSegundoPlano(tab, inicio, objetivo, "h2")]
+        linha = LinhaDoTempo(velocidade)
+        relatorio1 = relatorio2 = None
 
-        # Detalhes do relatório comparativo
-        ganho_nos = 100 * (1 - len(e2)/len(e1)) if len(e1) else 0
-        h1_media_custo = custo1 / len(e1) if e1 else 0
-        h2_media_custo = custo2 / len(e2) if e2 else 0
-        h1_num_movimentos = len(c1)
-        h2_num_movimentos = len(c2)
+        def montar_fundo():
+            return fundo_comparativo((largura_total, altura_total), (tabuleiro_h1_x, tabuleiro_h2_x),
+                                     largura_tab, altura_total - 160, (relatorio1, relatorio2))
+
+        fundo = montar_fundo()
+        quadros = [QuadroBusca(tab, inicio, objetivo, ESTILO_COMPARATIVO, tabuleiro_h1_x, offset_y, cavalo_img),
+                   QuadroBusca(tab, inicio, objetivo, ESTILO_COMPARATIVO, tabuleiro_h2_x, offset_y, cavalo_img)]
+        BOTAO_VOLTAR = pygame.Rect(largura_total//2 - 80, altura_total - 60, 160, 40)
+        area_velocidade = pygame.Rect(largura_total - 170, 0, 170, 60)
+        tela_inteira, terminou = True, False
+
+        def cancelar_buscas():
+            for busca in buscas:
+                busca.cancelar()
 
         while True:
+            dt = clock.tick(QUADROS_POR_SEGUNDO) / 1000
             for e in pygame.event.get():
-                if e.type == pygame.QUIT: pygame.quit(); return
+                if e.type == pygame.QUIT: cancelar_buscas(); pygame.quit(); return
                 if e.type == pygame.KEYDOWN:
                     if e.key == pygame.K_RETURN and terminou:
-
-                        buffer = io.StringIO()
-                        antigo = sys.stdout
-                        sys.stdout = buffer
-
-                        print("\n=== RELATÓRIO H1 ===\n")
-                        gerar_relatorio_caminho(tab, c1, custo1, heuristica="h1")
-                        sys.stdout = antigo
-                        mostrar_relatorio_sobreposto_texto(tela, buffer.getvalue(), titulo="Relatório H1")
-
-                        buffer = io.StringIO()
-                        antigo = sys.stdout
-                        sys.stdout = buffer
-
-                        print("\n=== RELATÓRIO H2 ===\n")
-                        gerar_relatorio_caminho(tab, c2, custo2, heuristica="h2")
-                        sys.stdout = antigo
-                        mostrar_relatorio_sobreposto_texto(tela, buffer.getvalue(), titulo="Relatório H2")
-
-                        buffer = io.StringIO()
-                        antigo = sys.stdout
-                        sys.stdout = buffer
-
-                        print("\n=== RELATÓRIO COMPARATIVO DE HEURÍSTICAS ===\n")
-                        # Relatório detalhado comparativo
-                        print(f"H1 (Fraca) - Custo: {custo1:.2f} | Nós Expandidos: {len(e1)} | Custo Médio por Nó: {h1_media_custo:.2f} | Movimentos: {h1_num_movimentos}")
-                        print(f"H2 (Forte) - Custo: {custo2:.2f} | Nós Expandidos: {len(e2)} | Custo Médio por Nó: {h2_media_custo:.2f} | Movimentos: {h2_num_movimentos}")
-                        print(f"\nComparação entre as heurísticas:")
-                        print(f"H2 expandiu {abs(ganho_nos):.1f}% {'menos' if ganho_nos>0 else 'mais'} nós.")
-                
-                        print(f"\nResumo Comparativo:")
-                        print(f"H1 teve {h1_num_movimentos} movimentos e H2 teve {h2_num_movimentos} movimentos.")
-                        print(f"H2 foi {'mais eficiente' if ganho_nos > 0 else 'menos eficiente'} com relação ao número de nós expandidos.")
-                        print(f"H1 tem um custo médio de {h1_media_custo:.2f} por nó, enquanto H2 tem {h2_media_custo:.2f}.")
-                        sys.stdout = antigo
-                        mostrar_relatorio_sobreposto_texto(tela, buffer.getvalue(), titulo="Relatório Comparativo H1 × H2")
+                        mostrar_relatorio_sobreposto_texto(
+                            tela, "\n=== RELATÓRIO H1 ===\n\n" + formatar_texto(relatorio1), titulo="Relatório H1")
+                        mostrar_relatorio_sobreposto_texto(
+                            tela, "\n=== RELATÓRIO H2 ===\n\n" + formatar_texto(relatorio2), titulo="Relatório H2")
+                        mostrar_relatorio_sobreposto_texto(
+                            tela, formatar_comparativo(relatorio1, relatorio2),
+                            titulo="Relatório Comparativo H1 × H2")
+                        tela_inteira = True
 
                     elif e.key == pygame.K_r:
+                        cancelar_buscas()
                         novo = gerar_tabuleiro_aleatorio()
                         executar_comparativo(novo)
                         return
 
+                    elif tratar_tecla_animacao(linha, e.key) and terminou:
+                        tela_inteira = True  # pode voltar à animação: apaga a dica
+
                 # Verifica se o botão "Voltar" foi pressionado
                 if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
                     if BOTAO_VOLTAR.collidepoint(e.pos):
+                        cancelar_buscas()
                         # Chama a tela de heurísticas novamente
                         tipo = selecionar_heuristica()
                         if tipo == "comparar":
@@ -318,81 +566,42 @@ def comparar_heuristicas(tabuleiro: Tabuleiro, inicio, objetivo, velocidade=0.35
                             mostrar_busca_animada(tabuleiro, inicio, objetivo, velocidade)
                         return
 
-            # desenho
-            tela.fill((240,240,240))
-            pygame.draw.rect(tela, (30,30,30), (0,0,largura_total,60))
-            titulo = fonte_titulo.render("Comparação Visual — H1 (esquerda) × H2 (direita)", True, (255,255,255))
-            tela.blit(titulo, (largura_total//2 - titulo.get_width()//2, 15))
-
-            def desenhar(x_off, explorados, caminho, nome, cor):
-                titulo = fonte_titulo.render(nome, True, cor)
-                tela.blit(titulo, (x_off + largura_tab//2 - titulo.get_width()//2, 70))
-                letras = ["A","B","C","D","E","F","G","H"]
-                for l in range(8):
-                    for c in range(8):
-                        corq = (255,255,255) if (l+c)%2==0 else (0,0,0)
-                        pygame.draw.rect(tela, corq, (x_off+c*celula, offset_y+l*celula, celula, celula))
-                        img = imgs.get(tab.grade[l][c])
-                        if img: tela.blit(img, (x_off+c*celula, offset_y+l*celula))
-                # rótulos
-                fonte_rot = pygame.font.SysFont("Arial", 14, bold=True)
-                for i in range(8):
-                    letra = fonte_rot.render(letras[i], True, (0,0,0))
-                    num = fonte_rot.render(str(8-i), True, (0,0,0))
-                    tela.blit(letra, (x_off + i*celula + celula//2 - letra.get_width()//2, offset_y - 20))
-                    tela.blit(letra, (x_off + i*celula + celula//2 - letra.get_width()//2, offset_y + 8*celula + 5))
-                    tela.blit(num, (x_off - 20, offset_y + i*celula + celula//2 - num.get_height()//2))
-                    tela.blit(num, (x_off + 8*celula + 8, offset_y + i*celula + celula//2 - num.get_height()//2))
-                # inicio e chegada
-                if imgs.get("inicio"):
-                    tela.blit(imgs["inicio"], (x_off + inicio[1]*celula, offset_y + inicio[0]*celula))
-                if imgs.get("chegada"):
-                    tela.blit(imgs["chegada"], (x_off + objetivo[1]*celula, offset_y + objetivo[0]*celula))
-                # explorados
-                for (l,c) in explorados[:min(etapa, len(explorados))]:
-                    cx = x_off + c*celula + celula//2
-                    cy = offset_y + l*celula + celula//2
-                    pygame.draw.circle(tela, (255,0,0), (cx,cy), 5)
-                # cavalo
+            # o estado das buscas é lido antes das listas: nada publicado depois escapa
+            concluidas = all([busca.esperar(0) for busca in buscas])
+            if concluidas and relatorio1 is None:
+                relatorio1, relatorio2 = (
+                    montar_relatorio(tab, b.caminho, b.custo, heuristica=h, expandidos=len(b.explorados))
+                    for b, h in zip(buscas, ("h1", "h2")))
+                fundo, tela_inteira = montar_fundo(), True
+            etapa = linha.atualizar(dt, max(len(b.explorados) for b in buscas))
+            terminou = concluidas and etapa >= max(len(b.explorados) for b in buscas)
+
+            # desenho: só o que mudou desde o quadro anterior
+            sujos = []
+            if tela_inteira:
+                tela.blit(fundo, (0, 0))
+                for quadro in quadros:
+                    quadro.invalidar()
+            for quadro, busca in zip(quadros, buscas):
+                explorados = busca.explorados
                 pos = explorados[min(etapa, len(explorados)-1)] if explorados else inicio
-                cx = x_off + pos[1]*celula + celula//2
-                cy = offset_y + pos[0]*celula + celula//2
-                if cavalo_img: tela.blit(cavalo_img, (cx - cavalo_img.get_width()//2, cy - cavalo_img.get_height()//2))
-                if terminou:
-                    for i,(l,c) in enumerate(caminho):
-                        cx1 = x_off + c*celula + celula//2
-                        cy1 = offset_y + l*celula + celula//2
-                        pygame.draw.circle(tela, (255,255,0), (cx1,cy1), 6)
-                        if i < len(caminho)-1:
-                            l2,c2 = caminho[i+1]
-                            cx2 = x_off + c2*celula + celula//2
-                            cy2 = offset_y + l2*celula + celula//2
-                            pygame.draw.line(tela,(255,255,0),(cx1,cy1),(cx2,cy2),3)
-
-            desenhar(tabuleiro_h1_x, e1, c1, "H1 - Fraca", (60,120,255))
-            desenhar(tabuleiro_h2_x, e2, c2, "H2 - Forte", (255,120,60))
-
-            tela.blit(fonte_info.render(f"H1 → Custo {custo1:.2f} | Nós {len(e1)}", True, (0,0,0)), (tabuleiro_h1_x, altura_total - 160))
-            tela.blit(fonte_info.render(f"H2 → Custo {custo2:.2f} | Nós {len(e2)}", True, (0,0,0)), (tabuleiro_h2_x, altura_total - 160))
-
-            # ====== BOTÃO VOLTAR ======
-            BOTAO_VOLTAR = pygame.Rect(largura_total//2 - 80, altura_total - 60, 160, 40)
-            mouse = pygame.mouse.get_pos()
-            hover = BOTAO_VOLTAR.collidepoint(mouse)
-            cor_btn = (100,150,255) if hover else (70,120,200)
-            pygame.draw.rect(tela, cor_btn, BOTAO_VOLTAR, border_radius=8)
-            texto_voltar = fonte_hint.render("Voltar", True, (255,255,255))
-            tela.blit(texto_voltar, (BOTAO_VOLTAR.centerx - texto_voltar.get_width()//2, BOTAO_VOLTAR.centery - texto_voltar.get_height()//2))
+                sujos += quadro.desenhar(tela, explorados, etapa, pos, busca.caminho if terminou else None)
+            sujos.append(desenhar_botao(tela, BOTAO_VOLTAR, "Voltar", 16))
+
+            tela.blit(fundo, area_velocidade, area=area_velocidade)
+            velocidade_txt = texto(f"Velocidade: {linha.descricao()}", (255,255,255), tamanho=16)
+            tela.blit(velocidade_txt, (area_velocidade.x, area_velocidade.centery - velocidade_txt.get_height()//2))
+            sujos.append(area_velocidade)
 
             if terminou:
-                dica = fonte_hint.render("Pressione ENTER para relatório | R para novo tabuleiro", True, (60,60,60))
-                tela.blit(dica, (largura_total//2 - dica.get_width()//2, altura_total - 100))
+                dica = texto("Pressione ENTER para relatório | R para novo tabuleiro", (60,60,60), tamanho=16)
+                sujos.append(tela.blit(dica, (largura_total//2 - dica.get_width()//2, altura_total - 100)))
 
-            pygame.display.flip()
-            clock.tick(30)
-            time.sleep(velocidade)
-            if etapa < max_etapas: etapa += 1
-            else: terminou = True
+            if tela_inteira:
+                pygame.display.flip()
+                tela_inteira = False
+            else:
+                pygame.display.update(sujos)
 
     executar_comparativo(tabuleiro)
 
@@ -409,50 +618,50 @@ def mostrar_busca_animada(tabuleiro: Tabuleiro, inicio, objetivo, velocidade=VEL
         comparar_heuristicas(tabuleiro, inicio, objetivo, velocidade)
         return
 
-    pygame.init()
+    iniciar_pygame()
     tela = pygame.display.set_mode((LARGURA, ALTURA))
     pygame.display.set_caption("Caminho do Cavalo - A* (interface interativa)")
-    fonte_status = pygame.font.SysFont("Arial", 18, bold=True)
-    fonte_passos = pygame.font.SysFont("Arial", 22, bold=True)
-    fonte_caminho = pygame.font.SysFont("Consolas", 18)
-    fonte_rotulo = pygame.font.SysFont("Arial", 18, bold=True)
-    fonte_botao = pygame.font.SysFont("Arial", 20, bold=True)
-    imgs = carregar_imagens_terreno(CELULA)
+    fonte_status = fonte("Arial", 18, negrito=True)
+    fonte_caminho = fonte("Consolas", 18)
     cavalo_img = carregar_cavalo()
-
-    # 🎨 Cores
-    COR_BEGE = (245, 222, 179)
-    COR_MARROM = (101, 67, 33)
-    COR_BORDA_EXTERNA = (80, 50, 20)
-    COR_BORDA_INTERNA = (212, 175, 55)
-    cor_caminho, cor_explorado = (255,255,0), (220,0,0)
+    letras = ["A","B","C","D","E","F","G","H"]
 
     x0, y0 = origem_tabuleiro()
     clock = pygame.time.Clock()
 
     # botão voltar (superior direito)
     BOTAO_VOLTAR = pygame.Rect(LARGURA - 130, 5, 110, 30)
+    barra = pygame.Rect(0, 0, LARGURA, BARRA_STATUS_H)
 
-    caminho, custo, explorados, _ = busca_a_estrela_animado(tabuleiro, inicio, objetivo, tipo)
-    etapa, rodando = 0, True
+    # a busca roda em segundo plano: a janela anima as casas assim que saem
+    busca = BuscaEmSegundoPlano(tabuleiro, inicio, objetivo, tipo)
+    quadro = QuadroBusca(tabuleiro, inicio, objetivo, ESTILO_PRINCIPAL, x0, y0, cavalo_img)
+    linha = LinhaDoTempo(velocidade)
+    rodando, tela_inteira = True, True
     while rodando:
+        dt = clock.tick(QUADROS_POR_SEGUNDO) / 1000
         for e in pygame.event.get():
             if e.type == pygame.QUIT:
                 rodando = False
             if e.type == pygame.KEYDOWN and e.key == pygame.K_r:
+                busca.cancelar()
                 tabuleiro = gerar_tabuleiro_aleatorio()
-                caminho, custo, explorados, _ = busca_a_estrela_animado(tabuleiro, inicio, objetivo, tipo)
-                etapa = 0
-            if e.type == pygame.KEYDOWN and e.key == pygame.K_RETURN and etapa >= len(explorados):
-                from src.relatorio_custos import gerar_relatorio_caminho
-                buffer = io.StringIO()
-                antigo = sys.stdout
-                sys.stdout = buffer
-                gerar_relatorio_caminho(tabuleiro, caminho, custo, heuristica=tipo)
-                sys.stdout = antigo
-                mostrar_relatorio_sobreposto_texto(tela, buffer.getvalue(), titulo="Relatório Analítico")
+                busca = BuscaEmSegundoPlano(tabuleiro, inicio, objetivo, tipo)
+                quadro = QuadroBusca(tabuleiro, inicio, objetivo, ESTILO_PRINCIPAL, x0, y0, cavalo_img)
+                linha.reiniciar()
+                tela_inteira = True
+            elif e.type == pygame.KEYDOWN and e.key == pygame.K_RETURN and quadro.finalizado:
+                from src.relatorio_custos import montar_relatorio, formatar_texto
+                relatorio = montar_relatorio(tabuleiro, busca.caminho, busca.custo, heuristica=tipo,
+                                             expandidos=len(busca.explorados))
+                mostrar_relatorio_sobreposto_texto(tela, formatar_texto(relatorio),
+                                                   titulo="Relatório Analítico")
+                tela_inteira = True
+            elif e.type == pygame.KEYDOWN and tratar_tecla_animacao(linha, e.key):
+                tela_inteira = tela_inteira or quadro.finalizado  # pode voltar à animação
             if e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
                 if BOTAO_VOLTAR.collidepoint(e.pos):
+                    busca.cancelar()
                     pygame.quit()
                     # retorna ao menu principal
                     tipo = selecionar_heuristica()
@@ -462,80 +671,43 @@ def mostrar_busca_animada(tabuleiro: Tabuleiro, inicio, objetivo, velocidade=VEL
                         mostrar_busca_animada(tabuleiro, inicio, objetivo, velocidade)
                     return
 
-        tela.fill((255,255,255))
-        pygame.draw.rect(tela, (20,20,20), (0,0,LARGURA,BARRA_STATUS_H))
-        executando = etapa < len(explorados)
-        msg = f"Heurística {tipo.upper()} | {'Executando...' if executando else 'Concluído!'} | Nós: {etapa}/{len(explorados)} | Custo: {custo:.2f}"
+        # o estado da busca é lido antes da lista: nada publicado depois escapa
+        concluida = busca.esperar(0)
+        explorados, caminho = busca.explorados, busca.caminho
+        etapa = linha.atualizar(dt, len(explorados))
+        executando = not concluida or etapa < len(explorados)
+
+        # desenho: só o que mudou desde o quadro anterior
+        if tela_inteira:
+            tela.fill((255,255,255))
+            quadro.invalidar()
+
+        # barra de status (o texto muda a cada passo)
+        pygame.draw.rect(tela, (20,20,20), barra)
+        estado = "Executando..." if executando else "Concluído!"
+        nos = f"{etapa}/{len(explorados)}" + ("" if concluida else "+")
+        custo = f"{busca.custo:.2f}" if concluida else "..."
+        msg = f"{tipo.upper()} | {estado} | Nós: {nos} | Custo: {custo} | {linha.descricao()}"
         tela.blit(fonte_status.render(msg, True, (255,255,255)), (MARGEM_EXTERNA, 10))
+        desenhar_botao(tela, BOTAO_VOLTAR, "Voltar", 20, negrito=True)
+        sujos = [barra]
 
-        # ====== BOTÃO VOLTAR (superior direito) ======
-        mouse = pygame.mouse.get_pos()
-        hover = BOTAO_VOLTAR.collidepoint(mouse)
-        cor_btn = (100,150,255) if hover else (70,120,200)
-        pygame.draw.rect(tela, cor_btn, BOTAO_VOLTAR, border_radius=8)
-        texto_voltar = fonte_botao.render("Voltar", True, (255,255,255))
-        tela.blit(texto_voltar, (BOTAO_VOLTAR.centerx - texto_voltar.get_width()//2,
-                                 BOTAO_VOLTAR.centery - texto_voltar.get_height()//2))
-        # =============================================
-
-        letras = ["A","B","C","D","E","F","G","H"]
-        for lin in range(BOARD_N):
-            for col in range(BOARD_N):
-                cor = COR_BEGE if (lin+col)%2==0 else COR_MARROM
-                pygame.draw.rect(tela, cor, (x0+col*CELULA, y0+lin*CELULA, CELULA, CELULA))
-                img = imgs.get(tabuleiro.grade[lin][col])
-                if img: tela.blit(img, (x0+col*CELULA, y0+lin*CELULA))
-
-        # Rótulos laterais e superiores
-        for i in range(BOARD_N):
-            letra = fonte_rotulo.render(letras[i], True, (0,0,0))
-            num = fonte_rotulo.render(str(8-i), True, (0,0,0))
-            tela.blit(letra, (x0 + i*CELULA + CELULA//2 - letra.get_width()//2, y0 - AREA_ROTULO))
-            tela.blit(letra, (x0 + i*CELULA + CELULA//2 - letra.get_width()//2, y0 + BOARD_N*CELULA + 5))
-            tela.blit(num, (x0 - AREA_ROTULO + 5, y0 + i*CELULA + CELULA//2 - num.get_height()//2))
-            tela.blit(num, (x0 + BOARD_N*CELULA + 8, y0 + i*CELULA + CELULA//2 - num.get_height()//2))
-
-        # Borda do tabuleiro
-        pygame.draw.rect(tela, COR_BORDA_EXTERNA, (x0 - 4, y0 - 4, BOARD_N*CELULA + 8, BOARD_N*CELULA + 8), 6)
-        pygame.draw.rect(tela, COR_BORDA_INTERNA, (x0, y0, BOARD_N*CELULA, BOARD_N*CELULA), 4)
-
-        # Início e chegada
-        if imgs.get("inicio"):
-            tela.blit(imgs["inicio"], (x0 + inicio[1]*CELULA, y0 + inicio[0]*CELULA))
-        if imgs.get("chegada"):
-            tela.blit(imgs["chegada"], (x0 + objetivo[1]*CELULA, y0 + objetivo[0]*CELULA))
-
-        # Nós explorados
+        # tabuleiro: explorados e cavalo durante a busca; caminho final ao terminar
         if executando:
-            for (lin,col) in explorados[:etapa]:
-                cx = x0+col*CELULA+CELULA//2
-                cy = y0+lin*CELULA+CELULA//2
-                pygame.draw.circle(tela, cor_explorado, (cx,cy), 6)
-
-        # Cavalo
-        pos = explorados[etapa] if etapa < len(explorados) else (caminho[-1] if caminho else inicio)
-        cx, cy = x0+pos[1]*CELULA+CELULA//2, y0+pos[0]*CELULA+CELULA//2
-        tela.blit(cavalo_img, (cx-cavalo_img.get_width()//2, cy-cavalo_img.get_height()//2))
-
-        # Caminho final
-        if not executando and caminho:
-            for i,(lin,col) in enumerate(caminho):
-                cx1 = x0+col*CELULA+CELULA//2
-                cy1 = y0+lin*CELULA+CELULA//2
-                pygame.draw.circle(tela, cor_caminho, (cx1,cy1), 10)
-                num = fonte_passos.render(str(i+1), True, (0,0,0))
-                tela.blit(num, (cx1 - num.get_width()//2, cy1 - num.get_height()//2))
-                if i < len(caminho)-1:
-                    lin2,col2 = caminho[i+1]
-                    cx2 = x0+col2*CELULA+CELULA//2
-                    cy2 = y0+lin2*CELULA+CELULA//2
-                    pygame.draw.line(tela,(255,255,0),(cx1,cy1),(cx2,cy2),4)
+            pos = explorados[min(etapa, len(explorados)-1)] if explorados else inicio
+        else:
+            pos = caminho[-1] if caminho else inicio
+        ja_finalizado = quadro.finalizado
+        sujos += quadro.desenhar(tela, explorados, etapa, pos, None if executando else caminho)
+        if not executando and caminho and (tela_inteira or not ja_finalizado):
             txt=f"Caminho final: {' → '.join([f'{letras[c]}{8-l}' for l,c in caminho])}"
-            tela.blit(fonte_caminho.render(txt,True,(0,0,0)),(MARGEM_EXTERNA,ALTURA-30))
+            sujos.append(tela.blit(fonte_caminho.render(txt,True,(0,0,0)),(MARGEM_EXTERNA,ALTURA-30)))
 
-        pygame.display.flip()
-        clock.tick(30)
-        time.sleep(velocidade)
-        if etapa < len(explorados): etapa += 1
+        if tela_inteira:
+            pygame.display.flip()
+            tela_inteira = False
+        else:
+            pygame.display.update(sujos)
 
+    busca.cancelar()
     pygame.quit()
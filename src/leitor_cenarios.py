@@ -0,0 +1,138 @@
+# =============================================================
+#  leitor_cenarios.py — Leitura preguiçosa de coleções de cenários
+# =============================================================
+#
+#  Fontes aceitas:
+#    arquivo.jsonl (ou .jsonl.gz)  — um cenário JSON por linha
+#    arquivo.json  (ou .json.gz)   — um único cenário (formato de cenario_basico.json)
+#    arquivo.tabb                  — um tabuleiro binário, aberto por mmap (tabuleiro_binario)
+#    diretório                     — todos os .json/.jsonl/.tabb dentro dele, em ordem alfabética
+#    "-"                           — JSON lines pela entrada padrão
+#
+#  Os cenários são lidos um a um: a memória não cresce com o tamanho da
+#  coleção. A grade pode vir como lista de listas de nomes ou no formato
+#  compacto de uma string por linha ("TTLB..."; ver tabuleiro.LETRA_TERRENO).
+
+from __future__ import annotations
+import gzip
+import json
+import os
+import sys
+from typing import Callable, Dict, Iterable, Iterator, Optional, TextIO, Tuple
+
+from src.tabuleiro import Tabuleiro, Coordenada
+from src.tabuleiro_binario import EXTENSAO_BINARIO, abrir_binario
+
+# (tabuleiro, início, objetivo, metadados)
+Cenario = Tuple[Tabuleiro, Coordenada, Coordenada, Dict[str, object]]
+# ao_erro(fonte, linha, mensagem); linha 0 = a fonte inteira falhou
+TratadorErro = Callable[[str, int, str], None]
+
+EXTENSOES_UM_CENARIO = (".json", ".json.gz")
+EXTENSOES_JSONL = (".jsonl", ".jsonl.gz")
+# chaves do registro consumidas pelo tabuleiro; as demais viram metadados
+CAMPOS_CENARIO = ("grid", "costs", "start", "goal")
+
+
+def _posicoes(tabuleiro: Tabuleiro, inicio, objetivo) -> Tuple[Coordenada, Coordenada]:
+    # sem início/objetivo: canto inferior esquerdo e superior direito
+    inicio = tuple(inicio or (tabuleiro.linhas - 1, 0))
+    objetivo = tuple(objetivo or (0, tabuleiro.colunas - 1))
+    for nome, pos in (("start", inicio), ("goal", objetivo)):
+        if len(pos) != 2 or not tabuleiro.dentro_dos_limites(pos):
+            raise ValueError(f"{nome} fora do tabuleiro: {list(pos)}")
+    return inicio, objetivo
+
+
+def cenario_de_dict(dados: dict) -> Tuple[Tabuleiro, Coordenada, Coordenada]:
+    """
+    Monta o tabuleiro e as posições de um registro já decodificado. Sem
+    "start"/"goal", usa o canto inferior esquerdo e o superior direito.
+    """
+    if not isinstance(dados, dict):
+        raise ValueError(f"Cenário deve ser um objeto JSON, não {type(dados).__name__}")
+    tabuleiro = Tabuleiro.carregar_de_json(dados)
+    return (tabuleiro, *_posicoes(tabuleiro, dados.get("start"), dados.get("goal")))
+
+
+def listar_fontes(caminhos: Iterable[str]) -> Iterator[str]:
+    """Expande diretórios (recursivamente, em ordem alfabética); o resto passa direto."""
+    for caminho in caminhos:
+        if caminho == "-" or not os.path.isdir(caminho):
+            yield caminho
+            continue
+        for raiz, subdirs, nomes in os.walk(caminho):
+            subdirs.sort()
+            for nome in sorted(nomes):
+                if nome.endswith(EXTENSOES_UM_CENARIO + EXTENSOES_JSONL + (EXTENSAO_BINARIO,)):
+                    yield os.path.join(raiz, nome)
+
+
+def _abrir(fonte: str) -> TextIO:
+    # bytes inválidos viram U+FFFD e o registro falha no JSON, não a leitura toda
+    if fonte.endswith(".gz"):
+        return gzip.open(fonte, "rt", encoding="utf-8", errors="replace")
+    return open(fonte, encoding="utf-8", errors="replace")
+
+
+def _linhas(fonte: str) -> Iterator[Tuple[int, str]]:
+    """(número da linha, texto) de cada registro da fonte, sem linhas em branco."""
+    if fonte == "-":
+        arquivo, fechar = sys.stdin, False
+    else:
+        arquivo, fechar = _abrir(fonte), True
+    try:
+        if fonte.endswith(EXTENSOES_UM_CENARIO):
+            yield 1, arquivo.read()
+            return
+        for numero, texto in enumerate(arquivo, 1):
+            if texto.strip():
+                yield numero, texto
+    finally:
+        if fechar:
+            arquivo.close()
+
+
+def avisar_erro(fonte: str, linha: int, mensagem: str) -> None:
+    """Tratador padrão: uma linha "fonte:linha: mensagem" na saída de erro."""
+    print(f"{fonte}:{linha}: {mensagem}", file=sys.stderr)
+
+
+def ler_cenarios(caminhos: Iterable[str], ao_erro: Optional[TratadorErro] = None) -> Iterator[Cenario]:
+    """
+    Produz (tabuleiro, início, objetivo, metadados) para cada cenário válido
+    das fontes, na ordem em que aparecem. Os metadados trazem "fonte",
+    "linha" e as chaves extras do registro (id, nome, ...).
+
+    Registros inválidos e fontes ilegíveis não interrompem a leitura: são
+    passados a ao_erro(fonte, linha, mensagem) (padrão: avisar_erro).
+    """
+    ao_erro = ao_erro or avisar_erro
+    for fonte in listar_fontes(caminhos):
+        if fonte.endswith(EXTENSAO_BINARIO):
+            try:
+                tabuleiro, inicio, objetivo = abrir_binario(fonte)
+                inicio, objetivo = _posicoes(tabuleiro, inicio, objetivo)
+            except (OSError, ValueError) as e:
+                ao_erro(fonte, 0, f"{type(e).__name__}: {e}")
+            else:
+                yield tabuleiro, inicio, objetivo, {"fonte": fonte, "linha": 1}
+            continue
+        linhas = _linhas(fonte)
+        while True:
+            try:
+                numero, texto = next(linhas)
+            except StopIteration:
+                break
+            except (OSError, EOFError) as e:  # inexistente, sem permissão, gzip truncado...
+                ao_erro(fonte, 0, f"{type(e).__name__}: {e}")
+                break
+            try:
+                dados = json.loads(texto)
+                tabuleiro, inicio, objetivo = cenario_de_dict(dados)
+            except (ValueError, KeyError, TypeError) as e:
+                ao_erro(fonte, numero, f"{type(e).__name__}: {e}")
+                continue
+            metadados = {k: v for k, v in dados.items() if k not in CAMPOS_CENARIO}
+            metadados.update(fonte=fonte, linha=numero)
+            yield tabuleiro, inicio, objetivo, metadados
@@ -0,0 +1,174 @@
+# =============================================================
+#  linha_do_tempo.py — Busca em segundo plano e relógio da animação
+# =============================================================
+#
+#  A interface não espera a busca terminar nem dorme entre quadros: a busca
+#  roda numa thread e publica as casas expandidas à medida que saem, e a
+#  LinhaDoTempo decide, pelo tempo decorrido, quantas delas já devem estar
+#  na tela. Nada aqui depende de pygame.
+
+from __future__ import annotations
+import threading
+from typing import Iterator, List, Optional
+
+from src.tabuleiro import Tabuleiro, Coordenada, INFINITO
+from src.busca_a_estrela import busca_a_estrela, ObservadorBusca
+from src.cache_buscas import CacheBuscas, CACHE_PADRAO
+
+
+class _BuscaCancelada(Exception):
+    pass
+
+
+class _Publicador(ObservadorBusca):
+    """Anexa cada casa expandida à lista compartilhada (list.append é atômico)."""
+
+    def __init__(self, explorados: List[Coordenada], cancelar: threading.Event):
+        self.explorados = explorados
+        self.cancelar = cancelar
+
+    def ao_expandir(self, pos, g):
+        if self.cancelar.is_set():
+            raise _BuscaCancelada
+        self.explorados.append(pos)
+
+
+class BuscaEmSegundoPlano:
+    """
+    busca_a_estrela numa thread. `explorados` cresce enquanto a busca roda e
+    pode ser lido a qualquer momento pela thread da interface; `caminho` e
+    `custo` valem depois de `concluida`. Uma consulta já guardada no cache
+    termina na hora, sem thread; uma busca nova é guardada ao terminar.
+    """
+
+    def __init__(self, tabuleiro: Tabuleiro, inicio: Coordenada, objetivo: Coordenada,
+                 tipo_heuristica: str = "h1", modo: str = "unidirecional",
+                 cache: Optional[CacheBuscas] = CACHE_PADRAO):
+        self.explorados: List[Coordenada] = []
+        self.caminho: List[Coordenada] = []
+        self.custo = INFINITO
+        self.erro: Optional[BaseException] = None
+        self._concluida = threading.Event()
+        self._cancelar = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        guardado = cache.consultar(tabuleiro, inicio, objetivo, tipo_heuristica, modo) if cache else None
+        if guardado is not None:
+            self.caminho, self.custo, self.explorados = guardado
+            self._concluida.set()
+            return
+        argumentos = (tabuleiro, inicio, objetivo, tipo_heuristica, modo, cache)
+        self._thread = threading.Thread(target=self._executar, args=argumentos,
+                                        name="busca-a-estrela", daemon=True)
+        self._thread.start()
+
+    def _executar(self, tabuleiro, inicio, objetivo, tipo_heuristica, modo, cache):
+        try:
+            caminho, custo = busca_a_estrela(tabuleiro, inicio, objetivo, tipo_heuristica, modo=modo,
+                                             observador=_Publicador(self.explorados, self._cancelar))
+            self.caminho, self.custo = caminho, custo
+            if cache is not None:
+                cache.guardar(tabuleiro, inicio, objetivo, tipo_heuristica, modo,
+                              (caminho, custo, list(self.explorados)))
+        except _BuscaCancelada:
+            pass
+        except Exception as e:  # repassado a quem esperar pelo resultado
+            self.erro = e
+        finally:
+            self._concluida.set()
+
+    @property
+    def concluida(self) -> bool:
+        return self._concluida.is_set()
+
+    def esperar(self, tempo_limite: Optional[float] = None) -> bool:
+        """Bloqueia até a busca terminar (ou o tempo acabar); levanta o erro da busca, se houver."""
+        terminou = self._concluida.wait(tempo_limite)
+        if self.erro is not None:
+            raise self.erro
+        return terminou
+
+    def cancelar(self) -> None:
+        """Interrompe a busca na próxima expansão (o resultado fica vazio)."""
+        self._cancelar.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def acompanhar(self, intervalo: float = 0.01) -> Iterator[Coordenada]:
+        """Gera as casas expandidas em ordem, esperando as novas até a busca terminar."""
+        i = 0
+        while True:
+            concluida = self.concluida  # lido antes do tamanho: nada escapa
+            while i < len(self.explorados):
+                yield self.explorados[i]
+                i += 1
+            if concluida:
+                break
+            self._concluida.wait(intervalo)
+        if self.erro is not None:
+            raise self.erro
+
+
+class LinhaDoTempo:
+    """
+    Quantas casas expandidas mostrar, em função do tempo e não da taxa de
+    quadros. Avança `1 / segundos_por_passo` casas por segundo vezes o
+    multiplicador de velocidade, nunca além das casas já disponíveis.
+    Pausa, passo a passo e avanço até o fim são controlados pela interface.
+    """
+    MULTIPLICADORES = (0.25, 0.5, 1, 2, 4, 8, 16, 64)
+
+    def __init__(self, segundos_por_passo: float = 0.35):
+        if segundos_por_passo <= 0:
+            raise ValueError("segundos_por_passo deve ser positivo")
+        self.passos_por_segundo = 1 / segundos_por_passo
+        self._indice = self.MULTIPLICADORES.index(1)
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        self.posicao = 0.0
+        self.pausada = False
+        self.ate_o_fim = False
+
+    @property
+    def multiplicador(self) -> float:
+        return self.MULTIPLICADORES[self._indice]
+
+    @property
+    def etapa(self) -> int:
+        return int(self.posicao)
+
+    def atualizar(self, dt: float, disponiveis: int) -> int:
+        """Avança `dt` segundos com `disponiveis` casas publicadas; devolve a etapa."""
+        if self.ate_o_fim:
+            self.posicao = float(disponiveis)
+        elif not self.pausada:
+            self.posicao += dt * self.passos_por_segundo * self.multiplicador
+        self.posicao = min(self.posicao, float(disponiveis))
+        return self.etapa
+
+    def alternar_pausa(self) -> None:
+        self.pausada = not self.pausada
+        self.ate_o_fim = False
+
+    def passo(self, n: int = 1) -> None:
+        """Pausa e avança (ou recua, com n < 0) n casas inteiras."""
+        self.pausada, self.ate_o_fim = True, False
+        self.posicao = max(0.0, float(int(self.posicao) + n))
+
+    def acelerar(self) -> None:
+        self._indice = min(self._indice + 1, len(self.MULTIPLICADORES) - 1)
+
+    def desacelerar(self) -> None:
+        self._indice = max(self._indice - 1, 0)
+
+    def avancar_ate_o_fim(self) -> None:
+        """Mostra todas as casas já publicadas e acompanha as próximas sem esperar."""
+        self.pausada, self.ate_o_fim = False, True
+
+    def descricao(self) -> str:
+        if self.pausada:
+            return "Pausado"
+        if self.ate_o_fim:
+            return "Até o fim"
+        return f"{self.multiplicador:g}x"
@@ -0,0 +1,131 @@
+# =============================================================
+#  marcos_alt.py — Heurística ALT (A*, Landmarks, Triangle inequality)
+# =============================================================
+
+from __future__ import annotations
+from array import array
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from src.tabuleiro import Tabuleiro, Coordenada
+from src.campo_distancias import dijkstra_direto, dijkstra_reverso
+
+SELECOES_MARCOS = ("distantes", "cantos")
+
+
+# -------------------------------------------------------------
+# Escolha dos marcos
+# -------------------------------------------------------------
+def _marcos_nos_cantos(tabuleiro: Tabuleiro, k: int) -> List[int]:
+    """Cantos, depois pontos médios das bordas; pula barreiras e repetidos."""
+    ul, uc = tabuleiro.linhas - 1, tabuleiro.colunas - 1
+    candidatos = [(0, 0), (ul, uc), (0, uc), (ul, 0),
+                  (0, uc // 2), (ul, uc // 2), (ul // 2, 0), (ul // 2, uc)]
+    marcos: List[int] = []
+    for pos in candidatos:
+        casa = tabuleiro.id_casa(pos)
+        if casa not in marcos and not tabuleiro.bloqueado(pos):
+            marcos.append(casa)
+        if len(marcos) == k:
+            break
+    return marcos
+
+
+def _compactar(dist: array) -> array:
+    """float32 quando a conversão é exata (custos típicos), senão mantém float64."""
+    original = np.frombuffer(dist, dtype=np.float64)
+    compacto = original.astype(np.float32)
+    if np.array_equal(compacto.astype(np.float64), original):
+        return array("f", compacto.tobytes())
+    return dist
+
+
+# -------------------------------------------------------------
+# Tabela de marcos
+# -------------------------------------------------------------
+class MarcosALT:
+    """
+    Distâncias exatas de/para K marcos, pré-computadas por Dijkstra.
+
+    Pela desigualdade triangular, para qualquer marco L:
+        d(v, t) >= d(v, L) - d(t, L)   e   d(v, t) >= d(L, t) - d(L, v)
+    e o maior desses limites é uma heurística admissível (e consistente).
+    Como o custo é cobrado ao entrar na casa, d(v, L) != d(L, v) e as duas
+    direções são guardadas.
+    """
+
+    def __init__(self, tabuleiro: Tabuleiro, k: int = 8, selecao: str = "distantes"):
+        if selecao not in SELECOES_MARCOS:
+            raise ValueError(f"Seleção de marcos desconhecida: {selecao!r} (use {SELECOES_MARCOS})")
+        self.tabuleiro = tabuleiro
+        self.selecao = selecao
+        self.marcos: List[int] = []
+        self.ate_marco: List[array] = []    # d(v, L) para todo v
+        self.desde_marco: List[array] = []  # d(L, v) para todo v
+
+        if selecao == "cantos":
+            for casa in _marcos_nos_cantos(tabuleiro, k):
+                self._adicionar(casa)
+        else:
+            self._escolher_distantes(k)
+
+    def _adicionar(self, casa: int) -> np.ndarray:
+        pos = self.tabuleiro.pos_casa(casa)
+        desde, _ = dijkstra_direto(self.tabuleiro, pos)
+        ate, _ = dijkstra_reverso(self.tabuleiro, pos)
+        self.marcos.append(casa)
+        self.desde_marco.append(_compactar(desde))
+        self.ate_marco.append(_compactar(ate))
+        return np.frombuffer(desde, dtype=np.float64)
+
+    def _escolher_distantes(self, k: int) -> None:
+        """Farthest-point: cada novo marco é a casa alcançável mais longe dos já escolhidos."""
+        livres = np.flatnonzero(~self.tabuleiro.mascara_barreiras().ravel())
+        if livres.size == 0:
+            return
+        # parte de uma casa livre qualquer; o primeiro marco é a mais distante dela
+        desde, _ = dijkstra_direto(self.tabuleiro, self.tabuleiro.pos_casa(int(livres[0])))
+        menor = np.frombuffer(desde, dtype=np.float64).copy()
+        for _ in range(k):
+            candidatas = np.where(np.isinf(menor), -1.0, menor)
+            candidatas[np.asarray(self.marcos, dtype=np.intp)] = -1.0
+            casa = int(np.argmax(candidatas))
+            if candidatas[casa] < 0:
+                break
+            menor = np.minimum(menor, self._adicionar(casa))
+
+    # ---------- Heurística ----------
+    def heuristica(self, alvo: Coordenada, reverso: bool = False) -> Callable[[int], float]:
+        """
+        Limite inferior de d(v, alvo) como função do id de v; com reverso=True,
+        de d(alvo, v) (usado pela busca de volta do modo bidirecional).
+        """
+        t = self.tabuleiro.id_casa(alvo)
+        termos: List[Tuple[array, float, array, float]] = []
+        for ate, desde in zip(self.ate_marco, self.desde_marco):
+            if not reverso:
+                # d(v,t) >= d(v,L) - d(t,L)  e  d(v,t) >= d(L,t) - d(L,v)
+                termos.append((ate, ate[t], desde, desde[t]))
+            else:
+                # d(t,v) >= d(L,v) - d(L,t)  e  d(t,v) >= d(t,L) - d(v,L)
+                termos.append((desde, desde[t], ate, ate[t]))
+
+        def h(casa: int) -> float:
+            melhor = 0.0
+            for menos, base_menos, mais, base_mais in termos:
+                # nan (inf - inf) nunca vence a comparação e é ignorado
+                a = menos[casa] - base_menos
+                if a > melhor:
+                    melhor = a
+                b = base_mais - mais[casa]
+                if b > melhor:
+                    melhor = b
+            return melhor
+        return h
+
+
+def marcos_alt(tabuleiro: Tabuleiro, k: int = 8, selecao: str = "distantes") -> MarcosALT:
+    """Marcos do tabuleiro, calculados uma vez e guardados nele até a próxima alteração."""
+    return tabuleiro.derivado(("marcos_alt", k, selecao),
+                              lambda: MarcosALT(tabuleiro, k, selecao))
@@ -0,0 +1,293 @@
+# =============================================================
+#  planejador_hierarquico.py — Busca hierárquica (estilo HPA*)
+# =============================================================
+
+from __future__ import annotations
+import heapq
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from src.tabuleiro import Tabuleiro, Coordenada, Terreno, INFINITO
+from src.busca_a_estrela import movimentos_minimos_cavalo, reconstruir_ids
+
+MODOS_REFINAMENTO = ("exato", "rapido")
+
+Arestas = Dict[int, List[Tuple[int, float]]]
+
+
+class PlanejadorHierarquico:
+    """
+    Planejador hierárquico para tabuleiros muito grandes.
+
+    O tabuleiro é dividido em clusters de tamanho_cluster x tamanho_cluster.
+    Entre clusters vizinhos escolhem-se até `transicoes_por_vizinho` saltos
+    de cavalo bem espalhados (as entradas); dentro de cada cluster, um
+    Dijkstra local liga todas as entradas entre si. A consulta busca nesse
+    grafo abstrato e depois refina só os clusters escolhidos:
+
+    - "exato": A* restrito ao corredor de clusters do caminho abstrato
+      (ótimo dentro do corredor);
+    - "rapido": A* local dentro de cada cluster, entrada a entrada
+      (quase ótimo, bem mais barato).
+
+    Os clusters são montados sob demanda e guardados. Quando definir_terreno
+    altera uma casa, só o cluster dela e os vizinhos ligados a ela são
+    descartados e refeitos na próxima consulta.
+    """
+
+    def __init__(self, tabuleiro: Tabuleiro, tamanho_cluster: int = 16,
+                 transicoes_por_vizinho: int = 3):
+        if tamanho_cluster < 2:
+            raise ValueError("tamanho_cluster deve ser ao menos 2 (o cavalo salta 2 casas)")
+        self.tabuleiro = tabuleiro
+        self.tamanho = tamanho_cluster
+        self.transicoes_por_vizinho = transicoes_por_vizinho
+        self.clusters_linhas = -(-tabuleiro.linhas // tamanho_cluster)
+        self.clusters_colunas = -(-tabuleiro.colunas // tamanho_cluster)
+        linhas, colunas = np.divmod(np.arange(tabuleiro.linhas * tabuleiro.colunas), tabuleiro.colunas)
+        ids = (linhas // tamanho_cluster) * self.clusters_colunas + colunas // tamanho_cluster
+        self._cluster_da_casa = array("i", ids.astype(np.int32).tobytes())
+        self.expandidos_abstratos = 0  # nós abstratos expandidos na última consulta
+        self.recorrencias_completas = 0  # consultas que caíram na busca sem clusters
+        self._menor = 0.0
+        self._limpar()
+        tabuleiro.observar(self._ao_alterar_terreno)
+
+    # ---------- Geometria dos clusters ----------
+    def cluster_de(self, casa: int) -> int:
+        """Id do cluster que contém a casa (id plano)."""
+        return self._cluster_da_casa[casa]
+
+    def _casas_do_cluster(self, cluster: int) -> Iterable[int]:
+        cl, cc = divmod(cluster, self.clusters_colunas)
+        colunas, t = self.tabuleiro.colunas, self.tamanho
+        for linha in range(cl * t, min((cl + 1) * t, self.tabuleiro.linhas)):
+            yield from range(linha * colunas + cc * t, linha * colunas + min((cc + 1) * t, colunas))
+
+    # ---------- Cache e invalidação ----------
+    def _limpar(self) -> None:
+        self._tabela = self.tabuleiro.tabela_custos()
+        self._indice = self.tabuleiro.indice_cavalo()
+        self._transicoes: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        self._grafos: Dict[int, Tuple[Arestas, Arestas]] = {}
+
+    def _ao_alterar_terreno(self, pos: Coordenada, antigo: Terreno, novo: Terreno) -> None:
+        casa = self.tabuleiro.id_casa(pos)
+        proprio = self.cluster_de(casa)
+        indice = self._indice
+        vizinhos = {self.cluster_de(v) for v in indice.alvos[indice.inicios[casa]:indice.inicios[casa + 1]]}
+        # a casa pode ter virado (ou deixado de ser) ponta de transição com os vizinhos,
+        # o que muda o conjunto de entradas deles também
+        for outro in vizinhos:
+            self._transicoes.pop((min(proprio, outro), max(proprio, outro)), None)
+            self._grafos.pop(outro, None)
+        self._grafos.pop(proprio, None)
+
+    def _preparar_consulta(self) -> None:
+        if self.tabuleiro.tabela_custos() != self._tabela:
+            self._limpar()
+        # menor custo entre as casas que existem: limite justo para a heurística
+        menor = self.tabuleiro.menor_custo_presente()
+        self._menor = 0.0 if menor == INFINITO else menor
+
+    # ---------- Transições e grafo intra-cluster ----------
+    def _transicoes_entre(self, a: int, b: int) -> List[Tuple[int, int]]:
+        """Saltos (u em a, v em b) escolhidos entre dois clusters (a < b), sem barreiras."""
+        chave = (a, b)
+        if chave not in self._transicoes:
+            tabela, celulas = self._tabela, self.tabuleiro.celulas
+            inicios, alvos = self._indice.inicios, self._indice.alvos
+            cluster_da_casa = self._cluster_da_casa
+            candidatos = []
+            for u in self._casas_do_cluster(a):
+                if tabela[celulas[u]] == INFINITO:
+                    continue
+                for v in alvos[inicios[u]:inicios[u + 1]]:
+                    if cluster_da_casa[v] == b and tabela[celulas[v]] != INFINITO:
+                        candidatos.append((u, v))
+            # escolhe até P saltos espalhados ao longo da fronteira
+            m, p = len(candidatos), self.transicoes_por_vizinho
+            self._transicoes[chave] = [candidatos[(i * m) // p] for i in range(min(p, m))]
+        return self._transicoes[chave]
+
+    def _clusters_vizinhos(self, cluster: int) -> List[int]:
+        cl, cc = divmod(cluster, self.clusters_colunas)
+        return [l * self.clusters_colunas + c
+                for l in range(max(cl - 1, 0), min(cl + 2, self.clusters_linhas))
+                for c in range(max(cc - 1, 0), min(cc + 2, self.clusters_colunas))
+                if (l, c) != (cl, cc)]
+
+    def _grafo(self, cluster: int) -> Tuple[Arestas, Arestas]:
+        """(arestas intra-cluster entre entradas, saltos de saída) do cluster, sob demanda."""
+        if cluster not in self._grafos:
+            tabela, celulas = self._tabela, self.tabuleiro.celulas
+            saltos: Arestas = {}
+            for outro in self._clusters_vizinhos(cluster):
+                for u, v in self._transicoes_entre(min(cluster, outro), max(cluster, outro)):
+                    if self.cluster_de(u) != cluster:
+                        u, v = v, u
+                    saltos.setdefault(u, []).append((v, tabela[celulas[v]]))
+            # d(w -> e) = d(e -> w) - custo(w) + custo(e): o caminho invertido também
+            # vale (saltos simétricos), então basta um Dijkstra por par de entradas
+            entradas = list(saltos)
+            intra: Arestas = {e: [] for e in entradas}
+            for i, e in enumerate(entradas[:-1]):
+                destinos = entradas[i + 1:]
+                dist = self._dijkstra_local(e, {cluster}, destinos=set(destinos))
+                custo_e = tabela[celulas[e]]
+                for w in destinos:
+                    if w in dist:
+                        intra[e].append((w, dist[w]))
+                        intra[w].append((e, dist[w] - tabela[celulas[w]] + custo_e))
+            self._grafos[cluster] = (intra, saltos)
+        return self._grafos[cluster]
+
+    def preprocessar(self) -> None:
+        """Monta todos os clusters de uma vez (opcional; normalmente é sob demanda)."""
+        self._preparar_consulta()
+        for cluster in range(self.clusters_linhas * self.clusters_colunas):
+            self._grafo(cluster)
+
+    # ---------- Buscas locais ----------
+    def _dijkstra_local(self, origem: int, permitidos: Set[int], reverso: bool = False,
+                        destinos: Optional[Set[int]] = None) -> Dict[int, float]:
+        """
+        Dijkstra limitado às casas dos clusters permitidos (reverso: custo até a
+        origem). Com `destinos`, para assim que todos forem fechados.
+        """
+        indice, tabela, celulas = self._indice, self._tabela, self.tabuleiro.celulas
+        inicios, alvos, custos = indice.inicios, indice.alvos, indice.custos
+        cluster_da_casa = self._cluster_da_casa
+        dist = {origem: 0.0}
+        fila = [(0.0, origem)]
+        while fila:
+            d, u = heapq.heappop(fila)
+            if d > dist[u]:
+                continue
+            if destinos is not None:
+                destinos.discard(u)
+                if not destinos:
+                    break
+            if reverso:
+                # saltos simétricos: quem chega em u paga o custo de u
+                custo_u = tabela[celulas[u]]
+                if custo_u == INFINITO:
+                    continue
+                novo = d + custo_u
+                for v in alvos[inicios[u]:inicios[u + 1]]:
+                    if novo < dist.get(v, INFINITO) and cluster_da_casa[v] in permitidos:
+                        dist[v] = novo
+                        heapq.heappush(fila, (novo, v))
+            else:
+                for k in range(inicios[u], inicios[u + 1]):
+                    v = alvos[k]
+                    novo = d + custos[k]
+                    if novo < dist.get(v, INFINITO) and cluster_da_casa[v] in permitidos:
+                        dist[v] = novo
+                        heapq.heappush(fila, (novo, v))
+        return dist
+
+    def _h(self, a: int, b: int) -> float:
+        colunas = self.tabuleiro.colunas
+        la, ca = divmod(a, colunas)
+        lb, cb = divmod(b, colunas)
+        return movimentos_minimos_cavalo(la, ca, lb, cb) * self._menor if a != b else 0.0
+
+    def _a_estrela_local(self, origem: int, destino: int,
+                         permitidos: Optional[Set[int]]) -> Tuple[List[int], float]:
+        """A* nas casas dos clusters permitidos (None = todos); retorna (ids do caminho, custo)."""
+        indice = self._indice
+        inicios, alvos, custos = indice.inicios, indice.alvos, indice.custos
+        cluster_da_casa = self._cluster_da_casa
+        g = {origem: 0.0}
+        pais: Dict[int, Optional[int]] = {origem: None}
+        fila = [(self._h(origem, destino), 0.0, origem)]
+        while fila:
+            _, gu, u = heapq.heappop(fila)
+            if u == destino:
+                return reconstruir_ids(pais, u), gu
+            if gu > g[u]:
+                continue
+            for k in range(inicios[u], inicios[u + 1]):
+                v = alvos[k]
+                novo = gu + custos[k]
+                if novo < g.get(v, INFINITO) and (permitidos is None or cluster_da_casa[v] in permitidos):
+                    g[v] = novo
+                    pais[v] = u
+                    heapq.heappush(fila, (novo + self._h(v, destino), novo, v))
+        return [], INFINITO
+
+    # ---------- Consulta ----------
+    def _busca_abstrata(self, s: int, t: int) -> Tuple[List[int], float]:
+        cs, ct = self.cluster_de(s), self.cluster_de(t)
+        # liga início e objetivo às entradas dos seus clusters
+        extras: Arestas = {}
+        dist_s = self._dijkstra_local(s, {cs})
+        intra_s, saltos_s = self._grafo(cs)
+        extras[s] = [(e, dist_s[e]) for e in saltos_s if e in dist_s and e != s]
+        if t in dist_s:
+            extras[s].append((t, dist_s[t]))  # mesmo cluster: ligação direta
+        dist_t = self._dijkstra_local(t, {ct}, reverso=True)
+        _, saltos_t = self._grafo(ct)
+        for e in saltos_t:
+            if e in dist_t and e != t:
+                extras.setdefault(e, []).append((t, dist_t[e]))
+
+        g = {s: 0.0}
+        pais: Dict[int, Optional[int]] = {s: None}
+        fechados: Set[int] = set()
+        fila = [(self._h(s, t), 0.0, s)]
+        self.expandidos_abstratos = 0
+        while fila:
+            _, gu, u = heapq.heappop(fila)
+            if u == t:
+                return reconstruir_ids(pais, u), gu
+            if u in fechados:
+                continue
+            fechados.add(u)
+            self.expandidos_abstratos += 1
+            intra, saltos = self._grafo(self.cluster_de(u))
+            for v, c in (*intra.get(u, ()), *saltos.get(u, ()), *extras.get(u, ())):
+                novo = gu + c
+                if novo < g.get(v, INFINITO):
+                    g[v] = novo
+                    pais[v] = u
+                    heapq.heappush(fila, (novo + self._h(v, t), novo, v))
+        return [], INFINITO
+
+    def caminho(self, inicio: Coordenada, objetivo: Coordenada,
+                modo: str = "exato") -> Tuple[List[Coordenada], float]:
+        """Retorna (caminho, custo_total), como busca_a_estrela."""
+        if modo not in MODOS_REFINAMENTO:
+            raise ValueError(f"Modo de refinamento desconhecido: {modo!r} (use {MODOS_REFINAMENTO})")
+        self._preparar_consulta()
+        tab = self.tabuleiro
+        s, t = tab.id_casa(inicio), tab.id_casa(objetivo)
+        if s == t:
+            return [tuple(inicio)], 0.0
+
+        abstrato, _ = self._busca_abstrata(s, t)
+        if not abstrato:
+            # as entradas são uma amostra das transições: sem caminho abstrato
+            # ainda pode haver caminho real, então confirma no tabuleiro todo
+            self.recorrencias_completas += 1
+            ids, custo = self._a_estrela_local(s, t, None)
+        elif modo == "exato":
+            corredor = {self.cluster_de(x) for x in abstrato}
+            ids, custo = self._a_estrela_local(s, t, corredor)
+        else:
+            ids, custo = [s], 0.0
+            for a, b in zip(abstrato, abstrato[1:]):
+                ca, cb = self.cluster_de(a), self.cluster_de(b)
+                trecho, c = self._a_estrela_local(a, b, {ca} if ca == cb else {ca, cb})
+                ids.extend(trecho[1:])
+                custo += c
+        if custo == INFINITO:
+            return [], float("inf")
+        return [tab.pos_casa(x) for x in ids], custo
+
+    def encerrar(self) -> None:
+        """Para de observar o tabuleiro."""
+        self.tabuleiro.deixar_de_observar(self._ao_alterar_terreno)
@@ -0,0 +1,185 @@
+# =============================================================
+#  planejador_incremental.py — Replanejamento incremental (D* Lite)
+# =============================================================
+
+from __future__ import annotations
+import heapq
+from typing import Dict, List, Set, Tuple
+
+from src.tabuleiro import Tabuleiro, Coordenada, Terreno, INFINITO
+from src.busca_a_estrela import movimentos_minimos_cavalo
+
+Chave = Tuple[float, float]
+
+
+class PlanejadorIncremental:
+    """
+    Planejador D* Lite sobre o grafo do cavalo.
+
+    A busca é feita do objetivo para o início e o estado (g, rhs e a fila)
+    sobrevive entre consultas. O planejador observa o tabuleiro: cada
+    definir_terreno marca a casa alterada e, na próxima consulta, só os
+    vizinhos dela são reavaliados — a fila repara apenas a parte afetada da
+    árvore. O início pode andar (mover_inicio) sem recomeçar a busca.
+
+    Uso típico:
+        plan = PlanejadorIncremental(tab, inicio, objetivo)
+        caminho, custo = plan.caminho()
+        tab.definir_terreno((3, 4), Terreno.LAMA)
+        plan.mover_inicio(caminho[1])
+        caminho, custo = plan.caminho()
+    """
+
+    def __init__(self, tabuleiro: Tabuleiro, inicio: Coordenada, objetivo: Coordenada):
+        self.tabuleiro = tabuleiro
+        self.objetivo = tuple(objetivo)
+        self.inicio = tuple(inicio)
+        self.expandidos = 0  # expansões da última chamada a caminho()
+        self._pendentes: Set[int] = set()
+        self._reiniciar()
+        tabuleiro.observar(self._ao_alterar_terreno)
+
+    # ---------- Estado ----------
+    def _reiniciar(self) -> None:
+        tab = self.tabuleiro
+        self._tabela = tab.tabela_custos()
+        self._indice = tab.indice_cavalo()  # corrigido no lugar por definir_terreno
+        self._menor = tab.menor_custo_transponivel()
+        self._id_objetivo = tab.id_casa(self.objetivo)
+        self._id_inicio = self._ultimo_inicio = tab.id_casa(self.inicio)
+        self._km = 0.0
+        self._g: Dict[int, float] = {}
+        self._rhs: Dict[int, float] = {self._id_objetivo: 0.0}
+        self._na_fila: Dict[int, Chave] = {}
+        self._fila: List[Tuple[Chave, int]] = []
+        self._pendentes.clear()
+        self._inserir(self._id_objetivo, self._calcular_chave(self._id_objetivo))
+
+    def _ao_alterar_terreno(self, pos: Coordenada, antigo: Terreno, novo: Terreno) -> None:
+        self._pendentes.add(self.tabuleiro.id_casa(pos))
+
+    def _h(self, a: int, b: int) -> float:
+        """Limite inferior do custo entre duas casas (saltos no tabuleiro infinito × custo mínimo)."""
+        colunas = self.tabuleiro.colunas
+        la, ca = divmod(a, colunas)
+        lb, cb = divmod(b, colunas)
+        return movimentos_minimos_cavalo(la, ca, lb, cb) * self._menor if a != b else 0.0
+
+    def _calcular_chave(self, casa: int) -> Chave:
+        m = min(self._g.get(casa, INFINITO), self._rhs.get(casa, INFINITO))
+        return (m + self._h(self._id_inicio, casa) + self._km, m)
+
+    def _inserir(self, casa: int, chave: Chave) -> None:
+        self._na_fila[casa] = chave
+        heapq.heappush(self._fila, (chave, casa))
+
+    def _topo(self) -> Tuple[Chave, int]:
+        """Menor entrada válida da fila (descarta entradas obsoletas)."""
+        fila, na_fila = self._fila, self._na_fila
+        while fila:
+            chave, casa = fila[0]
+            if na_fila.get(casa) == chave:
+                return chave, casa
+            heapq.heappop(fila)
+        return (INFINITO, INFINITO), -1
+
+    # ---------- D* Lite ----------
+    def _atualizar_vertice(self, u: int) -> None:
+        if u != self._id_objetivo:
+            indice = self._indice
+            inicios, alvos, custos = indice.inicios, indice.alvos, indice.custos
+            g = self._g
+            melhor = INFINITO
+            for k in range(inicios[u], inicios[u + 1]):
+                valor = custos[k] + g.get(alvos[k], INFINITO)
+                if valor < melhor:
+                    melhor = valor
+            self._rhs[u] = melhor
+        self._na_fila.pop(u, None)
+        if self._g.get(u, INFINITO) != self._rhs.get(u, INFINITO):
+            self._inserir(u, self._calcular_chave(u))
+
+    def _calcular_caminho_minimo(self) -> None:
+        indice = self._indice
+        inicios, alvos = indice.inicios, indice.alvos
+        g, rhs = self._g, self._rhs
+        s = self._id_inicio
+        while True:
+            chave_antiga, u = self._topo()
+            if u < 0:
+                break
+            if not (chave_antiga < self._calcular_chave(s) or rhs.get(s, INFINITO) != g.get(s, INFINITO)):
+                break
+            heapq.heappop(self._fila)
+            del self._na_fila[u]
+            chave_nova = self._calcular_chave(u)
+            if chave_antiga < chave_nova:
+                self._inserir(u, chave_nova)
+                continue
+            self.expandidos += 1
+            predecessores = alvos[inicios[u]:inicios[u + 1]]  # saltos simétricos
+            if g.get(u, INFINITO) > rhs.get(u, INFINITO):
+                g[u] = rhs[u]
+                for p in predecessores:
+                    self._atualizar_vertice(p)
+            else:
+                g[u] = INFINITO
+                for p in predecessores:
+                    self._atualizar_vertice(p)
+                self._atualizar_vertice(u)
+
+    # ---------- API ----------
+    def mover_inicio(self, nova_pos: Coordenada) -> None:
+        """Move o início (o cavalo avançou); a busca continua de onde estava."""
+        self.inicio = tuple(nova_pos)
+        self._id_inicio = self.tabuleiro.id_casa(self.inicio)
+
+    def caminho(self) -> Tuple[List[Coordenada], float]:
+        """Replaneja só o necessário e retorna (caminho, custo_total), como busca_a_estrela."""
+        tab = self.tabuleiro
+        self.expandidos = 0
+        if tab.tabela_custos() != self._tabela:
+            self._reiniciar()  # tabela de custos mudou: todas as arestas mudaram
+
+        if self._id_inicio != self._ultimo_inicio:
+            self._km += self._h(self._ultimo_inicio, self._id_inicio)
+            self._ultimo_inicio = self._id_inicio
+            # chaves na fila continuam limites inferiores; só as novas usam o km atualizado
+
+        if self._pendentes:
+            # custo de ENTRAR na casa mudou: afeta o rhs de quem salta para ela
+            indice = self._indice
+            afetados = set()
+            for casa in self._pendentes:
+                afetados.update(indice.alvos[indice.inicios[casa]:indice.inicios[casa + 1]])
+            self._pendentes.clear()
+            for u in afetados:
+                self._atualizar_vertice(u)
+
+        self._calcular_caminho_minimo()
+
+        custo = self._rhs.get(self._id_inicio, INFINITO)
+        if custo == INFINITO:
+            return [], float("inf")
+
+        # desce pelo menor custo(v) + g(v) até o objetivo
+        indice = self._indice
+        inicios, alvos, custos = indice.inicios, indice.alvos, indice.custos
+        g, colunas = self._g, tab.colunas
+        casa = self._id_inicio
+        caminho = [divmod(casa, colunas)]
+        while casa != self._id_objetivo:
+            melhor, seguinte = INFINITO, -1
+            for k in range(inicios[casa], inicios[casa + 1]):
+                valor = custos[k] + g.get(alvos[k], INFINITO)
+                if valor < melhor:
+                    melhor, seguinte = valor, alvos[k]
+            if seguinte < 0 or len(caminho) > tab.linhas * tab.colunas:
+                return [], float("inf")
+            casa = seguinte
+            caminho.append(divmod(casa, colunas))
+        return caminho, custo
+
+    def encerrar(self) -> None:
+        """Para de observar o tabuleiro."""
+        self.tabuleiro.deixar_de_observar(self._ao_alterar_terreno)
@@ -2,67 +2,305 @@
 # relatorio_custos.py — Relatório analítico dos custos do caminho
 # =============================================================
 
-from src.tabuleiro import Terreno
+from __future__ import annotations
+import csv
+import io
+import json
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
 
-def gerar_relatorio_caminho(tabuleiro, caminho, custo_total, heuristica="h1"):
+import numpy as np
+from src.tabuleiro import Terreno, Coordenada, INFINITO
+
+NOMES_HEURISTICAS = {
+    "h1": "H1 - Distância simples × menor custo (heurística fraca)",
+    "h2": "H2 - Movimentos mínimos do cavalo × menor custo (heurística forte)",
+    "nula": "Sem heurística (A* equivalente ao Dijkstra)",
+    "exata": "Saltos exatos no tabuleiro vazio × menor custo",
+    "barreiras": "Saltos mínimos desviando de barreiras (BFS) × menor custo",
+    "alt": "ALT - Marcos pré-computados + desigualdade triangular",
+    "pontos": "Rota por pontos de passagem (Dijkstra por ponto + melhor ordem)"
+}
+
+CAMPOS_CSV = ("heuristica", "passo", "linha", "coluna", "terreno", "custo", "acumulado")
+
+
+# -------------------------------------------------------------
+# Relatório estruturado
+# -------------------------------------------------------------
+@dataclass(frozen=True)
+class PassoRelatorio:
+    """Uma casa do caminho: terreno, custo de entrada e custo acumulado até ela."""
+    posicao: Coordenada
+    terreno: Terreno
+    custo: float
+    acumulado: float
+
+
+@dataclass
+class RelatorioCaminho:
     """
-    Gera um relatório detalhado do caminho encontrado e seus custos acumulados.
-    Inclui também a heurística utilizada (H1, H2 ou nula).
+    Relatório de um caminho encontrado (ou não) pelo A*. Monte com
+    montar_relatorio e apresente com formatar_texto/formatar_json/formatar_csv.
     """
+    heuristica: str
+    custo_total: float
+    menor_custo: float
+    custo_teorico_min: float
+    custo_teorico_max: float
+    passos: List[PassoRelatorio] = field(default_factory=list)
+    expandidos: Optional[int] = None
+
+    @property
+    def encontrado(self) -> bool:
+        return bool(self.passos)
+
+    @property
+    def nome_heuristica(self) -> str:
+        return NOMES_HEURISTICAS.get(self.heuristica, "Desconhecida")
+
+    @property
+    def movimentos(self) -> int:
+        return max(len(self.passos) - 1, 0)
+
+    @property
+    def soma_passos(self) -> float:
+        return self.passos[-1].acumulado if self.passos else 0.0
 
-    if not caminho:
-        print("\nNenhum caminho encontrado.")
-        return
+    @property
+    def dentro_do_limite(self) -> bool:
+        return self.custo_total <= self.custo_teorico_max
 
-    # ---------------------------------------------------------
-    # Identificação da heurística utilizada
-    # ---------------------------------------------------------
-    nomes_heuristicas = {
-        "h1": "H1 - Distância simples × menor custo (heurística fraca)",
-        "h2": "H2 - Movimentos mínimos do cavalo × menor custo (heurística forte)",
-        "nula": "Sem heurística (A* equivalente ao Dijkstra)"
-    }
+    def como_dict(self) -> dict:
+        """Forma serializável em JSON (infinito vira None)."""
+        def numero(x: float) -> Optional[float]:
+            return None if math.isinf(x) else x
+        return {
+            "heuristica": self.heuristica,
+            "encontrado": self.encontrado,
+            "custo_total": numero(self.custo_total),
+            "menor_custo": numero(self.menor_custo),
+            "custo_teorico_min": numero(self.custo_teorico_min),
+            "custo_teorico_max": numero(self.custo_teorico_max),
+            "expandidos": self.expandidos,
+            "passos": [{"posicao": list(p.posicao), "terreno": p.terreno.value,
+                        "custo": p.custo, "acumulado": p.acumulado} for p in self.passos],
+        }
 
-    heuristica_texto = nomes_heuristicas.get(heuristica, "Desconhecida")
+    @staticmethod
+    def de_dict(dados: dict) -> "RelatorioCaminho":
+        """Inverso de como_dict."""
+        def numero(x: Optional[float]) -> float:
+            return INFINITO if x is None else float(x)
+        return RelatorioCaminho(
+            heuristica=dados["heuristica"],
+            custo_total=numero(dados["custo_total"]),
+            menor_custo=numero(dados["menor_custo"]),
+            custo_teorico_min=numero(dados["custo_teorico_min"]),
+            custo_teorico_max=numero(dados["custo_teorico_max"]),
+            passos=[PassoRelatorio(tuple(p["posicao"]), Terreno(p["terreno"]),
+                                   p["custo"], p["acumulado"]) for p in dados["passos"]],
+            expandidos=dados.get("expandidos"),
+        )
 
-    print("\n=== RELATÓRIO ANALÍTICO DO CAMINHO ENCONTRADO ===\n")
-    print(f"Heurística utilizada: {heuristica_texto}\n")
 
-    # ---------------------------------------------------------
-    # Cálculos de custos teóricos e acumulados
-    # ---------------------------------------------------------
-    custo_acumulado = 0
+def montar_relatorio(tabuleiro, caminho, custo_total, heuristica="h1",
+                     expandidos: Optional[int] = None) -> RelatorioCaminho:
+    """
+    Monta o relatório do caminho: custo e acumulado de cada passo
+    (vetorizados) e os limites teóricos para o número de movimentos.
+    """
     menor_custo = tabuleiro.menor_custo_transponivel()
-    custo_teorico_min = menor_custo * (len(caminho) - 1)
-    custo_teorico_max = max(tabuleiro.custos.values()) * (len(caminho) - 1)
-
-    print(f"Menor custo possível por terreno: {menor_custo:.2f}")
-    print(f"Custo teórico mínimo admissível: {custo_teorico_min:.2f}")
-    print(f"Custo teórico máximo admissível: {custo_teorico_max:.2f}")
-    print("\nPassos percorridos:\n")
-
-    # ---------------------------------------------------------
-    # Lista de passos detalhada
-    # ---------------------------------------------------------
-    for i, pos in enumerate(caminho):
-        tipo = tabuleiro.tipo_terreno(pos)
-        custo = tabuleiro.custo(pos)
-        custo_acumulado += custo
-        print(f"{i+1:02d}. {pos} → Terreno: {tipo.name:<8} | "
-              f"Custo: {custo:>5.2f} | Acumulado: {custo_acumulado:>6.2f}")
-
-    # ---------------------------------------------------------
-    # Resumo final e validação da admissibilidade
-    # ---------------------------------------------------------
-    print("\n--- RESULTADOS ---")
-    print(f"Custo total calculado pelo A*: {custo_total:.2f}")
-    print(f"Soma de custos percorridos:     {custo_acumulado:.2f}")
-
-    if custo_total <= custo_teorico_max:
-        print(f"O custo total está dentro do limite admissível "
-              f"({custo_total:.2f} ≤ {custo_teorico_max:.2f}).")
+    movimentos = max(len(caminho) - 1, 0)
+    passos: List[PassoRelatorio] = []
+    if caminho:
+        custos = tabuleiro.custos_de(caminho)
+        acumulados = np.cumsum(custos)
+        passos = [PassoRelatorio(tuple(pos), tabuleiro.tipo_terreno(pos), float(c), float(a))
+                  for pos, c, a in zip(caminho, custos, acumulados)]
+    return RelatorioCaminho(
+        heuristica=heuristica,
+        custo_total=custo_total,
+        menor_custo=menor_custo,
+        custo_teorico_min=menor_custo * movimentos,
+        custo_teorico_max=max(tabuleiro.custos.values()) * movimentos,
+        passos=passos,
+        expandidos=expandidos,
+    )
+
+
+# -------------------------------------------------------------
+# Apresentação
+# -------------------------------------------------------------
+def formatar_texto(relatorio: RelatorioCaminho) -> str:
+    """Relatório legível (o mesmo texto que gerar_relatorio_caminho imprime)."""
+    if not relatorio.encontrado:
+        return "\nNenhum caminho encontrado."
+
+    r = relatorio
+    linhas = [
+        "\n=== RELATÓRIO ANALÍTICO DO CAMINHO ENCONTRADO ===\n",
+        f"Heurística utilizada: {r.nome_heuristica}\n",
+        f"Menor custo possível por terreno: {r.menor_custo:.2f}",
+        f"Custo teórico mínimo admissível: {r.custo_teorico_min:.2f}",
+        f"Custo teórico máximo admissível: {r.custo_teorico_max:.2f}",
+        "\nPassos percorridos:\n",
+    ]
+    for i, p in enumerate(r.passos):
+        linhas.append(f"{i+1:02d}. {p.posicao} → Terreno: {p.terreno.name:<8} | "
+                      f"Custo: {p.custo:>5.2f} | Acumulado: {p.acumulado:>6.2f}")
+
+    linhas.append("\n--- RESULTADOS ---")
+    linhas.append(f"Custo total calculado pelo A*: {r.custo_total:.2f}")
+    linhas.append(f"Soma de custos percorridos:     {r.soma_passos:.2f}")
+    if r.dentro_do_limite:
+        linhas.append(f"O custo total está dentro do limite admissível "
+                      f"({r.custo_total:.2f} ≤ {r.custo_teorico_max:.2f}).")
     else:
-        print(f"O custo total excedeu o máximo admissível! "
-              f"({custo_total:.2f} > {custo_teorico_max:.2f})")
+        linhas.append(f"O custo total excedeu o máximo admissível! "
+                      f"({r.custo_total:.2f} > {r.custo_teorico_max:.2f})")
+    linhas.append("========================================================\n")
+    return "\n".join(linhas)
+
+
+def formatar_json(relatorio: RelatorioCaminho, **opcoes_json) -> str:
+    """Relatório em JSON (ver RelatorioCaminho.como_dict)."""
+    return json.dumps(relatorio.como_dict(), ensure_ascii=False, **opcoes_json)
+
+
+def formatar_csv(relatorios: Iterable[RelatorioCaminho], cabecalho: bool = True) -> str:
+    """Uma linha por passo de cada relatório (colunas em CAMPOS_CSV)."""
+    saida = io.StringIO()
+    escritor = csv.writer(saida, lineterminator="\n")
+    if cabecalho:
+        escritor.writerow(CAMPOS_CSV)
+    for r in relatorios:
+        for i, p in enumerate(r.passos):
+            escritor.writerow((r.heuristica, i, p.posicao[0], p.posicao[1], p.terreno.value,
+                               p.custo, p.acumulado))
+    return saida.getvalue()
+
+
+def formatar_comparativo(h1: RelatorioCaminho, h2: RelatorioCaminho) -> str:
+    """Texto comparando dois relatórios (H1 × H2) com nós expandidos preenchidos."""
+    e1, e2 = h1.expandidos or 0, h2.expandidos or 0
+    ganho_nos = 100 * (1 - e2 / e1) if e1 else 0
+    media1 = h1.custo_total / e1 if e1 else 0
+    media2 = h2.custo_total / e2 if e2 else 0
+    mov1, mov2 = len(h1.passos), len(h2.passos)
+    return "\n".join([
+        "\n=== RELATÓRIO COMPARATIVO DE HEURÍSTICAS ===\n",
+        f"H1 (Fraca) - Custo: {h1.custo_total:.2f} | Nós Expandidos: {e1} | Custo Médio por Nó: {media1:.2f} | Movimentos: {mov1}",
+        f"H2 (Forte) - Custo: {h2.custo_total:.2f} | Nós Expandidos: {e2} | Custo Médio por Nó: {media2:.2f} | Movimentos: {mov2}",
+        f"\nComparação entre as heurísticas:",
+        f"H2 expandiu {abs(ganho_nos):.1f}% {'menos' if ganho_nos>0 else 'mais'} nós.",
+        f"\nResumo Comparativo:",
+        f"H1 teve {mov1} movimentos e H2 teve {mov2} movimentos.",
+        f"H2 foi {'mais eficiente' if ganho_nos > 0 else 'menos eficiente'} com relação ao número de nós expandidos.",
+        f"H1 tem um custo médio de {media1:.2f} por nó, enquanto H2 tem {media2:.2f}.",
+    ])
+
+
+def gerar_relatorio_caminho(tabuleiro, caminho, custo_total, heuristica="h1"):
+    """
+    Gera um relatório detalhado do caminho encontrado e seus custos acumulados.
+    Inclui também a heurística utilizada (H1, H2 ou nula). Imprime o texto e
+    devolve o RelatorioCaminho.
+    """
+    relatorio = montar_relatorio(tabuleiro, caminho, custo_total, heuristica)
+    print(formatar_texto(relatorio))
+    return relatorio
+
+
+# -------------------------------------------------------------
+# Agregação de muitos relatórios (uma passada, memória constante)
+# -------------------------------------------------------------
+class EstatisticaCorrente:
+    """Contagem, média, desvio (Welford), mínimo e máximo de uma série."""
+    __slots__ = ("n", "media", "_m2", "minimo", "maximo")
+
+    def __init__(self):
+        self.n, self.media, self._m2 = 0, 0.0, 0.0
+        self.minimo, self.maximo = INFINITO, -INFINITO
+
+    def adicionar(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.media
+        self.media += delta / self.n
+        self._m2 += delta * (x - self.media)
+        self.minimo = min(self.minimo, x)
+        self.maximo = max(self.maximo, x)
+
+    def combinar(self, outra: "EstatisticaCorrente") -> None:
+        """Junta outra série (agregações parciais feitas em paralelo)."""
+        if outra.n == 0:
+            return
+        n = self.n + outra.n
+        delta = outra.media - self.media
+        self._m2 += outra._m2 + delta * delta * self.n * outra.n / n
+        self.media += delta * outra.n / n
+        self.n = n
+        self.minimo = min(self.minimo, outra.minimo)
+        self.maximo = max(self.maximo, outra.maximo)
+
+    @property
+    def desvio(self) -> float:
+        return math.sqrt(self._m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+    def como_dict(self) -> dict:
+        if self.n == 0:
+            return {"n": 0}
+        return {"n": self.n, "media": self.media, "desvio": self.desvio,
+                "min": self.minimo, "max": self.maximo}
+
+
+class AgregadorRelatorios:
+    """
+    Resume relatórios por heurística numa única passada: quantos, quantos
+    sem caminho ou acima do limite teórico, estatísticas de custo, movimentos
+    e nós expandidos e a contagem de casas por terreno nos caminhos.
+    """
+
+    def __init__(self):
+        self._grupos: Dict[str, dict] = {}
+
+    def _grupo(self, heuristica: str) -> dict:
+        if heuristica not in self._grupos:
+            self._grupos[heuristica] = {
+                "relatorios": 0, "sem_caminho": 0, "acima_do_limite": 0,
+                "custo": EstatisticaCorrente(), "movimentos": EstatisticaCorrente(),
+                "expandidos": EstatisticaCorrente(), "terrenos": Counter(),
+            }
+        return self._grupos[heuristica]
+
+    def adicionar(self, relatorio: RelatorioCaminho) -> None:
+        g = self._grupo(relatorio.heuristica)
+        g["relatorios"] += 1
+        if relatorio.expandidos is not None:
+            g["expandidos"].adicionar(relatorio.expandidos)
+        if not relatorio.encontrado:
+            g["sem_caminho"] += 1
+            return
+        g["acima_do_limite"] += not relatorio.dentro_do_limite
+        g["custo"].adicionar(relatorio.custo_total)
+        g["movimentos"].adicionar(relatorio.movimentos)
+        g["terrenos"].update(p.terreno.value for p in relatorio.passos)
+
+    def combinar(self, outro: "AgregadorRelatorios") -> None:
+        for heuristica, o in outro._grupos.items():
+            g = self._grupo(heuristica)
+            for chave in ("relatorios", "sem_caminho", "acima_do_limite"):
+                g[chave] += o[chave]
+            for chave in ("custo", "movimentos", "expandidos"):
+                g[chave].combinar(o[chave])
+            g["terrenos"].update(o["terrenos"])
 
-    print("========================================================\n")
+    def resumo(self) -> dict:
+        """Resumo serializável em JSON, uma entrada por heurística."""
+        return {h: {"relatorios": g["relatorios"], "sem_caminho": g["sem_caminho"],
+                    "acima_do_limite": g["acima_do_limite"],
+                    "custo": g["custo"].como_dict(), "movimentos": g["movimentos"].como_dict(),
+                    "expandidos": g["expandidos"].como_dict(), "terrenos": dict(g["terrenos"])}
+                for h, g in sorted(self._grupos.items())}
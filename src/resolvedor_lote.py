@@ -0,0 +1,154 @@
+# =============================================================
+#  resolvedor_lote.py — Resolução de cenários em lote (sem interface)
+# =============================================================
+#
+#  Uso:
+#    python -m src.resolvedor_lote cenarios/ outro.json --heuristica h2 --saida resultados.jsonl
+#    zcat corpus.jsonl.gz | python -m src.resolvedor_lote - --processos 8
+#
+#  Cada cenário vira uma linha JSON com caminho, custo, nós expandidos e
+#  tempo. As fontes são lidas aos poucos (leitor_cenarios), então coleções
+#  de qualquer tamanho cabem em memória constante. Não importa pygame: roda
+#  em servidores e pipelines.
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from src.tabuleiro import Tabuleiro, Coordenada
+from src.busca_a_estrela import busca_a_estrela, HEURISTICAS, MODOS_BUSCA
+from src.leitor_cenarios import ler_cenarios
+from src.relatorio_custos import AgregadorRelatorios, RelatorioCaminho, montar_relatorio
+
+# (arquivo, linha, tabuleiro, início, objetivo, heurística, modo, com relatório?);
+# o tabuleiro viaja para os processos na forma compacta, ou só pelo caminho se
+# for mapeado
+Tarefa = Tuple[str, int, Tabuleiro, Coordenada, Coordenada, str, str, bool]
+# tarefas em voo por processo de trabalho: mantém a memória limitada
+TAREFAS_POR_PROCESSO = 4
+
+
+# -------------------------------------------------------------
+# Resolução (executada nos processos de trabalho)
+# -------------------------------------------------------------
+def resolver_tarefa(tarefa: Tarefa) -> dict:
+    """
+    Resolve um cenário e devolve o registro de saída (com o relatório
+    estruturado em "relatorio", se pedido).
+    """
+    arquivo, linha, tabuleiro, inicio, objetivo, heuristica, modo, com_relatorio = tarefa
+    estatisticas: dict = {}
+    t0 = time.perf_counter()
+    caminho, custo = busca_a_estrela(tabuleiro, inicio, objetivo, heuristica,
+                                     modo=modo, estatisticas=estatisticas)
+    tempo = time.perf_counter() - t0
+    registro = {
+        "arquivo": arquivo,
+        "linha": linha,
+        "heuristica": heuristica,
+        "modo": modo,
+        "inicio": list(inicio),
+        "objetivo": list(objetivo),
+        "caminho": [list(p) for p in caminho],
+        "custo": custo if caminho else None,  # JSON não tem infinito
+        "expandidos": estatisticas.get("expandidos", 0),
+        "tempo_s": round(tempo, 6),
+    }
+    if com_relatorio:
+        registro["relatorio"] = montar_relatorio(tabuleiro, caminho, custo, heuristica,
+                                                 registro["expandidos"]).como_dict()
+    return registro
+
+
+def resolver_lote(caminhos: Iterable[str], heuristica: str = "h2", modo: str = "unidirecional",
+                  processos: Optional[int] = None, relatorio: bool = False) -> Iterator[dict]:
+    """
+    Resolve os cenários das fontes (arquivos .json/.jsonl, diretórios, "-")
+    e produz um registro por cenário, na ordem de entrada; registros
+    inválidos viram {"arquivo", "linha", "erro"} sem interromper o lote.
+    processos=None usa todos os núcleos; processos=1 resolve no próprio
+    processo. No máximo TAREFAS_POR_PROCESSO × processos cenários ficam em
+    memória ao mesmo tempo. relatorio=True inclui o RelatorioCaminho de cada
+    cenário (como_dict) no registro.
+    """
+    if heuristica not in HEURISTICAS:
+        raise ValueError(f"Heurística desconhecida: {heuristica!r}")
+    if modo not in MODOS_BUSCA:
+        raise ValueError(f"Modo de busca desconhecido: {modo!r} (use {MODOS_BUSCA})")
+    processos = processos or os.cpu_count() or 1
+
+    # registros prontos e futuros, na ordem de entrada; o leitor chama ao_erro
+    # antes de produzir o cenário seguinte, então a ordem se mantém
+    pendentes: deque = deque()
+
+    def ao_erro(fonte: str, linha: int, mensagem: str) -> None:
+        pendentes.append({"arquivo": fonte, "linha": linha, "erro": mensagem})
+
+    executor = ProcessPoolExecutor(max_workers=processos) if processos > 1 else None
+    limite = TAREFAS_POR_PROCESSO * processos
+    try:
+        for tabuleiro, inicio, objetivo, meta in ler_cenarios(caminhos, ao_erro):
+            tarefa = (meta["fonte"], meta["linha"], tabuleiro, inicio, objetivo, heuristica, modo,
+                      relatorio)
+            pendentes.append(executor.submit(resolver_tarefa, tarefa) if executor
+                             else resolver_tarefa(tarefa))
+            while pendentes and (len(pendentes) > limite or not isinstance(pendentes[0], Future)):
+                item = pendentes.popleft()
+                yield item.result() if isinstance(item, Future) else item
+        while pendentes:
+            item = pendentes.popleft()
+            yield item.result() if isinstance(item, Future) else item
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+# -------------------------------------------------------------
+# Linha de comando
+# -------------------------------------------------------------
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.resolvedor_lote",
+        description="Resolve cenários JSON em lote e escreve um resultado JSON por linha.")
+    parser.add_argument("caminhos", nargs="+",
+                        help="arquivos .json/.jsonl(.gz), diretórios ou - (entrada padrão)")
+    parser.add_argument("--heuristica", default="h2", choices=sorted(HEURISTICAS))
+    parser.add_argument("--modo", default="unidirecional", choices=MODOS_BUSCA)
+    parser.add_argument("--processos", type=int, default=None,
+                        help="processos de trabalho (padrão: todos os núcleos)")
+    parser.add_argument("--saida", default="-", help="arquivo JSON lines (padrão: saída padrão)")
+    parser.add_argument("--relatorio", action="store_true",
+                        help="inclui o relatório estruturado (passos, limites teóricos) em cada linha")
+    parser.add_argument("--resumo", metavar="ARQUIVO",
+                        help="grava estatísticas agregadas de todos os relatórios (JSON)")
+    args = parser.parse_args(argv)
+
+    agregador = AgregadorRelatorios() if args.resumo else None
+    saida = sys.stdout if args.saida == "-" else open(args.saida, "w", encoding="utf-8")
+    falhas = 0
+    try:
+        for registro in resolver_lote(args.caminhos, args.heuristica, args.modo, args.processos,
+                                      relatorio=args.relatorio or agregador is not None):
+            falhas += "erro" in registro
+            if agregador is not None and "relatorio" in registro:
+                agregador.adicionar(RelatorioCaminho.de_dict(registro["relatorio"]))
+                if not args.relatorio:
+                    del registro["relatorio"]
+            saida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+    if agregador is not None:
+        with open(args.resumo, "w", encoding="utf-8") as f:
+            json.dump(agregador.resumo(), f, ensure_ascii=False, indent=1)
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
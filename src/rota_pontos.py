@@ -0,0 +1,237 @@
+# =============================================================
+#  rota_pontos.py — Rotas do cavalo por vários pontos de passagem
+# =============================================================
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.tabuleiro import Tabuleiro, Coordenada, INFINITO
+from src.campo_distancias import CampoDistancias
+
+# até quantos pontos a melhor ordem é exata (Held-Karp, O(2^k · k²)); acima, aproximada
+LIMITE_EXATO = 13
+# maior trecho deslocado de uma vez pelo Or-opt na ordem aproximada
+TRECHO_OR_OPT = 3
+
+
+@dataclass
+class RotaPontos:
+    """
+    Rota que passa pelos pontos na ordem `ordem` (índices da lista dada).
+    `caminho` é a costura dos trechos (cada junção aparece uma vez) e pode
+    ser usado como o de busca_a_estrela: montar_relatorio, QuadroBusca.
+    Sem rota possível, caminho = [] e custo = inf.
+    """
+    pontos: List[Coordenada]
+    ordem: List[int]
+    trechos: List[List[Coordenada]] = field(default_factory=list)
+    custos_trechos: List[float] = field(default_factory=list)
+    caminho: List[Coordenada] = field(default_factory=list)
+    custo: float = INFINITO
+    exata: bool = True  # False se a ordem veio da heurística
+
+    @property
+    def encontrada(self) -> bool:
+        return bool(self.caminho)
+
+    @property
+    def visitados(self) -> List[Coordenada]:
+        """Os pontos na ordem em que a rota passa por eles."""
+        return [self.pontos[i] for i in self.ordem]
+
+    def relatorio(self, tabuleiro: Tabuleiro):
+        """RelatorioCaminho da rota costurada (relatorio_custos)."""
+        from src.relatorio_custos import montar_relatorio
+        return montar_relatorio(tabuleiro, self.caminho, self.custo, heuristica="pontos")
+
+
+# -------------------------------------------------------------
+# Matriz de custos entre os pontos
+# -------------------------------------------------------------
+def campos_dos_pontos(tabuleiro: Tabuleiro,
+                      pontos: Sequence[Coordenada]) -> Dict[Coordenada, CampoDistancias]:
+    """
+    Um campo de distâncias (Dijkstra reverso) por ponto distinto. Os campos
+    não entram no cache do tabuleiro: vivem só enquanto quem chamou os
+    mantiver, em vez de ficar k campos do tamanho do tabuleiro pendurados nele.
+    """
+    return {p: CampoDistancias(tabuleiro, p) for p in dict.fromkeys(tuple(p) for p in pontos)}
+
+
+def matriz_custos(tabuleiro: Tabuleiro, pontos: Sequence[Coordenada],
+                  campos: Optional[Dict[Coordenada, CampoDistancias]] = None) -> np.ndarray:
+    """
+    custos[i, j] = custo ótimo de pontos[i] até pontos[j] (inf se não há
+    caminho). Um Dijkstra reverso por ponto dá a coluna inteira; a matriz
+    não é simétrica, pois o custo é o de entrar em cada casa. `campos`
+    (de campos_dos_pontos) evita refazer os Dijkstras.
+    """
+    if campos is None:
+        campos = campos_dos_pontos(tabuleiro, pontos)
+    ids = np.array([tabuleiro.id_casa(p) for p in pontos], dtype=np.intp)
+    k = len(pontos)
+    custos = np.empty((k, k))
+    for j, p in enumerate(pontos):
+        campo = campos[tuple(p)]
+        campo.custo(tuple(p))  # recalcula se o tabuleiro mudou
+        custos[:, j] = np.frombuffer(campo.custos, dtype=np.float64)[ids]
+    np.fill_diagonal(custos, 0.0)
+    return custos
+
+
+def custo_da_ordem(custos: np.ndarray, ordem: Sequence[int]) -> float:
+    return float(sum(custos[a, b] for a, b in zip(ordem, ordem[1:])))
+
+
+# -------------------------------------------------------------
+# Ordem de visita
+# -------------------------------------------------------------
+def ordem_exata(custos: np.ndarray, fixar_fim: bool = False) -> Tuple[List[int], float]:
+    """
+    Melhor ordem começando no ponto 0 (e terminando no último, com
+    fixar_fim), por programação dinâmica de Held-Karp sobre os subconjuntos
+    dos pontos livres. Devolve (ordem, custo); custo inf se nenhuma ordem
+    é viável.
+    """
+    k = len(custos)
+    fim = k - 1 if fixar_fim and k > 1 else None
+    livres = [i for i in range(1, k) if i != fim]
+    m = len(livres)
+    if m == 0:
+        ordem = [0] + ([fim] if fim is not None else [])
+        return ordem, custo_da_ordem(custos, ordem)
+
+    sub = custos[np.ix_(livres, livres)]            # entre pontos livres
+    bits = 1 << np.arange(m)
+    # melhor[S, j]: menor custo saindo de 0, visitando o conjunto S e parando em j ∈ S
+    melhor = np.full((1 << m, m), INFINITO)
+    anterior = np.full((1 << m, m), -1, dtype=np.int64)
+    melhor[bits, np.arange(m)] = custos[0, livres]
+    for conjunto in range(1, 1 << m):
+        dentro = (conjunto & bits) != 0
+        if dentro.sum() < 2:
+            continue
+        # para cada j do conjunto: melhor[S sem j, i] + custo i → j
+        sem_j = conjunto ^ bits
+        candidatos = melhor[sem_j].T + sub             # [i, j]
+        candidatos[~dentro, :] = INFINITO
+        i_melhor = np.argmin(candidatos, axis=0)
+        valores = candidatos[i_melhor, np.arange(m)]
+        melhor[conjunto, dentro] = valores[dentro]
+        anterior[conjunto, dentro] = i_melhor[dentro]
+
+    todos = (1 << m) - 1
+    finais = melhor[todos] + (custos[livres, fim] if fim is not None else 0.0)
+    j = int(np.argmin(finais))
+    custo = float(finais[j])
+    if custo == INFINITO:
+        return [], INFINITO
+    sequencia, conjunto = [], todos
+    while j >= 0:
+        sequencia.append(livres[j])
+        j, conjunto = int(anterior[conjunto, j]), conjunto ^ (1 << j)
+    ordem = [0] + sequencia[::-1] + ([fim] if fim is not None else [])
+    return ordem, custo
+
+
+def ordem_aproximada(custos: np.ndarray, fixar_fim: bool = False) -> Tuple[List[int], float]:
+    """
+    Ordem para muitos pontos: vizinho mais próximo a partir do ponto 0 e
+    depois Or-opt (desloca trechos de até TRECHO_OR_OPT pontos enquanto o
+    custo cai). Funciona com custos assimétricos; não garante o ótimo.
+    """
+    k = len(custos)
+    fim = k - 1 if fixar_fim and k > 1 else None
+    restantes = set(range(1, k)) - {fim}
+    ordem = [0]
+    while restantes:
+        atual = ordem[-1]
+        proximo = min(restantes, key=lambda j: (custos[atual, j], j))
+        ordem.append(proximo)
+        restantes.remove(proximo)
+    if fim is not None:
+        ordem.append(fim)
+
+    # inf vira um custo finito enorme: as diferenças abaixo continuam definidas
+    finitos = custos[np.isfinite(custos)]
+    grande = (float(finitos.max()) + 1.0) * k * 4 if finitos.size else 1.0
+    c = np.where(np.isfinite(custos), custos, grande).tolist()
+
+    # pontos que podem mudar de lugar: todos menos o primeiro (e o último fixo)
+    n = len(ordem)
+    ultimo_livre = n - (2 if fim is not None else 1)
+    melhorou = True
+    while melhorou:
+        melhorou = False
+        for tamanho in range(1, TRECHO_OR_OPT + 1):
+            i = 1
+            while i + tamanho - 1 <= ultimo_livre:
+                trecho = ordem[i:i + tamanho]
+                s, e = trecho[0], trecho[-1]
+                antes = ordem[i - 1]
+                depois = ordem[i + tamanho] if i + tamanho < n else None
+                # quanto se economiza tirando o trecho do lugar
+                ganho = c[antes][s] + (c[e][depois] - c[antes][depois] if depois is not None else 0.0)
+                resto = ordem[:i] + ordem[i + tamanho:]
+                melhor_pos, melhor_delta = None, -1e-9
+                for pos in range(1, len(resto) + (0 if fim is not None else 1)):
+                    if pos == i:
+                        continue
+                    a = resto[pos - 1]
+                    b = resto[pos] if pos < len(resto) else None
+                    delta = c[a][s] + (c[e][b] - c[a][b] if b is not None else 0.0) - ganho
+                    if delta < melhor_delta:
+                        melhor_pos, melhor_delta = pos, delta
+                if melhor_pos is not None:
+                    ordem = resto[:melhor_pos] + trecho + resto[melhor_pos:]
+                    melhorou = True
+                i += 1
+    return ordem, custo_da_ordem(custos, ordem)
+
+
+# -------------------------------------------------------------
+# Rota completa
+# -------------------------------------------------------------
+def rota_por_pontos(tabuleiro: Tabuleiro, pontos: Sequence[Coordenada], melhor_ordem: bool = True,
+                    fixar_fim: bool = False, limite_exato: int = LIMITE_EXATO) -> RotaPontos:
+    """
+    Rota do cavalo saindo de pontos[0] e passando por todos os outros:
+    na ordem dada (melhor_ordem=False) ou na de menor custo, exata até
+    `limite_exato` pontos e aproximada acima disso. fixar_fim=True mantém
+    pontos[-1] como último ponto. Os trechos saem dos mesmos campos de
+    distância usados na matriz, sem novas buscas; os campos são soltos ao
+    terminar.
+    """
+    pontos = [tuple(p) for p in pontos]
+    if not pontos:
+        raise ValueError("Informe ao menos um ponto")
+    for p in pontos:
+        if not tabuleiro.dentro_dos_limites(p):
+            raise ValueError(f"Ponto fora do tabuleiro: {list(p)}")
+
+    campos = campos_dos_pontos(tabuleiro, pontos)
+    custos = matriz_custos(tabuleiro, pontos, campos)
+    exata = True
+    if not melhor_ordem:
+        ordem = list(range(len(pontos)))
+        custo = custo_da_ordem(custos, ordem)
+    elif len(pontos) <= limite_exato:
+        ordem, custo = ordem_exata(custos, fixar_fim)
+    else:
+        ordem, custo = ordem_aproximada(custos, fixar_fim)
+        exata = False
+
+    rota = RotaPontos(pontos, ordem, exata=exata)
+    if not ordem or custo == INFINITO:
+        return rota
+    caminho = [pontos[ordem[0]]]
+    for a, b in zip(ordem, ordem[1:]):
+        trecho, custo_trecho = campos[pontos[b]].caminho(pontos[a])
+        rota.trechos.append(trecho)
+        rota.custos_trechos.append(custo_trecho)
+        caminho.extend(trecho[1:])
+    rota.caminho, rota.custo = caminho, custo
+    return rota
@@ -0,0 +1,500 @@
+# =============================================================
+#  servidor_rotas.py — Serviço local de rotas (asyncio, JSON lines)
+# =============================================================
+#
+#  Uso:
+#    python -m src.servidor_rotas --unix /tmp/rotas.sock
+#    python -m src.servidor_rotas --porta 8765 --processos 4
+#
+#  Outros processos registram um tabuleiro uma vez e depois pedem quantas
+#  rotas quiserem pela mesma conexão, sem pagar a partida do Python nem a
+#  leitura do tabuleiro a cada consulta. Protocolo: um objeto JSON por
+#  linha em cada sentido; "id" (opcional) volta na resposta. Os pedidos
+#  podem ser enviados em sequência sem esperar as respostas, que saem na
+#  ordem dos pedidos.
+#
+#    {"id": 1, "op": "registrar", "tabuleiro": {"grid": [...], "costs": {...}}}
+#      → {"id": 1, "ok": true, "tabuleiro": "3f9c...", "linhas": 8, "colunas": 8}
+#    {"id": 2, "op": "resolver", "tabuleiro": "3f9c...", "inicio": [7, 0],
+#     "objetivo": [0, 7], "heuristica": "h2", "modo": "unidirecional"}
+#      → {"id": 2, "ok": true, "caminho": [[7, 0], ...], "custo": 5.5,
+#         "expandidos": 21, "cache": false, "tempo_s": 0.0004}
+#    {"id": 3, "op": "descartar", "tabuleiro": "3f9c..."}
+#    {"id": 4, "op": "estatisticas"}  → contadores e percentis de latência
+#    Falhas: {"id": ..., "ok": false, "erro": "mensagem"}
+#
+#  As buscas rodam num pool de processos; o laço de eventos só lê, despacha
+#  e escreve. Cada tabuleiro registrado é gravado no formato binário
+#  (tabuleiro_binario) numa pasta temporária e os processos o abrem por mmap
+#  uma vez, guardando o tabuleiro com suas pré-computações (marcos ALT,
+#  tabelas das heurísticas) e o cache de buscas entre um pedido e outro.
+
+from __future__ import annotations
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import socket
+import struct
+import sys
+import tempfile
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from src.tabuleiro import Tabuleiro, Coordenada
+from src.busca_a_estrela import HEURISTICAS, MODOS_BUSCA
+from src.cache_buscas import CACHE_PADRAO
+from src.tabuleiro_binario import EXTENSAO_BINARIO, abrir_binario, salvar_binario
+
+# maior linha aceita (registro de tabuleiros grandes)
+LIMITE_LINHA = 64 * 1024 * 1024
+# pedidos em andamento por conexão antes de parar de ler (contrapressão)
+PEDIDOS_POR_CONEXAO = 256
+# amostras de latência guardadas para os percentis (as mais recentes)
+AMOSTRAS_LATENCIA = 10_000
+PERCENTIS = (50, 90, 99)
+# tabuleiros mantidos abertos (com pré-computações) em cada processo
+TABULEIROS_POR_PROCESSO = 64
+
+
+def identificador(tabuleiro: Tabuleiro) -> str:
+    """Identificador pelo conteúdo: o mesmo tabuleiro registrado duas vezes tem o mesmo."""
+    linhas, colunas, celulas, custos = tabuleiro.compactar()
+    h = hashlib.blake2b(struct.pack("<II4d", linhas, colunas, *custos), digest_size=8)
+    h.update(celulas)
+    return h.hexdigest()
+
+
+# -------------------------------------------------------------
+# Resolução (executada nos processos de trabalho)
+# -------------------------------------------------------------
+# ident -> (tabuleiro, arquivo, inode do arquivo quando foi aberto)
+_abertos: "OrderedDict[str, Tuple[Tabuleiro, str, int]]" = OrderedDict()
+_descartes_vistos = 0
+
+
+def _esquecer_descartados(descartes: int) -> None:
+    """
+    O servidor descartou tabuleiros desde o último pedido: solta os que não
+    têm mais arquivo (ou têm um novo, de um novo registro), com seus mapas
+    e pré-computações.
+    """
+    global _descartes_vistos
+    if descartes == _descartes_vistos:
+        return
+    _descartes_vistos = descartes
+    for ident, (_, arquivo, inode) in list(_abertos.items()):
+        try:
+            atual = os.stat(arquivo).st_ino
+        except FileNotFoundError:
+            atual = None
+        if atual != inode:
+            del _abertos[ident]
+
+
+def _tabuleiro_do_processo(ident: str, arquivo: str) -> Tabuleiro:
+    aberto = _abertos.get(ident)
+    if aberto is None:
+        # o arquivo foi gravado e conferido no registro
+        aberto = _abertos[ident] = (abrir_binario(arquivo, "r", validar=False)[0], arquivo,
+                                    os.stat(arquivo).st_ino)
+        if len(_abertos) > TABULEIROS_POR_PROCESSO:
+            _abertos.popitem(last=False)
+    else:
+        _abertos.move_to_end(ident)
+    return aberto[0]
+
+
+def resolver_no_processo(ident: str, arquivo: str, inicio: Coordenada, objetivo: Coordenada,
+                         heuristica: str, modo: str, descartes: int = 0) -> dict:
+    """
+    Uma busca, com o tabuleiro e o cache que o processo já tem. `descartes`
+    é quantos tabuleiros o servidor já descartou (ver _esquecer_descartados).
+    """
+    _esquecer_descartados(descartes)
+    tabuleiro = _tabuleiro_do_processo(ident, arquivo)
+    acertos = CACHE_PADRAO.acertos
+    t0 = time.perf_counter()
+    caminho, custo, explorados = CACHE_PADRAO.buscar(tabuleiro, inicio, objetivo, heuristica, modo)
+    return {
+        "caminho": [list(p) for p in caminho],
+        "custo": custo if caminho else None,  # JSON não tem infinito
+        "expandidos": len(explorados),
+        "cache": CACHE_PADRAO.acertos > acertos,
+        "tempo_s": round(time.perf_counter() - t0, 6),
+    }
+
+
+# -------------------------------------------------------------
+# Estado do servidor
+# -------------------------------------------------------------
+class Latencias:
+    """Amostras recentes de latência (segundos) e quantos pedidos houve ao todo."""
+
+    def __init__(self, limite: int = AMOSTRAS_LATENCIA):
+        self.amostras: Deque[float] = deque(maxlen=limite)
+        self.total = 0
+
+    def adicionar(self, segundos: float) -> None:
+        self.amostras.append(segundos)
+        self.total += 1
+
+    def resumo(self) -> Dict[str, Any]:
+        """Percentis (interpolados entre as amostras vizinhas) e máximo, em ms."""
+        ordenadas = sorted(self.amostras)
+        resumo: Dict[str, Any] = {"pedidos": self.total}
+        if not ordenadas:
+            return resumo
+        for p in PERCENTIS:
+            pos = (len(ordenadas) - 1) * p / 100
+            i = int(pos)
+            j = min(i + 1, len(ordenadas) - 1)
+            valor = ordenadas[i] + (ordenadas[j] - ordenadas[i]) * (pos - i)
+            resumo[f"p{p}_ms"] = round(valor * 1000, 3)
+        resumo["max_ms"] = round(ordenadas[-1] * 1000, 3)
+        return resumo
+
+
+@dataclass
+class TabuleiroRegistrado:
+    """Um tabuleiro do registro: o arquivo que os processos abrem e suas contagens."""
+    ident: str
+    arquivo: str
+    tabuleiro: Tabuleiro  # aberto também aqui, para validar as posições
+    registros: int = 1
+    resolucoes: int = 0
+    acertos_cache: int = 0
+    latencias: Latencias = field(default_factory=Latencias)
+
+    def resumo(self) -> Dict[str, Any]:
+        return {"linhas": self.tabuleiro.linhas, "colunas": self.tabuleiro.colunas,
+                "registros": self.registros, "resolucoes": self.resolucoes,
+                "acertos_cache": self.acertos_cache, "latencia": self.latencias.resumo()}
+
+
+class ErroPedido(ValueError):
+    """Pedido inválido: vira {"ok": false, "erro": ...} sem derrubar a conexão."""
+
+
+def _posicao(pedido: dict, nome: str, tabuleiro: Tabuleiro) -> Coordenada:
+    pos = pedido.get(nome)
+    if (not isinstance(pos, list) or len(pos) != 2
+            or not all(isinstance(v, int) and not isinstance(v, bool) for v in pos)):
+        raise ErroPedido(f"{nome} deve ser [linha, coluna]")
+    pos = tuple(pos)
+    if not tabuleiro.dentro_dos_limites(pos):
+        raise ErroPedido(f"{nome} fora do tabuleiro: {list(pos)}")
+    return pos
+
+
+class ServidorRotas:
+    """
+    Registro de tabuleiros, despacho das buscas para o pool e estatísticas.
+    tratar(pedido) atende um pedido já decodificado; servir_unix/servir_tcp
+    abrem o socket e falam o protocolo de linhas.
+    """
+
+    def __init__(self, processos: Optional[int] = None):
+        self.processos = processos or os.cpu_count() or 1
+        self._pool = ProcessPoolExecutor(max_workers=self.processos)
+        self._pasta = tempfile.mkdtemp(prefix="rotas-")
+        self.tabuleiros: Dict[str, TabuleiroRegistrado] = {}
+        self.latencias: Dict[str, Latencias] = {}
+        self.erros = 0
+        self.conexoes = 0
+        self.conexoes_abertas = 0
+        self.descartes = 0
+        self.inicio = time.monotonic()
+
+    # ---------- Operações ----------
+    def _registrar_sincrono(self, dados: Any) -> TabuleiroRegistrado:
+        # fora do laço de eventos: ler e gravar um tabuleiro grande leva tempo
+        if not isinstance(dados, dict):
+            raise ErroPedido("tabuleiro deve ser um objeto no formato de carregar_de_json")
+        try:
+            tabuleiro = Tabuleiro.carregar_de_json(dados)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ErroPedido(f"tabuleiro inválido: {type(e).__name__}: {e}") from None
+        ident = identificador(tabuleiro)
+        arquivo = os.path.join(self._pasta, ident + EXTENSAO_BINARIO)
+        if not os.path.exists(arquivo):
+            # grava à parte e troca de uma vez: outro registro do mesmo tabuleiro
+            # (ou um processo do pool) pode estar abrindo ou mapeando `arquivo`
+            fd, temporario = tempfile.mkstemp(dir=self._pasta, suffix=".parcial")
+            os.close(fd)
+            try:
+                salvar_binario(tabuleiro, temporario)
+                os.replace(temporario, arquivo)
+            except BaseException:
+                os.remove(temporario)
+                raise
+        return TabuleiroRegistrado(ident, arquivo, abrir_binario(arquivo, "r")[0])
+
+    async def _registrar(self, pedido: dict) -> dict:
+        loop = asyncio.get_running_loop()
+        novo = await loop.run_in_executor(None, self._registrar_sincrono, pedido.get("tabuleiro"))
+        registrado = self.tabuleiros.get(novo.ident)
+        if registrado is None:
+            registrado = self.tabuleiros[novo.ident] = novo
+        else:
+            registrado.registros += 1
+        t = registrado.tabuleiro
+        return {"tabuleiro": registrado.ident, "linhas": t.linhas, "colunas": t.colunas}
+
+    def _registrado(self, pedido: dict) -> TabuleiroRegistrado:
+        registrado = self.tabuleiros.get(pedido.get("tabuleiro"))
+        if registrado is None:
+            raise ErroPedido(f"tabuleiro não registrado: {pedido.get('tabuleiro')!r}")
+        return registrado
+
+    async def _resolver(self, pedido: dict) -> dict:
+        registrado = self._registrado(pedido)
+        inicio = _posicao(pedido, "inicio", registrado.tabuleiro)
+        objetivo = _posicao(pedido, "objetivo", registrado.tabuleiro)
+        heuristica = pedido.get("heuristica", "h2")
+        modo = pedido.get("modo", "unidirecional")
+        if heuristica not in HEURISTICAS:
+            raise ErroPedido(f"Heurística desconhecida: {heuristica!r}")
+        if modo not in MODOS_BUSCA:
+            raise ErroPedido(f"Modo de busca desconhecido: {modo!r} (use {MODOS_BUSCA})")
+        t0 = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        resposta = await loop.run_in_executor(
+            self._pool, resolver_no_processo, registrado.ident, registrado.arquivo,
+            inicio, objetivo, heuristica, modo, self.descartes)
+        registrado.resolucoes += 1
+        registrado.acertos_cache += resposta["cache"]
+        registrado.latencias.adicionar(time.perf_counter() - t0)
+        return resposta
+
+    async def _descartar(self, pedido: dict) -> dict:
+        registrado = self.tabuleiros.pop(self._registrado(pedido).ident)
+        # os processos podem ainda ter o arquivo mapeado: no POSIX isso basta, e
+        # eles o soltam ao ver o novo número de descartes no próximo pedido
+        os.remove(registrado.arquivo)
+        self.descartes += 1
+        return {"tabuleiro": registrado.ident}
+
+    async def _estatisticas(self, pedido: dict) -> dict:
+        return {
+            "ativo_s": round(time.monotonic() - self.inicio, 3),
+            "processos": self.processos,
+            "conexoes": self.conexoes,
+            "conexoes_abertas": self.conexoes_abertas,
+            "erros": self.erros,
+            "operacoes": {op: lat.resumo() for op, lat in self.latencias.items()},
+            "tabuleiros": {ident: r.resumo() for ident, r in self.tabuleiros.items()},
+        }
+
+    OPERACOES = {"registrar": _registrar, "resolver": _resolver,
+                 "descartar": _descartar, "estatisticas": _estatisticas}
+
+    async def tratar(self, pedido: Any) -> dict:
+        """Atende um pedido decodificado e devolve a resposta (com o "id" do pedido)."""
+        t0 = time.perf_counter()
+        ident = pedido.get("id") if isinstance(pedido, dict) else None
+        op = pedido.get("op") if isinstance(pedido, dict) else None
+        try:
+            if op not in self.OPERACOES:
+                raise ErroPedido(f"operação desconhecida: {op!r} (use {tuple(self.OPERACOES)})")
+            resposta = {"id": ident, "ok": True, **await self.OPERACOES[op](self, pedido)}
+        except ErroPedido as e:
+            self.erros += 1
+            resposta = {"id": ident, "ok": False, "erro": str(e)}
+        except Exception as e:  # falha na busca: o servidor continua atendendo
+            self.erros += 1
+            resposta = {"id": ident, "ok": False, "erro": f"{type(e).__name__}: {e}"}
+        if op in self.OPERACOES:
+            self.latencias.setdefault(op, Latencias()).adicionar(time.perf_counter() - t0)
+        return resposta
+
+    # ---------- Conexões ----------
+    async def _atender(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        self.conexoes += 1
+        self.conexoes_abertas += 1
+        # respostas na ordem dos pedidos; a fila limitada faz a leitura esperar
+        pendentes: asyncio.Queue = asyncio.Queue(PEDIDOS_POR_CONEXAO)
+
+        async def escrever():
+            while True:
+                tarefa = await pendentes.get()
+                if tarefa is None:
+                    return
+                resposta = await tarefa
+                escritor.write(json.dumps(resposta, ensure_ascii=False).encode("utf-8") + b"\n")
+                await escritor.drain()
+
+        escrita = asyncio.create_task(escrever())
+
+        async def enfileirar(tarefa) -> bool:
+            # se o cliente some, a escrita morre e ninguém mais esvazia a fila:
+            # não fica esperando vaga para sempre
+            colocar = asyncio.ensure_future(pendentes.put(tarefa))
+            await asyncio.wait((colocar, escrita), return_when=asyncio.FIRST_COMPLETED)
+            if not colocar.done():
+                colocar.cancel()
+                return False
+            return not escrita.done()
+
+        try:
+            while True:
+                try:
+                    linha = await leitor.readline()
+                except ValueError:  # linha maior que LIMITE_LINHA
+                    self.erros += 1
+                    await enfileirar(_pronta({"id": None, "ok": False, "erro": "linha longa demais"}))
+                    break
+                if not linha:
+                    break
+                if not linha.strip():
+                    continue
+                try:
+                    pedido = json.loads(linha)
+                except ValueError as e:
+                    self.erros += 1
+                    tarefa = _pronta({"id": None, "ok": False, "erro": f"JSON inválido: {e}"})
+                else:
+                    tarefa = asyncio.ensure_future(self.tratar(pedido))
+                if not await enfileirar(tarefa):
+                    tarefa.cancel()
+                    break
+            if await enfileirar(None):
+                await escrita
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            escrita.cancel()
+            # pedidos ainda na fila não têm mais para quem responder
+            while not pendentes.empty():
+                tarefa = pendentes.get_nowait()
+                if tarefa is not None:
+                    tarefa.cancel()
+            if escrita.done() and not escrita.cancelled():
+                escrita.exception()  # cliente que foi embora: já tratado acima
+            self.conexoes_abertas -= 1
+            escritor.close()
+
+    async def servir_unix(self, caminho: str) -> asyncio.AbstractServer:
+        return await asyncio.start_unix_server(self._atender, path=caminho, limit=LIMITE_LINHA)
+
+    async def servir_tcp(self, host: str = "127.0.0.1", porta: int = 8765) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self._atender, host, porta, limit=LIMITE_LINHA)
+
+    def fechar(self) -> None:
+        """Encerra o pool e apaga os arquivos dos tabuleiros."""
+        self._pool.shutdown(cancel_futures=True)
+        shutil.rmtree(self._pasta, ignore_errors=True)
+
+
+def _pronta(resposta: dict) -> asyncio.Future:
+    futuro = asyncio.get_running_loop().create_future()
+    futuro.set_result(resposta)
+    return futuro
+
+
+# -------------------------------------------------------------
+# Cliente (síncrono, para scripts e outros processos Python)
+# -------------------------------------------------------------
+class ClienteRotas:
+    """
+    Conexão persistente com o servidor. resolver_varios envia todos os
+    pedidos antes de ler as respostas (pipeline).
+    """
+
+    def __init__(self, unix: Optional[str] = None, host: str = "127.0.0.1", porta: int = 8765):
+        if unix is not None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.connect(unix)
+        else:
+            self._socket = socket.create_connection((host, porta))
+        self._arquivo = self._socket.makefile("rwb")
+        self._proximo_id = 0
+
+    def _enviar(self, pedido: dict) -> None:
+        self._proximo_id += 1
+        pedido = {"id": self._proximo_id, **pedido}
+        self._arquivo.write(json.dumps(pedido, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    def _receber(self) -> dict:
+        linha = self._arquivo.readline()
+        if not linha:
+            raise ConnectionError("o servidor fechou a conexão")
+        resposta = json.loads(linha)
+        if not resposta.get("ok"):
+            raise ValueError(resposta.get("erro"))
+        return resposta
+
+    def pedir(self, pedido: dict) -> dict:
+        self._enviar(pedido)
+        self._arquivo.flush()
+        return self._receber()
+
+    def registrar(self, tabuleiro: dict) -> str:
+        """Registra um tabuleiro (formato de carregar_de_json) e devolve o identificador."""
+        return self.pedir({"op": "registrar", "tabuleiro": tabuleiro})["tabuleiro"]
+
+    def resolver(self, tabuleiro: str, inicio: Coordenada, objetivo: Coordenada,
+                 heuristica: str = "h2", modo: str = "unidirecional") -> dict:
+        return self.resolver_varios(tabuleiro, [(inicio, objetivo)], heuristica, modo)[0]
+
+    def resolver_varios(self, tabuleiro: str, pares: Iterable[Tuple[Coordenada, Coordenada]],
+                        heuristica: str = "h2", modo: str = "unidirecional") -> List[dict]:
+        n = 0
+        for inicio, objetivo in pares:
+            self._enviar({"op": "resolver", "tabuleiro": tabuleiro, "inicio": list(inicio),
+                          "objetivo": list(objetivo), "heuristica": heuristica, "modo": modo})
+            n += 1
+        self._arquivo.flush()
+        return [self._receber() for _ in range(n)]
+
+    def estatisticas(self) -> dict:
+        return self.pedir({"op": "estatisticas"})
+
+    def fechar(self) -> None:
+        self._arquivo.close()
+        self._socket.close()
+
+
+# -------------------------------------------------------------
+# Linha de comando
+# -------------------------------------------------------------
+async def _servir(args) -> None:
+    servidor = ServidorRotas(args.processos)
+    try:
+        if args.unix:
+            rede = await servidor.servir_unix(args.unix)
+            print(f"Servindo em {args.unix}", file=sys.stderr)
+        else:
+            rede = await servidor.servir_tcp(args.host, args.porta)
+            print(f"Servindo em {args.host}:{args.porta}", file=sys.stderr)
+        async with rede:
+            await rede.serve_forever()
+    finally:
+        servidor.fechar()
+        if args.unix and os.path.exists(args.unix):
+            os.remove(args.unix)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.servidor_rotas",
+                                     description="Serviço local de rotas do cavalo (JSON lines).")
+    parser.add_argument("--unix", metavar="CAMINHO", help="socket Unix (em vez de TCP)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--processos", type=int, default=None,
+                        help="processos de trabalho (padrão: todos os núcleos)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_servir(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,19 +3,28 @@
 # =============================================================
 
 from __future__ import annotations
-from dataclasses import dataclass
+import weakref
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Optional, Iterator, Any, Callable, Hashable
+
+import numpy as np
 
 # -------------------------------------------------------------
 # Tipos e limites básicos
 # -------------------------------------------------------------
 Coordenada = Tuple[int, int]  # (linha, coluna)
 
-def dentro_dos_limites(pos: Coordenada) -> bool:
-    """Retorna True se (linha, coluna) estiver dentro do tabuleiro 8x8."""
+TAMANHO_PADRAO = 8  # tabuleiro clássico de xadrez
+
+def dentro_dos_limites(pos: Coordenada,
+                       linhas: int = TAMANHO_PADRAO,
+                       colunas: int = TAMANHO_PADRAO) -> bool:
+    """Retorna True se (linha, coluna) estiver dentro de um tabuleiro linhas x colunas."""
     linha, coluna = pos
-    return 0 <= linha < 8 and 0 <= coluna < 8
+    return 0 <= linha < linhas and 0 <= coluna < colunas
 
 # -------------------------------------------------------------
 # Tipos de terreno e custos
@@ -34,20 +43,236 @@ CUSTOS_PADRAO: Dict[Terreno, float] = {
     Terreno.BARREIRA: float("inf"),  # bloqueio
 }
 
+# códigos compactos (1 byte por casa) usados no armazenamento da grade
+TERRENOS_POR_CODIGO: Tuple[Terreno, ...] = tuple(Terreno)
+CODIGO_TERRENO: Dict[Terreno, int] = {t: i for i, t in enumerate(TERRENOS_POR_CODIGO)}
+CODIGO_POR_NOME: Dict[str, int] = {t.value: i for i, t in enumerate(TERRENOS_POR_CODIGO)}
+
+# codificação compacta da grade no JSON: uma string por linha, uma letra por casa
+LETRA_TERRENO: Dict[Terreno, str] = {
+    Terreno.ESTRADA: "E",
+    Terreno.TERRA: "T",
+    Terreno.LAMA: "L",
+    Terreno.BARREIRA: "B",
+}
+_CODIGO_POR_LETRA = bytearray([255]) * 256
+for _terreno, _letra in LETRA_TERRENO.items():
+    for _l in (_letra, _letra.lower()):
+        _CODIGO_POR_LETRA[ord(_l)] = CODIGO_TERRENO[_terreno]
+_LETRA_POR_CODIGO = bytes(ord(LETRA_TERRENO[t]) for t in TERRENOS_POR_CODIGO).ljust(256, b"?")
+
+# deslocamentos em L (linha, coluna) — compartilhados por tabuleiro, índice e cavalo
+MOVIMENTOS_CAVALO: List[Coordenada] = [
+    (-2, -1), (-2, 1),
+    (-1, -2), (-1, 2),
+    (1, -2),  (1, 2),
+    (2, -1),  (2, 1),
+]
+
+INFINITO = float("inf")
+
+# derivados por objetivo guardados num tabuleiro (Tabuleiro.derivado): no máximo
+# CASAS_POR_OBJETIVO casas somando as entradas (num 512x512, 16 campos de
+# distância, ~50 MB), e ao menos DERIVADOS_POR_OBJETIVO_MINIMO entradas
+CASAS_POR_OBJETIVO = 4 * 1024 * 1024
+DERIVADOS_POR_OBJETIVO_MINIMO = 2
+
+# -------------------------------------------------------------
+# Índice de vizinhança do cavalo (CSR)
+# -------------------------------------------------------------
+class IndiceCavalo:
+    """
+    Vizinhança do cavalo pré-computada em formato CSR.
+
+    As casas são identificadas por id = linha * colunas + coluna. Os destinos
+    da casa u ficam em alvos[inicios[u]:inicios[u + 1]] e o custo de ENTRAR em
+    cada destino fica na mesma posição de custos (inf para barreiras). A
+    geometria (inicios/alvos) só depende do tamanho do tabuleiro; quando uma
+    casa muda de terreno apenas os custos das arestas que chegam nela mudam.
+    """
+    __slots__ = ("inicios", "alvos", "custos", "tabela")
+
+    def __init__(self, tabuleiro: "Tabuleiro"):
+        linhas, colunas = tabuleiro.linhas, tabuleiro.colunas
+        tabela = tabuleiro.tabela_custos()
+
+        # destinos[casa, k] = id do k-ésimo salto (ou -1 se sair do tabuleiro)
+        lin, col = np.divmod(np.arange(linhas * colunas, dtype=np.int32), np.int32(colunas))
+        destinos = np.full((linhas * colunas, len(MOVIMENTOS_CAVALO)), -1, dtype=np.int32)
+        for k, (dl, dc) in enumerate(MOVIMENTOS_CAVALO):
+            nl, nc = lin + dl, col + dc
+            ok = (nl >= 0) & (nl < linhas) & (nc >= 0) & (nc < colunas)
+            destinos[ok, k] = (nl * colunas + nc)[ok]
+        validos = destinos >= 0
+
+        # compacta em CSR (ordem de MOVIMENTOS_CAVALO dentro de cada casa)
+        alvos = destinos[validos]
+        inicios = np.zeros(linhas * colunas + 1, dtype=np.int32)
+        np.cumsum(validos.sum(axis=1, dtype=np.int32), out=inicios[1:])
+        custos = np.asarray(tabela, dtype=np.float64)[tabuleiro.matriz_codigos().ravel()[alvos]]
+
+        # array.array: indexação elemento a elemento barata no laço da busca
+        self.inicios = array("i", inicios.tobytes())
+        self.alvos = array("i", alvos.tobytes())
+        self.custos = array("d", custos.tobytes())
+        self.tabela = tabela
+
+    def vizinhos(self, casa: int) -> Iterator[Tuple[int, float]]:
+        """Itera (destino, custo_de_entrada) de todos os saltos dentro do tabuleiro."""
+        a, b = self.inicios[casa], self.inicios[casa + 1]
+        return zip(self.alvos[a:b], self.custos[a:b])
+
+    def atualizar_casa(self, casa: int, custo: float) -> None:
+        """Corrige localmente o custo das arestas que entram na casa alterada."""
+        inicios, alvos, custos = self.inicios, self.alvos, self.custos
+        # os saltos do cavalo são simétricos: quem chega em `casa` é vizinho dela
+        for k in range(inicios[casa], inicios[casa + 1]):
+            origem = alvos[k]
+            for j in range(inicios[origem], inicios[origem + 1]):
+                if alvos[j] == casa:
+                    custos[j] = custo
+                    break
+
+# -------------------------------------------------------------
+# Simetrias do tabuleiro (grupo diedral D4)
+# -------------------------------------------------------------
+# (troca_dimensoes, f(linha, coluna, linhas, colunas) → nova posição)
+# As funções só usam aritmética, então valem também para arrays NumPy.
+SIMETRIAS = (
+    (False, lambda l, c, L, C: (l, c)),                  # identidade
+    (True,  lambda l, c, L, C: (c, L - 1 - l)),          # rotação 90°
+    (False, lambda l, c, L, C: (L - 1 - l, C - 1 - c)),  # rotação 180°
+    (True,  lambda l, c, L, C: (C - 1 - c, l)),          # rotação 270°
+    (False, lambda l, c, L, C: (l, C - 1 - c)),          # espelho horizontal
+    (False, lambda l, c, L, C: (L - 1 - l, c)),          # espelho vertical
+    (True,  lambda l, c, L, C: (c, l)),                  # transposição
+    (True,  lambda l, c, L, C: (C - 1 - c, L - 1 - l)),  # anti-transposição
+)
+SIMETRIA_INVERSA = (0, 3, 2, 1, 4, 5, 6, 7)
+
+
+def dimensoes_simetria(s: int, linhas: int, colunas: int) -> Tuple[int, int]:
+    """Dimensões do tabuleiro depois de aplicar a simetria s."""
+    return (colunas, linhas) if SIMETRIAS[s][0] else (linhas, colunas)
+
+
+def aplicar_simetria(s: int, pos: Coordenada, linhas: int, colunas: int) -> Coordenada:
+    """Leva (linha, coluna) de um tabuleiro linhas x colunas para o tabuleiro transformado."""
+    return SIMETRIAS[s][1](pos[0], pos[1], linhas, colunas)
+
+
+# -------------------------------------------------------------
+# Impressão digital Zobrist (atualizada em O(1))
+# -------------------------------------------------------------
+_MASCARA_64 = (1 << 64) - 1
+_OURO_64 = 0x9E3779B97F4A7C15
+
+
+def chave_zobrist(casa: int, codigo: int) -> int:
+    """
+    Chave pseudoaleatória de 64 bits para (casa, terreno), via splitmix64.
+    Calculada sob demanda, sem tabela em memória (tabuleiros enormes).
+    """
+    z = (casa * len(TERRENOS_POR_CODIGO) + codigo + _OURO_64) & _MASCARA_64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASCARA_64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASCARA_64
+    return z ^ (z >> 31)
+
+
+def _chaves_zobrist_np(casas: np.ndarray, codigos: np.ndarray) -> np.ndarray:
+    """chave_zobrist vetorizada (uint64 com estouro modular, como a versão escalar)."""
+    z = casas.astype(np.uint64) * np.uint64(len(TERRENOS_POR_CODIGO))
+    z = z + codigos.astype(np.uint64) + np.uint64(_OURO_64)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+class ImpressaoZobrist:
+    """
+    Hash Zobrist do tabuleiro em cada uma das 8 orientações de SIMETRIAS.
+
+    valores[s] é o XOR das chaves (casa transformada, terreno) do tabuleiro
+    visto pela simetria s. Tabuleiros que são rotações/espelhos um do outro
+    compartilham o mesmo conjunto de valores.
+    """
+    __slots__ = ("valores",)
+
+    def __init__(self, tabuleiro: "Tabuleiro"):
+        linhas, colunas = tabuleiro.linhas, tabuleiro.colunas
+        codigos = tabuleiro.matriz_codigos().ravel()
+        lin, col = np.divmod(np.arange(linhas * colunas, dtype=np.int64), colunas)
+        with np.errstate(over="ignore"):
+            self.valores = []
+            for s, (_, f) in enumerate(SIMETRIAS):
+                nl, nc = f(lin, col, linhas, colunas)
+                casas = nl * dimensoes_simetria(s, linhas, colunas)[1] + nc
+                self.valores.append(int(np.bitwise_xor.reduce(_chaves_zobrist_np(casas, codigos))))
+
+    def atualizar_casa(self, tabuleiro: "Tabuleiro", casa: int, antigo: int, novo: int) -> None:
+        """Troca a chave da casa alterada em todas as orientações: O(1)."""
+        linhas, colunas = tabuleiro.linhas, tabuleiro.colunas
+        pos = divmod(casa, colunas)
+        for s in range(len(SIMETRIAS)):
+            nl, nc = aplicar_simetria(s, pos, linhas, colunas)
+            transformada = nl * dimensoes_simetria(s, linhas, colunas)[1] + nc
+            self.valores[s] ^= chave_zobrist(transformada, antigo) ^ chave_zobrist(transformada, novo)
+
 # -------------------------------------------------------------
 # Classe principal do tabuleiro
 # -------------------------------------------------------------
 @dataclass
 class Tabuleiro:
-    grade: List[List[Terreno]]
+    """
+    Tabuleiro de dimensões arbitrárias.
+
+    As casas ficam em um único bytearray (linha a linha), cada uma guardando
+    o código do seu terreno (ver TERRENOS_POR_CODIGO).
+    """
+    linhas: int
+    colunas: int
+    # bytearray, ou memoryview sobre um arquivo mapeado (ver tabuleiro_binario)
+    celulas: bytearray
     custos: Dict[Terreno, float]
+    _indice: Optional[IndiceCavalo] = field(default=None, init=False, repr=False, compare=False)
+    _custos_np: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _tabela_np: Optional[Tuple[float, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _zobrist: Optional[ImpressaoZobrist] = field(default=None, init=False, repr=False, compare=False)
+    # incrementada a cada definir_terreno; estruturas derivadas comparam com ela
+    versao: int = field(default=0, init=False, repr=False, compare=False)
+    _derivados: Dict[Hashable, Tuple[Tuple[float, ...], Any]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    # derivados por objetivo (campos de distância, BFS...): LRU limitado, ver derivado
+    _por_objetivo: "OrderedDict[Hashable, Tuple[Tuple[float, ...], Any]]" = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False)
+    _observadores: List[Callable[[], Optional[Callable]]] = field(
+        default_factory=list, init=False, repr=False, compare=False)
+    # arquivo binário de onde as casas vêm por mmap (abrir_binario)
+    _arquivo_mapeado: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.linhas <= 0 or self.colunas <= 0:
+            raise ValueError("O tabuleiro deve ter ao menos uma linha e uma coluna")
+        if len(self.celulas) != self.linhas * self.colunas:
+            raise ValueError(f"Esperadas {self.linhas * self.colunas} casas, "
+                             f"recebidas {len(self.celulas)}")
 
     # ---------- Criação do tabuleiro ----------
     @staticmethod
-    def vazio(preencher: Terreno = Terreno.TERRA) -> "Tabuleiro":
-        """Cria um tabuleiro 8x8 todo preenchido com o mesmo terreno."""
-        grade = [[preencher for _ in range(8)] for _ in range(8)]
-        return Tabuleiro(grade, dict(CUSTOS_PADRAO))
+    def vazio(preencher: Terreno = Terreno.TERRA,
+              linhas: int = TAMANHO_PADRAO,
+              colunas: int = TAMANHO_PADRAO) -> "Tabuleiro":
+        """Cria um tabuleiro linhas x colunas todo preenchido com o mesmo terreno."""
+        celulas = bytearray([CODIGO_TERRENO[preencher]]) * (linhas * colunas)
+        return Tabuleiro(linhas, colunas, celulas, dict(CUSTOS_PADRAO))
+
+    @staticmethod
+    def de_grade(grade: List[List[Terreno]], custos: Dict[Terreno, float]) -> "Tabuleiro":
+        """Cria um tabuleiro a partir de uma matriz (lista de linhas) de terrenos."""
+        if not grade or any(len(linha) != len(grade[0]) for linha in grade):
+            raise ValueError("A grade deve ser retangular e não vazia")
+        celulas = bytearray(CODIGO_TERRENO[Terreno(c)] for linha in grade for c in linha)
+        return Tabuleiro(len(grade), len(grade[0]), celulas, custos)
 
     @staticmethod
     def carregar_de_json(dados: dict) -> "Tabuleiro":
@@ -57,23 +282,104 @@ class Tabuleiro:
         for k, v in (dados.get("costs") or {}).items():
             custos[Terreno(k)] = float(v)
 
-        # grade 8x8
+        # grade retangular de qualquer tamanho; cada linha é uma lista de nomes
+        # ("terra", ...) ou uma string compacta de letras ("TTLB...", ver LETRA_TERRENO)
         grade_bruta = dados["grid"]
-        if len(grade_bruta) != 8 or any(len(linha) != 8 for linha in grade_bruta):
-            raise ValueError("A grade deve ser 8x8")
-        grade = [[Terreno(celula) for celula in linha] for linha in grade_bruta]
-        return Tabuleiro(grade, custos)
+        if not grade_bruta or any(len(linha) != len(grade_bruta[0]) for linha in grade_bruta):
+            raise ValueError("A grade deve ser retangular e não vazia")
+        celulas = bytearray()
+        for linha in grade_bruta:
+            if isinstance(linha, str):
+                codigos = linha.encode("latin-1", errors="replace").translate(_CODIGO_POR_LETRA)
+                if 255 in codigos:
+                    raise ValueError(f"Terreno desconhecido: {linha[codigos.index(255)]!r}")
+                celulas += codigos
+            else:
+                try:
+                    celulas.extend(CODIGO_POR_NOME[c] for c in linha)
+                except (KeyError, TypeError) as e:
+                    raise ValueError(f"Terreno desconhecido: {e.args[0]!r}") from None
+        return Tabuleiro(len(grade_bruta), len(grade_bruta[0]), celulas, custos)
+
+    def grade_compacta(self) -> List[str]:
+        """Grade no formato compacto de carregar_de_json: uma string de letras por linha."""
+        texto = bytes(self.celulas).translate(_LETRA_POR_CODIGO).decode("ascii")
+        c = self.colunas
+        return [texto[l * c:(l + 1) * c] for l in range(self.linhas)]
+
+    # ---------- Forma compacta (transporte entre processos) ----------
+    def compactar(self) -> Tuple[int, int, bytes, Tuple[float, ...]]:
+        """
+        (linhas, colunas, códigos das casas, custos por código): só tipos
+        nativos, sem enums nem caches, barato de serializar.
+        """
+        custos = tuple(self.custos.get(t, INFINITO) for t in TERRENOS_POR_CODIGO)
+        return self.linhas, self.colunas, bytes(self.celulas), custos
+
+    @staticmethod
+    def descompactar(dados: Tuple[int, int, bytes, Tuple[float, ...]]) -> "Tabuleiro":
+        """Inverso de compactar."""
+        linhas, colunas, celulas, custos = dados
+        return Tabuleiro(linhas, colunas, bytearray(celulas), dict(zip(TERRENOS_POR_CODIGO, custos)))
+
+    def __reduce__(self):
+        # pickle (multiprocessing) leva só a forma compacta; índices, caches e
+        # observadores são refeitos sob demanda no outro lado. Um tabuleiro
+        # mapeado e sem casas alteradas leva só o caminho e a tabela de custos
+        # (que é um dict público e pode ter mudado): o outro processo mapeia o
+        # mesmo arquivo e compartilha as páginas
+        if self._arquivo_mapeado is not None and self.versao == 0:
+            from src.tabuleiro_binario import reabrir_binario
+            return reabrir_binario, (self._arquivo_mapeado, self.tabela_custos())
+        return Tabuleiro.descompactar, (self.compactar(),)
 
     # ---------- Consultas básicas ----------
+    @property
+    def grade(self) -> List[List[Terreno]]:
+        """
+        Cópia da grade como lista de linhas de Terreno (compatibilidade).
+        Alterações devem ser feitas com definir_terreno.
+        """
+        c = self.colunas
+        return [[TERRENOS_POR_CODIGO[k] for k in self.celulas[l * c:(l + 1) * c]]
+                for l in range(self.linhas)]
+
+    def dentro_dos_limites(self, pos: Coordenada) -> bool:
+        """Retorna True se (linha, coluna) estiver dentro deste tabuleiro."""
+        return dentro_dos_limites(pos, self.linhas, self.colunas)
+
+    def id_casa(self, pos: Coordenada) -> int:
+        """Converte (linha, coluna) no id plano da casa."""
+        return pos[0] * self.colunas + pos[1]
+
+    def pos_casa(self, casa: int) -> Coordenada:
+        """Converte o id plano da casa em (linha, coluna)."""
+        return divmod(casa, self.colunas)
+
     def tipo_terreno(self, pos: Coordenada) -> Terreno:
         """Retorna o tipo de terreno da casa informada."""
         linha, coluna = pos
-        return self.grade[linha][coluna]
+        return TERRENOS_POR_CODIGO[self.celulas[linha * self.colunas + coluna]]
 
     def definir_terreno(self, pos: Coordenada, tipo: Terreno) -> None:
         """Altera o tipo de terreno da casa informada."""
-        linha, coluna = pos
-        self.grade[linha][coluna] = tipo
+        casa = self.id_casa(pos)
+        codigo = CODIGO_TERRENO[Terreno(tipo)]
+        antigo = self.celulas[casa]
+        if antigo == codigo:  # nada muda: caches, versão e observadores continuam valendo
+            return
+        self.celulas[casa] = codigo
+        if self._zobrist is not None:
+            self._zobrist.atualizar_casa(self, casa, antigo, codigo)
+        if self._indice is not None:
+            self._indice.atualizar_casa(casa, self._indice.tabela[codigo])
+        if self._custos_np is not None:
+            self._custos_np.flat[casa] = self._tabela_np[codigo]
+        self.versao += 1
+        self._derivados.clear()
+        self._por_objetivo.clear()
+        if self._observadores:
+            self._notificar(pos, TERRENOS_POR_CODIGO[antigo], TERRENOS_POR_CODIGO[codigo])
 
     def custo(self, pos: Coordenada) -> float:
         """Retorna o custo para ENTRAR na casa informada."""
@@ -87,20 +393,155 @@ class Tabuleiro:
         """Retorna o menor custo entre terrenos que não são barreira."""
         return min(v for k, v in self.custos.items() if k != Terreno.BARREIRA)
 
-    # ---------- Prévia para Etapa 3 ----------
-    MOVIMENTOS_CAVALO = [
-        (-2, -1), (-2, 1),
-        (-1, -2), (-1, 2),
-        (1, -2),  (1, 2),
-        (2, -1),  (2, 1),
-    ]
+    def tabela_custos(self) -> Tuple[float, ...]:
+        """Custo de entrada indexado pelo código do terreno (barreira = inf)."""
+        return tuple(float(self.custos.get(t, INFINITO)) for t in TERRENOS_POR_CODIGO)
+
+    def menor_custo_presente(self) -> float:
+        """Menor custo de entrada entre as casas transponíveis que existem no tabuleiro."""
+        custos = self.matriz_custos()
+        transponiveis = custos[~np.isinf(custos)]
+        return float(transponiveis.min()) if transponiveis.size else INFINITO
+
+    # ---------- Representação NumPy ----------
+    def matriz_codigos(self) -> np.ndarray:
+        """
+        Visão (sem cópia, somente leitura) linhas x colunas dos códigos de terreno.
+        Reflete imediatamente qualquer definir_terreno.
+        """
+        codigos = np.frombuffer(self.celulas, dtype=np.uint8).reshape(self.linhas, self.colunas)
+        codigos.flags.writeable = False
+        return codigos
+
+    def matriz_custos(self) -> np.ndarray:
+        """
+        Matriz float64 linhas x colunas com o custo de entrada de cada casa.
+        Mantida em cache: definir_terreno corrige a casa alterada e uma mudança
+        na tabela de custos provoca o recálculo.
+        """
+        tabela = self.tabela_custos()
+        if self._custos_np is None or self._tabela_np != tabela:
+            self._custos_np = np.asarray(tabela, dtype=np.float64)[self.matriz_codigos()]
+            self._tabela_np = tabela
+        return self._custos_np
+
+    def mascara_barreiras(self) -> np.ndarray:
+        """Máscara booleana linhas x colunas: True onde a casa é intransponível."""
+        return np.isinf(self.matriz_custos())
+
+    @staticmethod
+    def _separar_coordenadas(coordenadas) -> Tuple[np.ndarray, np.ndarray]:
+        """Aceita uma sequência de (linha, coluna) ou um array N x 2."""
+        coords = np.asarray(coordenadas, dtype=np.intp).reshape(-1, 2)
+        return coords[:, 0], coords[:, 1]
+
+    def custos_de(self, coordenadas) -> np.ndarray:
+        """Custos de entrada de várias casas de uma só vez."""
+        lin, col = self._separar_coordenadas(coordenadas)
+        return self.matriz_custos()[lin, col]
+
+    def bloqueados_de(self, coordenadas) -> np.ndarray:
+        """Máscara de barreiras para várias casas de uma só vez."""
+        return np.isinf(self.custos_de(coordenadas))
+
+    def menor_custo_entre(self, coordenadas) -> Tuple[float, Optional[Coordenada]]:
+        """
+        Retorna (custo, casa) da casa de menor custo de entrada entre as
+        informadas; (inf, None) se a lista for vazia.
+        """
+        lin, col = self._separar_coordenadas(coordenadas)
+        if lin.size == 0:
+            return INFINITO, None
+        custos = self.matriz_custos()[lin, col]
+        k = int(np.argmin(custos))
+        return float(custos[k]), (int(lin[k]), int(col[k]))
+
+    # ---------- Observadores de alterações ----------
+    def observar(self, callback: Callable[[Coordenada, Terreno, Terreno], None]) -> None:
+        """
+        Registra callback(pos, terreno_antigo, terreno_novo), chamado a cada
+        definir_terreno que muda a casa. Métodos ligados são guardados por referência fraca,
+        para não manter vivos planejadores que ninguém mais usa.
+        """
+        if hasattr(callback, "__self__"):
+            self._observadores.append(weakref.WeakMethod(callback))
+        else:
+            self._observadores.append(lambda: callback)
+
+    def deixar_de_observar(self, callback: Callable) -> None:
+        """Remove um callback registrado com observar."""
+        self._observadores = [ref for ref in self._observadores
+                              if ref() is not None and ref() != callback]
+
+    def _notificar(self, pos: Coordenada, antigo: Terreno, novo: Terreno) -> None:
+        registrados = list(self._observadores)
+        for ref in registrados:
+            callback = ref()
+            if callback is not None:
+                callback(pos, antigo, novo)
+        # descarta referências mortas (preserva quem se registrou durante a notificação)
+        self._observadores = [ref for ref in self._observadores if ref() is not None]
+
+    # ---------- Impressão digital ----------
+    def impressoes_simetricas(self) -> Tuple[int, ...]:
+        """Hash Zobrist de 64 bits do tabuleiro em cada orientação de SIMETRIAS."""
+        if self._zobrist is None:
+            self._zobrist = ImpressaoZobrist(self)
+        return tuple(self._zobrist.valores)
+
+    def impressao(self) -> int:
+        """Hash Zobrist de 64 bits do conteúdo do tabuleiro (mantido em O(1) por alteração)."""
+        return self.impressoes_simetricas()[0]
+
+    # ---------- Estruturas derivadas (cache por tabuleiro) ----------
+    def derivado(self, chave: Hashable, construir: Callable[[], Any],
+                 por_objetivo: bool = False) -> Any:
+        """
+        Retorna a estrutura derivada guardada sob `chave`, construindo-a se
+        necessário. O cache é descartado por definir_terreno e a entrada é
+        refeita se a tabela de custos tiver mudado desde a construção.
+
+        por_objetivo=True é para estruturas do tamanho do tabuleiro que se
+        repetem por objetivo (uma por casa consultada): ficam num LRU de até
+        CASAS_POR_OBJETIVO // casas entradas, sem empurrar para fora as
+        estruturas únicas (marcos ALT, bitboards).
+        """
+        tabela = self.tabela_custos()
+        if not por_objetivo:
+            guardado = self._derivados.get(chave)
+            if guardado is None or guardado[0] != tabela:
+                guardado = (tabela, construir())
+                self._derivados[chave] = guardado
+            return guardado[1]
+
+        lru = self._por_objetivo
+        guardado = lru.pop(chave, None)  # volta no fim: a mais recente
+        if guardado is None or guardado[0] != tabela:
+            guardado = (tabela, construir())
+        lru[chave] = guardado
+        limite = max(DERIVADOS_POR_OBJETIVO_MINIMO, CASAS_POR_OBJETIVO // (self.linhas * self.colunas))
+        while len(lru) > limite:
+            lru.popitem(last=False)
+        return guardado[1]
+
+    # ---------- Movimentos do cavalo ----------
+    MOVIMENTOS_CAVALO = MOVIMENTOS_CAVALO
+
+    def indice_cavalo(self) -> IndiceCavalo:
+        """
+        Retorna o índice de vizinhança do cavalo deste tabuleiro.
+        É construído uma única vez e corrigido localmente por definir_terreno;
+        só é reconstruído se a tabela de custos mudar.
+        """
+        if self._indice is None or self._indice.tabela != self.tabela_custos():
+            self._indice = IndiceCavalo(self)
+        return self._indice
 
     def vizinhos_cavalo(self, pos: Coordenada) -> List[Coordenada]:
         """Retorna os movimentos válidos do cavalo (já checa bordas e barreiras)."""
-        linha, coluna = pos
-        vizinhos = []
-        for dl, dc in self.MOVIMENTOS_CAVALO:
-            destino = (linha + dl, coluna + dc)
-            if dentro_dos_limites(destino) and not self.bloqueado(destino):
-                vizinhos.append(destino)
-        return vizinhos
+        if not self.dentro_dos_limites(pos):
+            return []
+        colunas = self.colunas
+        return [divmod(destino, colunas)
+                for destino, custo in self.indice_cavalo().vizinhos(pos[0] * colunas + pos[1])
+                if custo != INFINITO]
@@ -0,0 +1,158 @@
+# =============================================================
+#  tabuleiro_binario.py — Formato binário de tabuleiro (mmap)
+# =============================================================
+#
+#  Layout (little-endian), cabeçalho de 64 bytes seguido das casas:
+#
+#    0  4s   assinatura b"CAVB"
+#    4  H    versão do formato
+#    6  H    reservado (0)
+#    8  I    linhas
+#   12  I    colunas
+#   16  4d   custos por código (estrada, terra, lama, barreira; inf permitido)
+#   48  2i   início (linha, coluna) ou (-1, -1)
+#   56  2i   objetivo (linha, coluna) ou (-1, -1)
+#   64  B*   linhas × colunas códigos de terreno (TERRENOS_POR_CODIGO)
+#
+#  abrir_binario mapeia o arquivo e usa as casas direto das páginas do
+#  arquivo, sem cópia, e processos que abrem o mesmo arquivo compartilham
+#  as páginas no cache do sistema. A validação dos códigos de terreno
+#  percorre as casas uma vez (num 4096x4096, os 16 MB); com validar=False,
+#  usado ao reabrir um arquivo já conferido, a abertura só lê o cabeçalho.
+#
+#  Conversão pela linha de comando:
+#    python -m src.tabuleiro_binario cenarios/cenario_basico.json basico.tabb
+#    python -m src.tabuleiro_binario basico.tabb basico.json
+
+from __future__ import annotations
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.tabuleiro import Tabuleiro, Coordenada, TERRENOS_POR_CODIGO, CUSTOS_PADRAO
+
+EXTENSAO_BINARIO = ".tabb"
+ASSINATURA = b"CAVB"
+VERSAO_FORMATO = 1
+CABECALHO = struct.Struct("<4sHHII4d4i")
+assert CABECALHO.size == 64  # casas alinhadas para leitura vetorizada
+
+# modos de abertura: cópia-na-escrita (edições ficam só no processo) ou somente leitura
+MODOS_MAPA = {"c": mmap.ACCESS_COPY, "r": mmap.ACCESS_READ}
+
+
+def salvar_binario(tabuleiro: Tabuleiro, caminho: str, inicio: Optional[Coordenada] = None,
+                   objetivo: Optional[Coordenada] = None) -> None:
+    """Grava o tabuleiro (e, se dados, início/objetivo) no formato binário."""
+    _, _, celulas, custos = tabuleiro.compactar()
+    posicoes = [*(inicio or (-1, -1)), *(objetivo or (-1, -1))]
+    with open(caminho, "wb") as f:
+        f.write(CABECALHO.pack(ASSINATURA, VERSAO_FORMATO, 0, tabuleiro.linhas,
+                               tabuleiro.colunas, *custos, *posicoes))
+        f.write(celulas)
+
+
+def abrir_binario(caminho: str, modo: str = "c",
+                  validar: bool = True) -> Tuple[Tabuleiro, Optional[Coordenada], Optional[Coordenada]]:
+    """
+    Abre um arquivo binário por mmap: (tabuleiro, início, objetivo), com
+    None nas posições ausentes. As casas do tabuleiro são uma memoryview
+    sobre o mapa. modo="c" (padrão) aceita definir_terreno sem alterar o
+    arquivo; modo="r" é somente leitura (definir_terreno falha com TypeError).
+    validar=False pula a conferência dos códigos das casas (que lê o arquivo
+    inteiro): só para arquivos já abertos com validação ou gravados aqui.
+    """
+    if modo not in MODOS_MAPA:
+        raise ValueError(f"Modo desconhecido: {modo!r} (use {tuple(MODOS_MAPA)})")
+    with open(caminho, "rb") as f:
+        try:
+            mapa = mmap.mmap(f.fileno(), 0, access=MODOS_MAPA[modo])
+        except ValueError:  # arquivo vazio
+            raise ValueError(f"{caminho}: arquivo vazio") from None
+    if len(mapa) < CABECALHO.size:
+        raise ValueError(f"{caminho}: cabeçalho incompleto")
+    assinatura, versao, _, linhas, colunas, *resto = CABECALHO.unpack_from(mapa)
+    if assinatura != ASSINATURA:
+        raise ValueError(f"{caminho}: não é um tabuleiro binário")
+    if versao != VERSAO_FORMATO:
+        raise ValueError(f"{caminho}: versão {versao} do formato não suportada")
+    if len(mapa) != CABECALHO.size + linhas * colunas:
+        raise ValueError(f"{caminho}: esperadas {linhas * colunas} casas, "
+                         f"recebidas {len(mapa) - CABECALHO.size}")
+    celulas = memoryview(mapa)[CABECALHO.size:]
+    if validar and linhas * colunas and np.frombuffer(celulas, dtype=np.uint8).max() >= len(TERRENOS_POR_CODIGO):
+        raise ValueError(f"{caminho}: código de terreno inválido")
+
+    custos, posicoes = resto[:4], resto[4:]
+    tabuleiro = Tabuleiro(linhas, colunas, celulas, dict(zip(TERRENOS_POR_CODIGO, custos)))
+    tabuleiro._arquivo_mapeado = os.path.abspath(caminho)
+    inicio = tuple(posicoes[:2]) if posicoes[0] >= 0 else None
+    objetivo = tuple(posicoes[2:]) if posicoes[2] >= 0 else None
+    return tabuleiro, inicio, objetivo
+
+
+def reabrir_binario(caminho: str, custos: Optional[Tuple[float, ...]] = None) -> Tabuleiro:
+    """
+    Tabuleiro de um arquivo binário (usado pelo pickle entre processos).
+    `custos` (por código, como tabela_custos) substitui os do cabeçalho.
+    """
+    tabuleiro = abrir_binario(caminho, validar=False)[0]  # o processo de origem já conferiu
+    if custos is not None:
+        tabuleiro.custos = dict(zip(TERRENOS_POR_CODIGO, custos))
+    return tabuleiro
+
+
+# -------------------------------------------------------------
+# Conversão de/para os cenários JSON
+# -------------------------------------------------------------
+def json_para_binario(origem: str, destino: str) -> None:
+    """Converte um cenário JSON (formato de cenario_basico.json) para binário."""
+    from src.leitor_cenarios import cenario_de_dict  # o leitor importa este módulo
+    with open(origem, encoding="utf-8") as f:
+        tabuleiro, inicio, objetivo = cenario_de_dict(json.load(f))
+    salvar_binario(tabuleiro, destino, inicio, objetivo)
+
+
+def binario_para_json(origem: str, destino: str, compacta: bool = True) -> None:
+    """
+    Converte um tabuleiro binário para cenário JSON. compacta=True usa uma
+    string de letras por linha; False, a lista de nomes de terreno.
+    """
+    tabuleiro, inicio, objetivo = abrir_binario(origem, "r")
+    dados: dict = {}
+    if inicio is not None:
+        dados["start"] = list(inicio)
+    if objetivo is not None:
+        dados["goal"] = list(objetivo)
+    # só o que difere do padrão: mantém o JSON padrão (sem Infinity para a barreira)
+    dados["costs"] = {t.value: c for t, c in tabuleiro.custos.items() if c != CUSTOS_PADRAO.get(t)}
+    dados["grid"] = (tabuleiro.grade_compacta() if compacta
+                     else [[t.value for t in linha] for linha in tabuleiro.grade])
+    with open(destino, "w", encoding="utf-8") as f:
+        json.dump(dados, f, ensure_ascii=False)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.tabuleiro_binario",
+        description=f"Converte cenários entre JSON e o formato binário ({EXTENSAO_BINARIO}).")
+    parser.add_argument("origem")
+    parser.add_argument("destino")
+    parser.add_argument("--grade-nomes", action="store_true",
+                        help="ao gerar JSON, grade como lista de nomes em vez de strings")
+    args = parser.parse_args(argv)
+    if args.origem.endswith(EXTENSAO_BINARIO):
+        binario_para_json(args.origem, args.destino, compacta=not args.grade_nomes)
+    else:
+        json_para_binario(args.origem, args.destino)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+# =============================================================
+#  tempo_inicializacao.py — Tempo de importação e de carga das imagens
+# =============================================================
+#
+#  Uso:
+#    python -m src.tempo_inicializacao
+#    python -m src.tempo_inicializacao --modulos main src.resolvedor_lote --repeticoes 10
+#
+#  Importações são medidas em processos novos (python -X importtime), então
+#  cada medida é uma partida a frio do interpretador; a tabela diz também se
+#  o módulo acabou carregando o pygame. As imagens são medidas no próprio
+#  processo, com o driver de vídeo "dummy": a primeira carga (disco +
+#  escala) e a seguinte (cache de interface_grafica.imagem).
+
+from __future__ import annotations
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+RAIZ_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULOS_PADRAO = ("main", "src.interface_grafica", "src.gerador_tabuleiro",
+                  "src.busca_a_estrela", "src.resolvedor_lote", "src.leitor_cenarios")
+
+
+def medir_importacao(modulo: str, repeticoes: int = 5) -> Dict[str, object]:
+    """
+    Menor tempo (em ms) de `import modulo` num interpretador novo, entre
+    `repeticoes` execuções, e se o pygame foi importado junto.
+    """
+    codigo = f"import {modulo}, sys; print('pygame' in sys.modules)"
+    melhor, com_pygame = float("inf"), False
+    for _ in range(repeticoes):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo], cwd=RAIZ_PROJETO,
+                              capture_output=True, text=True, check=True)
+        com_pygame = proc.stdout.strip().splitlines()[-1] == "True"
+        # linhas "import time: próprio | acumulado | nome"; o módulo pedido é o de nível zero
+        for linha in proc.stderr.splitlines():
+            partes = linha.split("|")
+            if len(partes) == 3 and partes[2].strip() == modulo and not partes[2].startswith("  "):
+                melhor = min(melhor, int(partes[1]) / 1000)
+    return {"modulo": modulo, "importacao_ms": round(melhor, 2), "pygame": com_pygame}
+
+
+def medir_imagens(tamanhos=(65, 48)) -> Dict[str, float]:
+    """Tempo (ms) da primeira carga das imagens do tabuleiro e do cavalo e da seguinte (cache)."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from src.interface_grafica import (carregar_cavalo, carregar_imagens_terreno, esquecer_imagens,
+                                       iniciar_pygame)
+    iniciar_pygame()
+    try:
+        pygame.display.set_mode((1, 1))
+        esquecer_imagens()
+        tempos = {}
+        for rotulo in ("primeira_carga_ms", "com_cache_ms"):
+            t0 = time.perf_counter()
+            for tamanho in tamanhos:
+                carregar_imagens_terreno(tamanho)
+            carregar_cavalo()
+            tempos[rotulo] = round((time.perf_counter() - t0) * 1000, 3)
+        return tempos
+    finally:
+        pygame.quit()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.tempo_inicializacao",
+                                     description="Mede o tempo de importação dos módulos e de carga das imagens.")
+    parser.add_argument("--modulos", nargs="+", default=list(MODULOS_PADRAO))
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    for modulo in args.modulos:
+        r = medir_importacao(modulo, args.repeticoes)
+        print(f"{r['modulo']:<26} {r['importacao_ms']:9.2f} ms  "
+              f"{'com pygame' if r['pygame'] else 'sem pygame'}")
+    imagens = medir_imagens()
+    print(f"{'imagens (primeira carga)':<26} {imagens['primeira_carga_ms']:9.2f} ms")
+    print(f"{'imagens (com cache)':<26} {imagens['com_cache_ms']:9.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
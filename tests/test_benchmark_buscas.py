@@ -0,0 +1,28 @@
+import json
+from src.tabuleiro import Tabuleiro
+from src.benchmark_buscas import CenarioBenchmark, comparar, medir
+
+def carregar_tabuleiro():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        dados = json.load(f)
+    return Tabuleiro.carregar_de_json(dados)
+
+def test_medir_registra_metricas():
+    r = medir(carregar_tabuleiro(), (7, 0), (0, 7), "h2", repeticoes=1)
+    assert r["custo"] == 5.5 and r["passos"] == 6
+    assert r["empilhados"] >= r["expandidos"] > 0
+    assert r["tempo_s"] > 0 and r["memoria_pico_kb"] > 0
+
+def test_cenario_reprodutivel():
+    cenario = CenarioBenchmark(16, "media", "curta", 3)
+    a, inicio, objetivo = cenario.montar()
+    b, _, _ = cenario.montar()
+    assert a == b and not a.bloqueado(objetivo)
+
+def test_comparar_sinaliza_regressoes():
+    base = [{"cenario": "c", "heuristica": "h2", "modo": "unidirecional", "custo": 5.5,
+             "expandidos": 10, "empilhados": 20, "tempo_s": 0.1, "memoria_pico_kb": 100.0}]
+    igual = [dict(base[0], tempo_s=0.11)]
+    pior = [dict(base[0], expandidos=11, tempo_s=0.2)]
+    assert comparar(igual, base) == []
+    assert len(comparar(pior, base)) == 2
@@ -0,0 +1,31 @@
+import json
+from src.tabuleiro import Tabuleiro, Terreno
+from src.cavalo import Cavalo
+from src.distancias_cavalo import bfs_cavalo
+from src.bitboard import ataques_cavalo, bitboards, casas_do_conjunto, saltos
+
+def carregar_tabuleiro():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        dados = json.load(f)
+    return Tabuleiro.carregar_de_json(dados)
+
+def test_saltos_e_tabela_de_ataques():
+    assert casas_do_conjunto(saltos(1 << 0)) == [10, 17]         # canto a8: (1,2) e (2,1)
+    assert bin(ataques_cavalo()[27]).count("1") == 8             # casa central
+    assert saltos((1 << 0) | (1 << 63)) == ataques_cavalo()[0] | ataques_cavalo()[63]
+
+def test_bitboards_igual_ao_tabuleiro():
+    tab = carregar_tabuleiro()
+    bb = bitboards(tab)
+    assert casas_do_conjunto(bb.barreiras) == [tab.id_casa(p) for p in
+                                               [(3, 1), (4, 1), (5, 1), (6, 1)]]
+    assert list(bb.distancias((0, 7))) == list(bfs_cavalo(8, 8, (0, 7), tab.mascara_barreiras().ravel()))
+    movimentos = Cavalo((4, 3)).movimentos_possiveis(tab)
+    assert casas_do_conjunto(Cavalo((4, 3)).ataques(tab)) == sorted(tab.id_casa(p) for p in movimentos)
+
+def test_alcancavel_acompanha_alteracoes():
+    tab = Tabuleiro.vazio()
+    assert bitboards(tab).alcancavel((7, 0), (0, 7))
+    for pos in tab.vizinhos_cavalo((0, 7)):
+        tab.definir_terreno(pos, Terreno.BARREIRA)
+    assert not bitboards(tab).alcancavel((7, 0), (0, 7))
@@ -1,6 +1,6 @@
 import json
-from src.board import Tabuleiro
-from src.busca_A_estrela import busca_a_estrela
+from src.tabuleiro import Tabuleiro
+from src.busca_a_estrela import busca_a_estrela
 
 def carregar_tabuleiro():
     with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
@@ -17,3 +17,76 @@ def test_busca_basica():
     assert caminho[-1] == objetivo
     # o custo deve ser finito (existe caminho)
     assert custo < float("inf")
+
+def test_bidirecional_mesmo_custo_que_dijkstra():
+    tab = carregar_tabuleiro()
+    inicio, objetivo = (7, 0), (0, 7)
+    _, custo_uni = busca_a_estrela(tab, inicio, objetivo, "nula")
+    estat = {}
+    caminho, custo_bi = busca_a_estrela(tab, inicio, objetivo, "nula",
+                                        modo="bidirecional", estatisticas=estat)
+    assert custo_bi == custo_uni
+    assert caminho[0] == inicio and caminho[-1] == objetivo
+    assert sum(tab.custo(p) for p in caminho[1:]) == custo_bi
+    assert estat["expandidos"] == estat["expandidos_ida"] + estat["expandidos_volta"]
+
+def test_bidirecional_sem_caminho():
+    from src.tabuleiro import Tabuleiro, Terreno
+    tab = Tabuleiro.vazio(linhas=3, colunas=3)
+    caminho, custo = busca_a_estrela(tab, (0, 0), (1, 1), "nula", modo="bidirecional")
+    assert caminho == [] and custo == float("inf")
+
+def test_tabela_exata_considera_cantos():
+    from src.distancias_cavalo import tabela_movimentos_cavalo
+    tabela = tabela_movimentos_cavalo(8, 8)
+    assert tabela[0, 9] == 4     # canto → casa diagonal: 4 saltos, não 2
+    assert tabela[0, 17] == 1
+    assert (tabela == tabela.T).all()
+
+def test_cache_das_tabelas_vazias_limitado_por_casas(monkeypatch):
+    from src import distancias_cavalo as dc
+    monkeypatch.setattr(dc, "CASAS_VAZIO_MAXIMO", 3 * 40 * 40)
+    monkeypatch.setattr(dc, "_tabelas_vazio", type(dc._tabelas_vazio)())
+    monkeypatch.setattr(dc, "_casas_vazio", 0)
+    primeira = dc.movimentos_cavalo_vazio(40, 40, (0, 0))
+    assert dc.movimentos_cavalo_vazio(40, 40, (0, 0)) is primeira
+    for objetivo in range(1, 10):
+        dc.movimentos_cavalo_vazio(40, 40, (objetivo, objetivo))
+    assert len(dc._tabelas_vazio) == 3 and dc._casas_vazio == 3 * 40 * 40
+    assert list(dc.movimentos_cavalo_vazio(40, 40, (0, 0))) == list(primeira)  # recalculada igual
+    grande = dc.movimentos_cavalo_vazio(80, 80, (0, 0))  # sozinha passa do limite, mas fica
+    assert list(dc._tabelas_vazio.values()) == [grande]
+
+def test_heuristicas_exata_e_barreiras_otimas():
+    tab = carregar_tabuleiro()
+    inicio, objetivo = (7, 0), (0, 7)
+    _, custo_ref = busca_a_estrela(tab, inicio, objetivo, "nula")
+    for tipo in ("exata", "barreiras"):
+        caminho, custo = busca_a_estrela(tab, inicio, objetivo, tipo)
+        assert custo == custo_ref
+        assert caminho[0] == inicio and caminho[-1] == objetivo
+
+def test_heuristica_barreiras_inalcancavel():
+    from src.tabuleiro import Tabuleiro, Terreno
+    from src.busca_a_estrela import heuristica_barreiras
+    tab = Tabuleiro.vazio(linhas=5, colunas=5)
+    for pos in [(1, 2), (2, 1)]:
+        tab.definir_terreno(pos, Terreno.BARREIRA)
+    assert heuristica_barreiras((0, 0), (4, 4), tab) == float("inf")
+    assert heuristica_barreiras((4, 4), (4, 4), tab) == 0
+
+def test_observadores_recebem_eventos():
+    from src.busca_a_estrela import ColetorExplorados, MedidorBusca, ObservadoresMultiplos
+    tab = carregar_tabuleiro()
+    coletor, medidor = ColetorExplorados(), MedidorBusca()
+    for modo in ("unidirecional", "bidirecional"):
+        estatisticas = {}
+        sem_obs = busca_a_estrela(tab, (7, 0), (0, 7), "h2", modo=modo)
+        com_obs = busca_a_estrela(tab, (7, 0), (0, 7), "h2", modo=modo, estatisticas=estatisticas,
+                                  observador=ObservadoresMultiplos(coletor, medidor))
+        assert com_obs == sem_obs
+        assert medidor.empilhados == estatisticas["empilhados"]
+        assert medidor.desempilhados >= medidor.expandidos > 0
+        assert medidor.tempo_s > 0
+        if modo == "unidirecional":
+            assert coletor.explorados[-1] == (0, 7)
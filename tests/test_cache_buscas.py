@@ -0,0 +1,84 @@
+import json
+from src.tabuleiro import Tabuleiro, Terreno, aplicar_simetria, dimensoes_simetria
+from src.busca_a_estrela import busca_a_estrela
+from src.cache_buscas import CacheBuscas
+
+def carregar_tabuleiro():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        dados = json.load(f)
+    return Tabuleiro.carregar_de_json(dados)
+
+def girar(tab, s):
+    linhas, colunas = dimensoes_simetria(s, tab.linhas, tab.colunas)
+    novo = Tabuleiro.vazio(linhas=linhas, colunas=colunas)
+    for l in range(tab.linhas):
+        for c in range(tab.colunas):
+            novo.definir_terreno(aplicar_simetria(s, (l, c), tab.linhas, tab.colunas),
+                                 tab.tipo_terreno((l, c)))
+    return novo
+
+def test_acerto_e_falta():
+    tab = carregar_tabuleiro()
+    cache = CacheBuscas()
+    r1 = cache.buscar(tab, (7, 0), (0, 7), "h1")
+    r2 = cache.buscar(tab, (7, 0), (0, 7), "h1")
+    assert r1 == r2
+    assert r1[:2] == busca_a_estrela(tab, (7, 0), (0, 7), "h1")
+    cache.buscar(tab, (7, 0), (0, 7), "h2")
+    assert cache.estatisticas()["acertos"] == 1
+    assert cache.estatisticas()["faltas"] == 2
+
+def test_impressao_acompanha_definir_terreno():
+    tab = carregar_tabuleiro()
+    cache = CacheBuscas()
+    antes = tab.impressao()
+    cache.buscar(tab, (7, 0), (0, 7), "nula")
+    tab.definir_terreno((0, 0), Terreno.LAMA)
+    assert tab.impressao() != antes
+    cache.buscar(tab, (7, 0), (0, 7), "nula")
+    assert cache.faltas == 2
+    tab.definir_terreno((0, 0), Terreno.TERRA)
+    assert tab.impressao() == antes
+    cache.buscar(tab, (7, 0), (0, 7), "nula")
+    assert cache.acertos == 1
+
+def test_acerto_em_tabuleiro_girado():
+    tab = carregar_tabuleiro()
+    cache = CacheBuscas()
+    _, custo, _ = cache.buscar(tab, (7, 0), (0, 7), "nula")
+    for s in range(1, 8):
+        girado = girar(tab, s)
+        inicio = aplicar_simetria(s, (7, 0), 8, 8)
+        objetivo = aplicar_simetria(s, (0, 7), 8, 8)
+        caminho, custo_g, explorados = cache.buscar(girado, inicio, objetivo, "nula")
+        assert custo_g == custo
+        assert caminho[0] == inicio and caminho[-1] == objetivo
+        assert sum(girado.custo(p) for p in caminho[1:]) == custo
+    assert cache.acertos == 7
+
+def test_simetria_so_para_heuristicas_otimas():
+    from src.gerador_tabuleiro import gerar_tabuleiro_aleatorio
+    for semente in range(15):
+        tab = gerar_tabuleiro_aleatorio(0.15, 0.25, linhas=8, colunas=8, semente=semente, verboso=False)
+        for heuristica in ("h1", "h2", "nula", "barreiras"):
+            cache = CacheBuscas()
+            cache.buscar(tab, (7, 0), (0, 7), heuristica)
+            for s in range(1, 8):
+                girado = girar(tab, s)
+                inicio = aplicar_simetria(s, (7, 0), 8, 8)
+                objetivo = aplicar_simetria(s, (0, 7), 8, 8)
+                caminho, custo, explorados = cache.buscar(girado, inicio, objetivo, heuristica)
+                direto = busca_a_estrela(girado, inicio, objetivo, heuristica)
+                assert custo == direto[1]
+                if heuristica in ("h1", "h2"):  # sem reuso entre orientações: igual à busca direta
+                    assert caminho == direto[0]
+            assert cache.acertos == (0 if heuristica in ("h1", "h2") else 7)
+
+def test_remocao_lru():
+    tab = carregar_tabuleiro()
+    cache = CacheBuscas(capacidade=2)
+    for objetivo in [(0, 7), (0, 6), (0, 5)]:
+        cache.buscar(tab, (7, 0), objetivo, "nula")
+    assert cache.remocoes == 1 and cache.estatisticas()["entradas"] == 2
+    cache.buscar(tab, (7, 0), (0, 7), "nula")
+    assert cache.faltas == 4
@@ -0,0 +1,47 @@
+import json
+from src.tabuleiro import Tabuleiro, Terreno
+from src.busca_a_estrela import busca_a_estrela
+from src.campo_distancias import campo_distancias
+
+def carregar_tabuleiro():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        dados = json.load(f)
+    return Tabuleiro.carregar_de_json(dados)
+
+def test_campo_igual_a_busca_para_varios_inicios():
+    tab = carregar_tabuleiro()
+    objetivo = (0, 7)
+    campo = campo_distancias(tab, objetivo)
+    for inicio in [(7, 0), (4, 4), (6, 6), (0, 0), (3, 1)]:
+        caminho, custo = campo.caminho(inicio)
+        _, custo_ref = busca_a_estrela(tab, inicio, objetivo, "nula")
+        assert custo == custo_ref
+        assert caminho[0] == inicio and caminho[-1] == objetivo
+        assert sum(tab.custo(p) for p in caminho[1:]) == custo
+
+def test_campo_reaproveitado_e_invalidado():
+    tab = carregar_tabuleiro()
+    campo = campo_distancias(tab, (0, 7))
+    assert campo_distancias(tab, (0, 7)) is campo
+    custo_antes = campo.custo((7, 0))
+    caminho, _ = campo.caminho((7, 0))
+    tab.definir_terreno(caminho[1], Terreno.BARREIRA)
+    assert not campo.valido
+    novo = campo_distancias(tab, (0, 7))
+    assert novo is not campo
+    assert novo.custo((7, 0)) >= custo_antes
+    assert caminho[1] not in novo.caminho((7, 0))[0]
+
+def test_campos_por_objetivo_limitados_sem_descartar_os_unicos(monkeypatch):
+    from src import tabuleiro as modulo
+    from src.marcos_alt import marcos_alt
+    monkeypatch.setattr(modulo, "CASAS_POR_OBJETIVO", 3 * 64)  # 3 campos num 8x8
+    tab = carregar_tabuleiro()
+    marcos = marcos_alt(tab)
+    primeiro = campo_distancias(tab, (0, 0))
+    for coluna in range(1, 8):
+        campo_distancias(tab, (0, coluna))
+    assert len(tab._por_objetivo) == 3
+    assert campo_distancias(tab, (0, 7)) is campo_distancias(tab, (0, 7))
+    assert campo_distancias(tab, (0, 0)) is not primeiro  # descartado e refeito
+    assert marcos_alt(tab) is marcos
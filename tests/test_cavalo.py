@@ -1,9 +1,9 @@
 import json
-from src.board import Tabuleiro
+from src.tabuleiro import Tabuleiro, Terreno
 from src.cavalo import Cavalo
 
 def carregar_tabuleiro():
-    with open("scenarios/cenario_basico.json", encoding="utf-8") as f:
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
         dados = json.load(f)
     return Tabuleiro.carregar_de_json(dados)
 
@@ -26,7 +26,34 @@ def test_barreira_bloqueia():
     tab = carregar_tabuleiro()
     cavalo = Cavalo((2, 0))
     # força uma barreira em (0,1)
-    tab.definir_terreno((0, 1), tab.Terreno.BARREIRA)
+    tab.definir_terreno((0, 1), Terreno.BARREIRA)
     movimentos = cavalo.movimentos_possiveis(tab)
     # o cavalo não deve incluir a casa bloqueada
     assert (0, 1) not in movimentos
+
+def test_indice_corrigido_por_definir_terreno():
+    tab = carregar_tabuleiro()
+    indice = tab.indice_cavalo()
+    cavalo = Cavalo((2, 2))
+    assert (0, 1) in cavalo.movimentos_possiveis(tab)
+    tab.definir_terreno((0, 1), Terreno.BARREIRA)
+    assert (0, 1) not in cavalo.movimentos_possiveis(tab)
+    tab.definir_terreno((0, 1), Terreno.LAMA)
+    assert tab.indice_cavalo() is indice  # corrigido no lugar, sem reconstrução
+    custos = dict(indice.vizinhos(tab.id_casa((2, 2))))
+    assert custos[tab.id_casa((0, 1))] == 5.0
+
+def test_indice_igual_a_varredura_direta():
+    import random
+    from src.tabuleiro import TERRENOS_POR_CODIGO, dentro_dos_limites
+    rnd = random.Random(7)
+    tab = Tabuleiro.vazio(linhas=9, colunas=13)
+    tab.indice_cavalo()
+    for _ in range(60):
+        tab.definir_terreno((rnd.randrange(9), rnd.randrange(13)), rnd.choice(TERRENOS_POR_CODIGO))
+    for l in range(9):
+        for c in range(13):
+            esperado = [(l + dl, c + dc) for dl, dc in Cavalo.MOVIMENTOS
+                        if dentro_dos_limites((l + dl, c + dc), 9, 13)
+                        and not tab.bloqueado((l + dl, c + dc))]
+            assert sorted(Cavalo((l, c)).movimentos_possiveis(tab)) == sorted(esperado)
@@ -0,0 +1,34 @@
+import json
+from src.tabuleiro import Tabuleiro, Terreno
+from src.busca_a_estrela import busca_a_estrela
+from src.filas_prioridade import (FilaBaldes, FilaBinaria, FilaRadix, criar_fila,
+                                  quantum_busca, quantum_exato)
+
+def carregar_tabuleiro():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        dados = json.load(f)
+    return Tabuleiro.carregar_de_json(dados)
+
+def test_quantum_exato():
+    assert quantum_exato([0.5, 1.0, 5.0, float("inf")]) == 0.5
+    assert quantum_exato([0.5, 0.75]) == 0.25
+    assert quantum_exato([float("inf")]) is None
+    tab = carregar_tabuleiro()
+    assert quantum_busca(tab, "h2") == 0.25
+    tab.custos[Terreno.LAMA] = 0.1  # não é múltiplo exato de nada razoável
+    assert quantum_busca(tab, "nula") is None
+    assert isinstance(criar_fila("auto", tab, "nula"), FilaBinaria)
+
+def test_filas_removem_em_ordem_de_f():
+    for fila in (FilaBinaria("maior_g"), FilaBaldes(0.5, "maior_g"), FilaRadix(0.5, "maior_g")):
+        for f, g, casa in ((3.0, 1.0, 10), (1.5, 0.5, 11), (3.0, 2.5, 12), (2.0, 1.0, 13)):
+            fila.inserir(f, g, casa)
+        ordem = [fila.remover() for _ in range(len(fila))]
+        assert ordem == [11, 13, 12, 10]
+
+def test_busca_igual_com_todas_as_filas():
+    tab = carregar_tabuleiro()
+    custos = {busca_a_estrela(tab, (7, 0), (0, 7), "exata", fila=fila, desempate=desempate)[1]
+              for fila in ("binaria", "baldes", "radix", "auto")
+              for desempate in ("maior_g", "menor_g", "nenhum")}
+    assert custos == {5.5}
@@ -0,0 +1,35 @@
+from src.tabuleiro import Tabuleiro, Terreno
+from src.busca_a_estrela import busca_a_estrela
+from src.gerador_tabuleiro import caminho_existe, corredor_cavalo, gerar_tabuleiro_aleatorio
+
+def test_caminho_existe():
+    tab = Tabuleiro.vazio(linhas=6, colunas=6)
+    assert caminho_existe(tab, (5, 0), (0, 5))
+    for pos in tab.vizinhos_cavalo((0, 5)):
+        tab.definir_terreno(pos, Terreno.BARREIRA)
+    assert not caminho_existe(tab, (5, 0), (0, 5))
+
+def test_semente_reprodutivel_e_tamanho_qualquer():
+    a = gerar_tabuleiro_aleatorio(linhas=12, colunas=20, semente=42, verboso=False)
+    b = gerar_tabuleiro_aleatorio(linhas=12, colunas=20, semente=42, verboso=False)
+    assert a == b and (a.linhas, a.colunas) == (12, 20)
+
+def test_corredor_garante_caminho():
+    for semente in range(20):
+        tab = gerar_tabuleiro_aleatorio(prob_barreira=0.7, linhas=15, colunas=9,
+                                        semente=semente, corredor=True, verboso=False)
+        caminho, _ = busca_a_estrela(tab, (14, 0), (0, 8))
+        assert caminho
+
+def test_corredor_nao_enche_o_cache_de_distancias():
+    from src import distancias_cavalo
+    antes = dict(distancias_cavalo._tabelas_vazio)
+    for semente in range(3):
+        gerar_tabuleiro_aleatorio(linhas=64, colunas=64, semente=semente, corredor=True, verboso=False)
+    assert distancias_cavalo._tabelas_vazio == antes
+
+def test_corredor_impossivel():
+    import numpy as np
+    import pytest
+    with pytest.raises(ValueError):
+        corredor_cavalo(3, 3, (2, 0), (1, 1), np.random.default_rng(0))
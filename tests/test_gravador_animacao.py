@@ -0,0 +1,77 @@
+import json
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from src.tabuleiro import Tabuleiro
+from src.cache_buscas import busca_com_cache
+from src.interface_grafica import ESTILO_PRINCIPAL
+from src.gravador_animacao import (PALETA_GIF, _indices_paleta, estilo_para, gravar_busca,
+                                   gravar_comparacao, gravar_lote)
+
+def carregar_tabuleiro():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        return Tabuleiro.carregar_de_json(json.load(f))
+
+def test_png_um_quadro_por_etapa_mais_o_final(tmp_path):
+    tab = carregar_tabuleiro()
+    try:
+        _, _, explorados = busca_com_cache(tab, (7, 0), (0, 7), "h1")
+        quadros = gravar_busca(tab, (7, 0), (0, 7), str(tmp_path / "h1"), heuristica="h1")
+        assert quadros == len(explorados) + 1
+        assert sorted(os.listdir(tmp_path / "h1"))[-1] == f"quadro_{quadros - 1:05d}.png"
+        assert gravar_busca(tab, (7, 0), (0, 7), str(tmp_path / "mini"), apenas_final=True) == 1
+    finally:
+        pygame.quit()
+
+def test_gif_primeiro_quadro_igual_ao_png(tmp_path):
+    import numpy as np
+    tab = carregar_tabuleiro()
+    try:
+        n_png = gravar_comparacao(tab, (7, 0), (0, 7), str(tmp_path / "png"))
+        n_gif = gravar_comparacao(tab, (7, 0), (0, 7), str(tmp_path / "comp.gif"), formato="gif")
+        assert n_png == n_gif
+        dados = (tmp_path / "comp.gif").read_bytes()
+        assert dados[:6] == b"GIF89a" and dados[-1:] == b"\x3B"
+        png = pygame.surfarray.array3d(pygame.image.load(str(tmp_path / "png" / "quadro_00000.png")))
+        gif = pygame.surfarray.array3d(pygame.image.load(str(tmp_path / "comp.gif")))
+        paleta = np.frombuffer(PALETA_GIF, dtype=np.uint8).reshape(256, 3)
+        assert (paleta[_indices_paleta(png)] == gif).all()
+    finally:
+        pygame.quit()
+
+def test_estilo_reduzido_para_tabuleiros_grandes():
+    grande = Tabuleiro.vazio(linhas=200, colunas=100)
+    estilo = estilo_para(grande, ESTILO_PRINCIPAL, lado_maximo=1000)
+    assert estilo.celula == 5 and not estilo.numerar_caminho
+    assert estilo_para(carregar_tabuleiro(), ESTILO_PRINCIPAL) is ESTILO_PRINCIPAL
+
+def test_lote_na_ordem_com_erros(tmp_path):
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        valido = json.load(f)
+    fonte = tmp_path / "lote.jsonl"
+    fonte.write_text(json.dumps(valido) + "\n{quebrado\n" + json.dumps(valido) + "\n", encoding="utf-8")
+    try:
+        registros = list(gravar_lote([str(fonte)], str(tmp_path / "saida"), formato="gif",
+                                     apenas_final=True, processos=1))
+    finally:
+        pygame.quit()
+    assert [r["linha"] for r in registros] == [1, 2, 3]
+    assert "erro" in registros[1]
+    assert registros[2]["saida"].endswith("lote-0003.gif") and registros[2]["quadros"] == 1
+    assert os.path.exists(registros[0]["saida"])
+
+def test_lote_sem_colisao_de_nomes(tmp_path):
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        texto = json.dumps(json.load(f))
+    for pasta in ("x", "y"):
+        (tmp_path / "d" / pasta).mkdir(parents=True)
+        (tmp_path / "d" / pasta / "c.json").write_text(texto, encoding="utf-8")
+    (tmp_path / "d" / "c.jsonl").write_text(texto + "\n", encoding="utf-8")
+    try:
+        registros = list(gravar_lote([str(tmp_path / "d")], str(tmp_path / "saida"), formato="gif",
+                                     apenas_final=True, processos=1))
+    finally:
+        pygame.quit()
+    saidas = [os.path.basename(r["saida"]) for r in registros]
+    assert saidas == ["c-0001.gif", "c-0001-2.gif", "c-0001-3.gif"]
+    assert sorted(os.listdir(tmp_path / "saida")) == sorted(saidas)
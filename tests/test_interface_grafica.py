@@ -0,0 +1,75 @@
+import json
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from src.tabuleiro import Tabuleiro, Terreno
+from src.cache_buscas import busca_com_cache
+from src.interface_grafica import (ESTILO_COMPARATIVO, ESTILO_PRINCIPAL, QuadroBusca,
+                                   camada_estatica, carregar_cavalo, fonte, origem_tabuleiro, texto)
+
+def carregar_tabuleiro():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        return Tabuleiro.carregar_de_json(json.load(f))
+
+def test_quadro_incremental_igual_ao_redesenho_completo():
+    pygame.init()
+    try:
+        tela = pygame.display.set_mode((700, 700))
+        tab = carregar_tabuleiro()
+        caminho, _, explorados = busca_com_cache(tab, (7, 0), (0, 7), "h2")
+        x0, y0 = origem_tabuleiro()
+        for estilo in (ESTILO_PRINCIPAL, ESTILO_COMPARATIVO):
+            cavalo = carregar_cavalo()
+            quadro = QuadroBusca(tab, (7, 0), (0, 7), estilo, x0, y0, cavalo)
+            for etapa in range(len(explorados) + 2):
+                terminou = etapa > len(explorados)
+                pos = explorados[min(etapa, len(explorados) - 1)]
+                quadro.desenhar(tela, explorados, etapa, pos, caminho if terminou else None)
+                referencia = pygame.Surface(tela.get_size())
+                novo = QuadroBusca(tab, (7, 0), (0, 7), estilo, x0, y0, cavalo)
+                novo.desenhar(referencia, explorados, etapa, pos, caminho if terminou else None)
+                r = quadro.retangulo
+                assert (pygame.image.tobytes(tela.subsurface(r), "RGB")
+                        == pygame.image.tobytes(referencia.subsurface(r), "RGB"))
+    finally:
+        pygame.quit()
+
+def test_caches_de_camada_e_fonte():
+    pygame.init()
+    try:
+        pygame.display.set_mode((100, 100))
+        tab = carregar_tabuleiro()
+        camada = camada_estatica(tab, (7, 0), (0, 7), ESTILO_PRINCIPAL)
+        assert camada_estatica(tab, (7, 0), (0, 7), ESTILO_PRINCIPAL) is camada
+        tab.definir_terreno((3, 3), Terreno.LAMA)
+        assert camada_estatica(tab, (7, 0), (0, 7), ESTILO_PRINCIPAL) is not camada
+        assert fonte("Arial", 18) is fonte("Arial", 18)
+        assert texto("A", (0, 0, 0)) is texto("A", (0, 0, 0))
+    finally:
+        pygame.quit()
+    pygame.init()  # fontes antigas foram descartadas no quit
+    try:
+        assert fonte("Arial", 18).render("ok", True, (0, 0, 0)).get_width() > 0
+    finally:
+        pygame.quit()
+
+def test_cache_de_imagens_por_nome_e_tamanho():
+    from src.interface_grafica import carregar_imagens_terreno, esquecer_imagens, imagem
+    esquecer_imagens()
+    pygame.init()
+    try:
+        pygame.display.set_mode((100, 100))
+        cavalo = carregar_cavalo()
+        assert cavalo is imagem("cavalo.png", cavalo.get_width())
+        assert imagem("cavalo.png", 20).get_size() == (20, 20)
+        assert imagem("nao_existe.png", 20) is None
+        imgs = carregar_imagens_terreno(30)
+    finally:
+        pygame.quit()
+    pygame.init()  # as superfícies guardadas continuam válidas depois do quit
+    try:
+        pygame.display.set_mode((100, 100))
+        assert carregar_imagens_terreno(30) == imgs
+        assert carregar_cavalo() is cavalo and cavalo.get_at((0, 0)) is not None
+    finally:
+        pygame.quit()
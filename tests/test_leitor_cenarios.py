@@ -0,0 +1,45 @@
+import gzip
+import io
+import json
+from src.leitor_cenarios import ler_cenarios, cenario_de_dict
+from src.tabuleiro import Tabuleiro, Terreno
+
+def carregar_tabuleiro():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        return Tabuleiro.carregar_de_json(json.load(f))
+
+def test_grade_compacta_ida_e_volta():
+    tab = carregar_tabuleiro()
+    compacta = tab.grade_compacta()
+    assert compacta[5] == "TBEEEEET"
+    assert Tabuleiro.carregar_de_json({"grid": compacta}) == tab
+
+def test_cenario_de_dict_usa_cantos_sem_start_goal():
+    tab, inicio, objetivo = cenario_de_dict({"grid": ["TTT", "LBE"]})
+    assert tab.tipo_terreno((1, 1)) == Terreno.BARREIRA and tab.tipo_terreno((1, 2)) == Terreno.ESTRADA
+    assert inicio == (1, 0) and objetivo == (0, 2)
+
+def test_jsonl_com_erros_e_diretorio(tmp_path):
+    registros = [
+        '{"id": "a", "grid": ["TT", "TT"], "start": [1, 0], "goal": [0, 1]}',
+        "",
+        '{"grid": ["TX"]}',
+        "nao eh json",
+        '{"id": "b", "grid": [["terra", "lama"]]}',
+    ]
+    (tmp_path / "lote.jsonl").write_text("\n".join(registros) + "\n", encoding="utf-8")
+    with gzip.open(tmp_path / "sub.jsonl.gz", "wt", encoding="utf-8") as f:
+        f.write('{"id": "c", "grid": ["EE"]}\n')
+    (tmp_path / "ignorado.txt").write_text("x", encoding="utf-8")
+    erros = []
+    lidos = list(ler_cenarios([str(tmp_path), str(tmp_path / "falta.jsonl")],
+                              lambda fonte, linha, msg: erros.append((fonte[-10:], linha))))
+    assert [m["id"] for _, _, _, m in lidos] == ["a", "b", "c"]
+    assert [m["linha"] for _, _, _, m in lidos] == [1, 5, 1]
+    assert lidos[1][3]["fonte"].endswith("lote.jsonl")
+    assert erros == [("lote.jsonl", 3), ("lote.jsonl", 4), ("alta.jsonl", 0)]
+
+def test_entrada_padrao(monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO('{"grid": ["TLT"], "goal": [0, 2]}\n'))
+    (tab, inicio, objetivo, meta), = ler_cenarios(["-"])
+    assert tab.colunas == 3 and objetivo == (0, 2) and meta == {"fonte": "-", "linha": 1}
@@ -0,0 +1,63 @@
+import json
+import time
+from src.tabuleiro import Tabuleiro
+from src.busca_a_estrela import busca_a_estrela, ColetorExplorados
+from src.cache_buscas import CacheBuscas
+from src.linha_do_tempo import BuscaEmSegundoPlano, LinhaDoTempo
+
+def carregar_tabuleiro():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        dados = json.load(f)
+    return Tabuleiro.carregar_de_json(dados)
+
+def test_segundo_plano_igual_a_busca_direta():
+    tab = carregar_tabuleiro()
+    coletor = ColetorExplorados()
+    caminho, custo = busca_a_estrela(tab, (7, 0), (0, 7), "h2", observador=coletor)
+    cache = CacheBuscas()
+    busca = BuscaEmSegundoPlano(tab, (7, 0), (0, 7), "h2", cache=cache)
+    assert list(busca.acompanhar()) == coletor.explorados
+    assert busca.esperar(5) and busca.concluida
+    assert (busca.caminho, busca.custo) == (caminho, custo)
+    # a segunda vez vem do cache, já concluída
+    repetida = BuscaEmSegundoPlano(tab, (7, 0), (0, 7), "h2", cache=cache)
+    assert repetida.concluida and repetida.explorados == coletor.explorados
+    assert cache.estatisticas()["acertos"] == 1
+
+def test_cancelar_interrompe_sem_guardar():
+    tab = Tabuleiro.vazio(linhas=300, colunas=300)
+    cache = CacheBuscas()
+    busca = BuscaEmSegundoPlano(tab, (299, 0), (0, 299), "nula", cache=cache)
+    limite = time.monotonic() + 5
+    while not busca.explorados and time.monotonic() < limite:
+        time.sleep(0.001)
+    busca.cancelar()
+    assert busca.concluida and busca.caminho == []
+    assert len(busca.explorados) < 300 * 300
+    assert cache.consultar(tab, (299, 0), (0, 299), "nula") is None
+
+def test_erro_da_busca_chega_a_quem_espera():
+    import pytest
+    tab = carregar_tabuleiro()
+    busca = BuscaEmSegundoPlano(tab, (7, 0), (0, 7), "h1", modo="inexistente", cache=None)
+    with pytest.raises(ValueError):
+        busca.esperar(5)
+
+def test_linha_do_tempo_controles():
+    linha = LinhaDoTempo(0.5)
+    assert linha.atualizar(1.0, 10) == 2
+    assert linha.atualizar(10.0, 5) == 5  # nunca além das casas disponíveis
+    linha.reiniciar()
+    linha.acelerar()
+    assert linha.descricao() == "2x" and linha.atualizar(1.0, 10) == 4
+    linha.alternar_pausa()
+    assert linha.atualizar(1.0, 10) == 4 and linha.descricao() == "Pausado"
+    linha.passo()
+    assert linha.etapa == 5 and linha.pausada
+    linha.passo(-10)
+    assert linha.etapa == 0
+    linha.avancar_ate_o_fim()
+    assert linha.atualizar(0.0, 7) == 7 and linha.atualizar(0.0, 9) == 9
+    for _ in range(20):
+        linha.desacelerar()
+    assert linha.multiplicador == LinhaDoTempo.MULTIPLICADORES[0]
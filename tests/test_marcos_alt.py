@@ -0,0 +1,37 @@
+import json
+from src.tabuleiro import Tabuleiro, Terreno
+from src.busca_a_estrela import busca_a_estrela
+from src.campo_distancias import campo_distancias
+from src.marcos_alt import MarcosALT, marcos_alt
+
+def carregar_tabuleiro():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        dados = json.load(f)
+    return Tabuleiro.carregar_de_json(dados)
+
+def test_alt_admissivel_nos_dois_sentidos():
+    tab = carregar_tabuleiro()
+    objetivo = (0, 7)
+    marcos = MarcosALT(tab, k=4)
+    h, h_rev = marcos.heuristica(objetivo), marcos.heuristica(objetivo, reverso=True)
+    campo = campo_distancias(tab, objetivo)
+    for casa in range(64):
+        pos = tab.pos_casa(casa)
+        assert h(casa) <= campo.custo(pos)
+        assert h_rev(casa) <= busca_a_estrela(tab, objetivo, pos, "nula")[1]
+
+def test_alt_otima_e_guardada_no_tabuleiro():
+    tab = carregar_tabuleiro()
+    _, custo_ref = busca_a_estrela(tab, (7, 0), (0, 7), "nula")
+    for modo in ("unidirecional", "bidirecional"):
+        _, custo = busca_a_estrela(tab, (7, 0), (0, 7), "alt", modo=modo)
+        assert custo == custo_ref
+    marcos = marcos_alt(tab)
+    assert marcos_alt(tab) is marcos
+    tab.definir_terreno((0, 0), Terreno.LAMA)
+    assert marcos_alt(tab) is not marcos
+
+def test_marcos_nos_cantos():
+    tab = carregar_tabuleiro()
+    marcos = MarcosALT(tab, k=3, selecao="cantos")
+    assert [tab.pos_casa(c) for c in marcos.marcos] == [(0, 0), (7, 7), (0, 7)]
@@ -0,0 +1,45 @@
+import json
+from src.tabuleiro import Tabuleiro, Terreno
+from src.busca_a_estrela import busca_a_estrela
+from src.planejador_hierarquico import PlanejadorHierarquico
+
+def carregar_tabuleiro():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        dados = json.load(f)
+    return Tabuleiro.carregar_de_json(dados)
+
+def custo_do_caminho(tab, caminho):
+    return sum(tab.custo(p) for p in caminho[1:])
+
+def test_caminho_valido_nos_dois_modos():
+    tab = carregar_tabuleiro()
+    plan = PlanejadorHierarquico(tab, tamanho_cluster=4)
+    otimo = busca_a_estrela(tab, (7, 0), (0, 7), "nula")[1]
+    for modo in ("exato", "rapido"):
+        caminho, custo = plan.caminho((7, 0), (0, 7), modo)
+        assert caminho[0] == (7, 0) and caminho[-1] == (0, 7)
+        assert custo == custo_do_caminho(tab, caminho)
+        assert custo >= otimo
+
+def test_tabuleiro_grande_e_invalidacao_local():
+    tab = Tabuleiro.vazio(linhas=40, colunas=40)
+    plan = PlanejadorHierarquico(tab, tamanho_cluster=8)
+    caminho, custo = plan.caminho((39, 0), (0, 39))
+    otimo = busca_a_estrela(tab, (39, 0), (0, 39), "nula")[1]
+    assert otimo <= custo <= 1.25 * otimo
+    montados = len(plan._grafos)
+    tab.definir_terreno(caminho[len(caminho) // 2], Terreno.BARREIRA)
+    assert 0 < montados - len(plan._grafos) <= 9
+    novo, _ = plan.caminho((39, 0), (0, 39))
+    assert caminho[len(caminho) // 2] not in novo
+
+def test_sem_caminho_e_modo_invalido():
+    tab = Tabuleiro.vazio(linhas=10, colunas=10)
+    plan = PlanejadorHierarquico(tab, tamanho_cluster=4)
+    for pos in tab.vizinhos_cavalo((9, 9)):
+        tab.definir_terreno(pos, Terreno.BARREIRA)
+    assert plan.caminho((0, 0), (9, 9)) == ([], float("inf"))
+    import pytest
+    with pytest.raises(ValueError):
+        plan.caminho((0, 0), (9, 9), "aproximado")
+    plan.encerrar()
@@ -0,0 +1,39 @@
+import json
+from src.tabuleiro import Tabuleiro, Terreno
+from src.busca_a_estrela import busca_a_estrela
+from src.planejador_incremental import PlanejadorIncremental
+
+def carregar_tabuleiro():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        dados = json.load(f)
+    return Tabuleiro.carregar_de_json(dados)
+
+def test_planejamento_inicial_otimo():
+    tab = carregar_tabuleiro()
+    plan = PlanejadorIncremental(tab, (7, 0), (0, 7))
+    caminho, custo = plan.caminho()
+    assert custo == busca_a_estrela(tab, (7, 0), (0, 7), "nula")[1]
+    assert caminho[0] == (7, 0) and caminho[-1] == (0, 7)
+
+def test_replaneja_apos_alteracao_e_avanco():
+    tab = carregar_tabuleiro()
+    plan = PlanejadorIncremental(tab, (7, 0), (0, 7))
+    caminho, _ = plan.caminho()
+    expandidos_inicial = plan.expandidos
+    plan.mover_inicio(caminho[1])
+    tab.definir_terreno(caminho[2], Terreno.BARREIRA)
+    novo, custo = plan.caminho()
+    assert caminho[2] not in novo
+    assert novo[0] == caminho[1]
+    assert custo == busca_a_estrela(tab, caminho[1], (0, 7), "nula")[1]
+    assert plan.expandidos <= expandidos_inicial
+
+def test_sem_caminho_e_encerrar():
+    tab = Tabuleiro.vazio(linhas=5, colunas=5)
+    plan = PlanejadorIncremental(tab, (0, 0), (4, 4))
+    assert plan.caminho()[1] < float("inf")
+    tab.definir_terreno((4, 4), Terreno.BARREIRA)
+    assert plan.caminho() == ([], float("inf"))
+    plan.encerrar()
+    tab.definir_terreno((4, 4), Terreno.TERRA)
+    assert not plan._pendentes
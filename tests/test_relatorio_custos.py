@@ -0,0 +1,50 @@
+import csv
+import io
+import json
+from src.tabuleiro import Tabuleiro, Terreno
+from src.busca_a_estrela import busca_a_estrela
+from src.relatorio_custos import (AgregadorRelatorios, RelatorioCaminho, formatar_csv, formatar_json,
+                                  formatar_texto, gerar_relatorio_caminho, montar_relatorio)
+
+def carregar_tabuleiro():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        return Tabuleiro.carregar_de_json(json.load(f))
+
+def test_relatorio_estruturado():
+    tab = carregar_tabuleiro()
+    caminho, custo = busca_a_estrela(tab, (7, 0), (0, 7), "h2")
+    r = montar_relatorio(tab, caminho, custo, "h2", expandidos=10)
+    assert r.encontrado and r.movimentos == len(caminho) - 1
+    assert r.passos[0].posicao == (7, 0) and r.passos[0].terreno == Terreno.TERRA
+    assert r.soma_passos == sum(p.custo for p in r.passos)
+    assert r.custo_teorico_min <= custo <= r.custo_teorico_max and r.dentro_do_limite
+    assert RelatorioCaminho.de_dict(json.loads(formatar_json(r))) == r
+    linhas = list(csv.DictReader(io.StringIO(formatar_csv([r, r]))))
+    assert len(linhas) == 2 * len(caminho) and linhas[-1]["acumulado"] == str(r.soma_passos)
+
+def test_texto_e_sem_caminho(capsys):
+    tab = carregar_tabuleiro()
+    r = gerar_relatorio_caminho(tab, [], float("inf"), "h1")
+    assert not r.encontrado and "Nenhum caminho" in capsys.readouterr().out
+    caminho, custo = busca_a_estrela(tab, (7, 0), (0, 7), "h1")
+    texto = formatar_texto(montar_relatorio(tab, caminho, custo, "h1"))
+    assert "H1 - Distância simples" in texto and f"01. {(7, 0)} → Terreno: TERRA" in texto
+
+def test_agregador_em_partes_igual_ao_total():
+    tab = carregar_tabuleiro()
+    relatorios = []
+    for h in ("h1", "h2", "nula"):
+        for objetivo in ((0, 7), (3, 3), (6, 6)):
+            caminho, custo = busca_a_estrela(tab, (7, 0), objetivo, h)
+            relatorios.append(montar_relatorio(tab, caminho, custo, h, expandidos=len(caminho) * 3))
+    total, a, b = AgregadorRelatorios(), AgregadorRelatorios(), AgregadorRelatorios()
+    for i, r in enumerate(relatorios):
+        total.adicionar(r)
+        (a if i % 2 else b).adicionar(r)
+    a.combinar(b)
+    resumo, partes = total.resumo(), a.resumo()
+    assert resumo["h2"]["relatorios"] == 3 and sum(resumo["h2"]["terrenos"].values()) > 0
+    for h in resumo:
+        for campo in ("custo", "movimentos", "expandidos"):
+            for k in resumo[h][campo]:
+                assert abs(resumo[h][campo][k] - partes[h][campo][k]) < 1e-9
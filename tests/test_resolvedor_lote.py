@@ -0,0 +1,29 @@
+import json
+from src.leitor_cenarios import ler_cenarios
+from src.resolvedor_lote import main, resolver_lote
+
+def test_ler_cenario_respeita_start_goal():
+    (tab, inicio, objetivo, _), = ler_cenarios(["cenarios/cenario_basico.json"])
+    assert (tab.linhas, tab.colunas) == (8, 8)
+    assert inicio == (7, 0) and objetivo == (0, 7)
+
+def test_lote_com_erro_e_pool(tmp_path):
+    (tmp_path / "ruim.json").write_text('{"grid": [["pantano"]]}', encoding="utf-8")
+    caminhos = [str(tmp_path), "cenarios/cenario_basico.json", "cenarios/cenario_basico.json"]
+    registros = list(resolver_lote(caminhos, "h2", processos=2))
+    assert "erro" in registros[0] and registros[0]["linha"] == 1
+    assert registros[1]["custo"] == registros[2]["custo"] == 5.5
+    assert registros[1]["caminho"][0] == [7, 0] and registros[1]["expandidos"] > 0
+
+def test_main_escreve_json_lines(tmp_path):
+    saida = tmp_path / "resultados.jsonl"
+    assert main(["cenarios", "--heuristica", "nula", "--processos", "1", "--saida", str(saida)]) == 0
+    linhas = saida.read_text(encoding="utf-8").splitlines()
+    assert json.loads(linhas[0])["heuristica"] == "nula"
+
+def test_lote_jsonl_mantem_ordem_com_erros(tmp_path):
+    linhas = ['{"grid": ["TT", "TT"]}', '{"grid": []}'] * 6
+    (tmp_path / "lote.jsonl").write_text("\n".join(linhas), encoding="utf-8")
+    registros = list(resolver_lote([str(tmp_path / "lote.jsonl")], "h1", processos=2))
+    assert [r["linha"] for r in registros] == list(range(1, 13))
+    assert ["erro" in r for r in registros] == [False, True] * 6
@@ -0,0 +1,88 @@
+import itertools
+import json
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import numpy as np
+from src.tabuleiro import Tabuleiro, Terreno
+from src.busca_a_estrela import busca_a_estrela
+from src.gerador_tabuleiro import gerar_tabuleiro_aleatorio
+from src.rota_pontos import (custo_da_ordem, matriz_custos, ordem_aproximada, ordem_exata,
+                             rota_por_pontos)
+
+def carregar_tabuleiro():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        return Tabuleiro.carregar_de_json(json.load(f))
+
+PONTOS = [(7, 0), (0, 7), (3, 3), (5, 6), (1, 1), (6, 4)]
+
+def test_matriz_igual_as_buscas_entre_pares():
+    tab = carregar_tabuleiro()
+    custos = matriz_custos(tab, PONTOS)
+    for i, a in enumerate(PONTOS):
+        for j, b in enumerate(PONTOS):
+            esperado = 0.0 if i == j else busca_a_estrela(tab, a, b, "nula")[1]
+            assert custos[i, j] == esperado
+
+def test_held_karp_igual_a_forca_bruta():
+    tab = gerar_tabuleiro_aleatorio(0.1, 0.2, linhas=12, colunas=12, semente=7, verboso=False)
+    livres = [(l, c) for l in range(12) for c in range(12) if not tab.bloqueado((l, c))]
+    custos = matriz_custos(tab, livres[::9][:8])
+    k = len(custos)
+    for fixar_fim in (False, True):
+        meio = range(1, k - 1) if fixar_fim else range(1, k)
+        fim = [k - 1] if fixar_fim else []
+        melhor = min(custo_da_ordem(custos, [0, *p, *fim]) for p in itertools.permutations(meio))
+        ordem, custo = ordem_exata(custos, fixar_fim)
+        assert abs(custo - melhor) < 1e-9 and abs(custo_da_ordem(custos, ordem) - custo) < 1e-9
+        assert ordem[0] == 0 and sorted(ordem) == list(range(k)) and (not fixar_fim or ordem[-1] == k - 1)
+        aprox, custo_aprox = ordem_aproximada(custos, fixar_fim)
+        assert aprox[0] == 0 and sorted(aprox) == list(range(k)) and (not fixar_fim or aprox[-1] == k - 1)
+        assert custo_aprox >= custo - 1e-9
+
+def test_rota_costurada_valida_e_relatorio():
+    tab = carregar_tabuleiro()
+    fixa = rota_por_pontos(tab, PONTOS, melhor_ordem=False)
+    assert fixa.visitados == PONTOS and len(fixa.trechos) == len(PONTOS) - 1
+    melhor = rota_por_pontos(tab, PONTOS)
+    aprox = rota_por_pontos(tab, PONTOS, limite_exato=2)
+    assert melhor.exata and not aprox.exata
+    assert melhor.custo <= aprox.custo <= fixa.custo + 1e-9
+    assert not tab._por_objetivo  # os campos da rota não ficam no tabuleiro
+    for rota in (fixa, melhor, aprox):
+        caminho = rota.caminho
+        assert caminho[0] == PONTOS[0] and all(p in caminho for p in PONTOS)
+        for (l1, c1), (l2, c2) in zip(caminho, caminho[1:]):
+            assert {abs(l1 - l2), abs(c1 - c2)} == {1, 2}
+        assert abs(sum(tab.custo(p) for p in caminho[1:]) - rota.custo) < 1e-9
+        assert abs(sum(rota.custos_trechos) - rota.custo) < 1e-9
+        rel = rota.relatorio(tab)
+        assert rel.custo_total == rota.custo and [p.posicao for p in rel.passos] == caminho
+
+def test_ponto_inalcancavel_e_entrada_invalida():
+    import pytest
+    tab = carregar_tabuleiro()
+    for casa in ((1, 2), (2, 1)):  # os únicos saltos a partir de (0, 0)
+        tab.definir_terreno(casa, Terreno.BARREIRA)
+    rota = rota_por_pontos(tab, [(7, 0), (0, 0), (3, 3)])
+    assert not rota.encontrada and rota.custo == float("inf")
+    assert np.isinf(matriz_custos(tab, [(7, 0), (0, 0)])[0, 1])
+    with pytest.raises(ValueError):
+        rota_por_pontos(tab, [(7, 0), (8, 0)])
+    with pytest.raises(ValueError):
+        rota_por_pontos(tab, [])
+
+def test_desenho_da_rota():
+    import pygame
+    from src.interface_grafica import ESTILO_PRINCIPAL, QuadroBusca, origem_tabuleiro
+    tab = carregar_tabuleiro()
+    rota = rota_por_pontos(tab, PONTOS)
+    pygame.init()
+    try:
+        tela = pygame.display.set_mode((700, 700))
+        x0, y0 = origem_tabuleiro()
+        quadro = QuadroBusca(tab, PONTOS[0], rota.caminho[-1], ESTILO_PRINCIPAL, x0, y0)
+        sujo = quadro.desenhar_rota(tela, rota)
+        assert sujo == quadro.retangulo and quadro.finalizado
+        assert tela.subsurface(sujo).copy().get_at((0, 0)) == quadro.fundo.get_at((0, 0))
+    finally:
+        pygame.quit()
@@ -0,0 +1,189 @@
+import asyncio
+import json
+import os
+import threading
+from src.tabuleiro import Tabuleiro
+from src.busca_a_estrela import busca_a_estrela
+from src.servidor_rotas import ClienteRotas, Latencias, ServidorRotas
+
+def carregar_dados():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        return json.load(f)
+
+def test_registro_resolucao_e_erros():
+    dados = carregar_dados()
+    tab = Tabuleiro.carregar_de_json(dados)
+
+    async def cenario():
+        servidor = ServidorRotas(processos=1)
+        try:
+            r = await servidor.tratar({"id": "a", "op": "registrar", "tabuleiro": dados})
+            assert r["ok"] and r["id"] == "a" and (r["linhas"], r["colunas"]) == (8, 8)
+            ident = r["tabuleiro"]
+            again = await servidor.tratar({"op": "registrar", "tabuleiro": dados})
+            assert again["tabuleiro"] == ident  # mesmo conteúdo, mesmo identificador
+
+            pedido = {"op": "resolver", "tabuleiro": ident, "inicio": [7, 0], "objetivo": [0, 7],
+                      "heuristica": "h1"}
+            primeira, segunda = await asyncio.gather(servidor.tratar(pedido), servidor.tratar(pedido))
+            caminho, custo = busca_a_estrela(tab, (7, 0), (0, 7), "h1")
+            assert [tuple(p) for p in primeira["caminho"]] == caminho and primeira["custo"] == custo
+            assert segunda["caminho"] == primeira["caminho"]
+
+            erros = [
+                {"op": "resolver", "tabuleiro": "nao-existe", "inicio": [7, 0], "objetivo": [0, 7]},
+                {**pedido, "objetivo": [8, 0]},
+                {**pedido, "heuristica": "x"},
+                {"op": "registrar", "tabuleiro": {"grid": ["TX"]}},
+                {"op": "voar"},
+            ]
+            for p in erros:
+                resposta = await servidor.tratar(p)
+                assert not resposta["ok"] and resposta["erro"]
+
+            stats = await servidor.tratar({"op": "estatisticas"})
+            assert stats["erros"] == len(erros)
+            assert stats["tabuleiros"][ident]["resolucoes"] == 2
+            assert stats["operacoes"]["resolver"]["pedidos"] == 2 + 3
+            assert "p99_ms" in stats["operacoes"]["resolver"]
+
+            assert (await servidor.tratar({"op": "descartar", "tabuleiro": ident}))["ok"]
+            assert not (await servidor.tratar(pedido))["ok"]
+        finally:
+            servidor.fechar()
+
+    asyncio.run(cenario())
+
+def test_registros_simultaneos_do_mesmo_tabuleiro():
+    from src.gerador_tabuleiro import gerar_tabuleiro_aleatorio
+    tab = gerar_tabuleiro_aleatorio(0.1, 0.2, linhas=512, colunas=512, semente=3, corredor=True,
+                                    verboso=False)
+    dados = {"grid": tab.grade_compacta()}
+    inicio, objetivo = (511, 0), (0, 511)  # o gerador garante caminho entre os cantos
+    custo = busca_a_estrela(tab, inicio, objetivo, "h2")[1]
+
+    async def cenario():
+        servidor = ServidorRotas(processos=1)
+        try:
+            for _ in range(20):
+                respostas = await asyncio.gather(*(servidor.tratar({"op": "registrar", "tabuleiro": dados})
+                                                   for _ in range(8)))
+                assert all(r["ok"] for r in respostas), respostas
+                assert len({r["tabuleiro"] for r in respostas}) == 1
+                ident = respostas[0]["tabuleiro"]
+                r = await servidor.tratar({"op": "resolver", "tabuleiro": ident,
+                                           "inicio": list(inicio), "objetivo": list(objetivo), "heuristica": "h2"})
+                assert r["ok"] and r["custo"] == custo
+                assert (await servidor.tratar({"op": "descartar", "tabuleiro": ident}))["ok"]
+            assert [n for n in os.listdir(servidor._pasta) if n.endswith(".parcial")] == []
+        finally:
+            servidor.fechar()
+
+    asyncio.run(cenario())
+
+def test_cliente_que_some_no_meio_do_pipeline(tmp_path):
+    import random
+    import socket
+    from src.gerador_tabuleiro import gerar_tabuleiro_aleatorio
+    tab = gerar_tabuleiro_aleatorio(0.1, 0.2, linhas=96, colunas=96, semente=1, verboso=False)
+    caminho = str(tmp_path / "rotas.sock")
+    sorteio = random.Random(0)
+
+    async def cenario():
+        servidor = ServidorRotas(processos=1)
+        try:
+            ident = (await servidor.tratar({"op": "registrar",
+                                            "tabuleiro": {"grid": tab.grade_compacta()}}))["tabuleiro"]
+            # o processo de trabalho nasce antes do cliente: não herda o socket dele
+            await servidor.tratar({"op": "resolver", "tabuleiro": ident, "inicio": [0, 0], "objetivo": [0, 0]})
+            rede = await servidor.servir_unix(caminho)
+            async with rede:
+                cliente = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                cliente.connect(caminho)
+                pedidos = b"".join(json.dumps({
+                    "op": "resolver", "tabuleiro": ident, "heuristica": "nula",
+                    "inicio": [sorteio.randrange(96), sorteio.randrange(96)],
+                    "objetivo": [sorteio.randrange(96), sorteio.randrange(96)]}).encode() + b"\n"
+                    for _ in range(2000))
+                await asyncio.get_running_loop().run_in_executor(None, cliente.sendall, pedidos)
+                await asyncio.sleep(0.3)  # a fila da conexão enche
+                assert servidor.conexoes_abertas == 1
+                cliente.close()  # vai embora sem ler nenhuma resposta
+                for _ in range(100):
+                    if servidor.conexoes_abertas == 0:
+                        break
+                    await asyncio.sleep(0.05)
+                assert servidor.conexoes_abertas == 0
+                assert servidor.tabuleiros[ident].resolucoes < 2000  # o resto foi cancelado
+        finally:
+            servidor.fechar()
+
+    asyncio.run(cenario())
+
+def test_pipeline_em_socket_unix(tmp_path):
+    caminho = str(tmp_path / "rotas.sock")
+    pronto, estado = threading.Event(), {}
+
+    def rodar():
+        async def principal():
+            estado["loop"], estado["parar"] = asyncio.get_running_loop(), asyncio.Event()
+            estado["servidor"] = servidor = ServidorRotas(processos=2)
+            rede = await servidor.servir_unix(caminho)
+            pronto.set()
+            async with rede:
+                await estado["parar"].wait()
+            servidor.fechar()
+        asyncio.run(principal())
+
+    thread = threading.Thread(target=rodar)
+    thread.start()
+    pronto.wait(10)
+    cliente = ClienteRotas(unix=caminho)
+    try:
+        dados = carregar_dados()
+        tab = Tabuleiro.carregar_de_json(dados)
+        ident = cliente.registrar(dados)
+        pares = [((7, 0), (0, 7)), ((7, 0), (3, 3)), ((0, 0), (7, 7)), ((3, 4), (0, 0))] * 10
+        respostas = cliente.resolver_varios(ident, pares)
+        assert [r["id"] for r in respostas] == sorted(r["id"] for r in respostas)
+        for (inicio, objetivo), r in zip(pares, respostas):
+            assert [tuple(p) for p in r["caminho"]] == busca_a_estrela(tab, inicio, objetivo, "h2")[0]
+        assert cliente.estatisticas()["tabuleiros"][ident]["resolucoes"] == len(pares)
+    finally:
+        cliente.fechar()
+        estado["loop"].call_soon_threadsafe(estado["parar"].set)
+        thread.join(10)
+
+def test_processo_solta_tabuleiros_descartados(tmp_path):
+    from src import servidor_rotas
+    from src.tabuleiro_binario import salvar_binario
+    tab = Tabuleiro.carregar_de_json(carregar_dados())
+    arquivos = {nome: str(tmp_path / f"{nome}.tabb") for nome in ("a", "b")}
+    for arquivo in arquivos.values():
+        salvar_binario(tab, arquivo)
+    servidor_rotas._abertos.clear()
+    base = servidor_rotas._descartes_vistos
+    try:
+        for nome, arquivo in arquivos.items():
+            servidor_rotas.resolver_no_processo(nome, arquivo, (7, 0), (0, 7), "h2", "unidirecional", base)
+        assert list(servidor_rotas._abertos) == ["a", "b"]
+        os.remove(arquivos["a"])
+        servidor_rotas.resolver_no_processo("b", arquivos["b"], (7, 0), (0, 7), "h2", "unidirecional", base)
+        assert "a" in servidor_rotas._abertos  # sem novo descarte, nada é conferido
+        os.remove(arquivos["b"])
+        salvar_binario(tab, arquivos["b"])  # registrado de novo: outro arquivo, mesmo nome
+        servidor_rotas.resolver_no_processo("b", arquivos["b"], (7, 0), (0, 7), "h2", "unidirecional",
+                                            base + 2)
+        assert list(servidor_rotas._abertos) == ["b"]
+        assert servidor_rotas._abertos["b"][2] == os.stat(arquivos["b"]).st_ino
+    finally:
+        servidor_rotas._abertos.clear()
+
+def test_percentis_de_latencia():
+    lat = Latencias(limite=100)
+    for ms in range(1, 201):
+        lat.adicionar(ms / 1000)
+    resumo = lat.resumo()
+    assert resumo["pedidos"] == 200  # só as 100 últimas entram nos percentis
+    assert resumo["p50_ms"] == 150.5 and resumo["max_ms"] == 200.0
+    assert Latencias().resumo() == {"pedidos": 0}
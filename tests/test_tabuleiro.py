@@ -1,8 +1,8 @@
 import json
-from src.board import Tabuleiro, Terreno
+from src.tabuleiro import Tabuleiro, Terreno
 
 def carregar_tabuleiro():
-    with open("scenarios/cenario_basico.json", encoding="utf-8") as f:
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
         dados = json.load(f)
     return Tabuleiro.carregar_de_json(dados)
 
@@ -23,3 +23,70 @@ def test_barreiras():
 def test_menor_custo():
     t = carregar_tabuleiro()
     assert t.menor_custo_transponivel() == 0.5
+
+def test_tabuleiro_retangular_grande():
+    t = Tabuleiro.vazio(Terreno.TERRA, linhas=512, colunas=300)
+    assert (t.linhas, t.colunas) == (512, 300)
+    assert len(t.celulas) == 512 * 300
+    assert t.dentro_dos_limites((511, 299))
+    assert not t.dentro_dos_limites((8, 300))
+    t.definir_terreno((500, 250), Terreno.LAMA)
+    assert t.tipo_terreno((500, 250)) == Terreno.LAMA
+    assert t.custo((500, 250)) == 5.0
+
+def test_vizinhos_respeitam_tamanho_real():
+    t = Tabuleiro.vazio(linhas=10, colunas=12)
+    assert sorted(t.vizinhos_cavalo((9, 11))) == [(7, 10), (8, 9)]
+    assert len(t.vizinhos_cavalo((8, 8))) == 6
+
+def test_json_de_qualquer_tamanho():
+    t = Tabuleiro.carregar_de_json({"grid": [["terra", "lama", "estrada"],
+                                             ["barreira", "terra", "terra"]]})
+    assert (t.linhas, t.colunas) == (2, 3)
+    assert t.bloqueado((1, 0))
+    assert t.grade[0] == [Terreno.TERRA, Terreno.LAMA, Terreno.ESTRADA]
+
+def test_json_grade_irregular():
+    import pytest
+    with pytest.raises(ValueError):
+        Tabuleiro.carregar_de_json({"grid": [["terra", "terra"], ["terra"]]})
+
+def test_matrizes_numpy_em_sincronia():
+    t = carregar_tabuleiro()
+    custos = t.matriz_custos()
+    assert custos.shape == (8, 8)
+    assert custos[2, 1] == 0.5 and t.mascara_barreiras()[3, 1]
+    t.definir_terreno((0, 0), Terreno.BARREIRA)
+    assert t.matriz_codigos()[0, 0] == t.celulas[0]
+    assert t.mascara_barreiras()[0, 0]
+    t.custos[Terreno.LAMA] = 3.0
+    assert t.matriz_custos()[1, 3] == 3.0
+
+def test_consultas_em_lote():
+    t = carregar_tabuleiro()
+    coords = [(2, 1), (1, 3), (0, 1), (3, 1)]
+    assert list(t.custos_de(coords)) == [t.custo(p) for p in coords]
+    assert list(t.bloqueados_de(coords)) == [False, False, False, True]
+    assert t.menor_custo_entre(coords) == (0.5, (2, 1))
+    assert t.menor_custo_presente() == 0.5
+
+def test_compactar_e_pickle_sem_caches():
+    import pickle
+    tab = carregar_tabuleiro()
+    tab.indice_cavalo()
+    compacto = tab.compactar()
+    assert Tabuleiro.descompactar(compacto) == tab
+    copia = pickle.loads(pickle.dumps(tab))
+    assert copia == tab and copia._indice is None
+    assert len(pickle.dumps(tab)) < 300
+
+def test_definir_o_mesmo_terreno_nao_invalida():
+    tab = carregar_tabuleiro()
+    avisos = []
+    tab.observar(lambda *a: avisos.append(a))
+    derivado = tab.derivado("teste", object)
+    versao, terreno = tab.versao, tab.tipo_terreno((0, 0))
+    tab.definir_terreno((0, 0), terreno)
+    assert tab.versao == versao and avisos == [] and tab.derivado("teste", object) is derivado
+    tab.definir_terreno((0, 0), Terreno.LAMA if terreno != Terreno.LAMA else Terreno.TERRA)
+    assert tab.versao == versao + 1 and len(avisos) == 1 and tab.derivado("teste", object) is not derivado
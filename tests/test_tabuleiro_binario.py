@@ -0,0 +1,56 @@
+import json
+import pickle
+from src.tabuleiro import Tabuleiro, Terreno
+from src.tabuleiro_binario import abrir_binario, binario_para_json, json_para_binario, salvar_binario
+from src.leitor_cenarios import ler_cenarios
+
+def carregar_tabuleiro():
+    with open("cenarios/cenario_basico.json", encoding="utf-8") as f:
+        return Tabuleiro.carregar_de_json(json.load(f))
+
+def test_ida_e_volta_json(tmp_path):
+    json_para_binario("cenarios/cenario_basico.json", str(tmp_path / "b.tabb"))
+    tab, inicio, objetivo = abrir_binario(str(tmp_path / "b.tabb"))
+    assert tab == carregar_tabuleiro() and isinstance(tab.celulas, memoryview)
+    assert inicio == (7, 0) and objetivo == (0, 7)
+    binario_para_json(str(tmp_path / "b.tabb"), str(tmp_path / "b.json"))
+    (volta, _, _, _), (mapeado, _, objetivo, _) = ler_cenarios([str(tmp_path)])
+    assert volta == mapeado == tab and objetivo == (0, 7)
+
+def test_mapa_copia_na_escrita_e_pickle(tmp_path):
+    import pytest
+    caminho = str(tmp_path / "t.tabb")
+    salvar_binario(carregar_tabuleiro(), caminho)
+    tab, inicio, objetivo = abrir_binario(caminho)
+    assert inicio is None and objetivo is None
+    assert len(pickle.dumps(tab)) < 200  # só o caminho do arquivo
+    assert pickle.loads(pickle.dumps(tab)) == tab
+    tab.custos[Terreno.LAMA] = 99.0  # custos mudados sem tocar nas casas
+    assert pickle.loads(pickle.dumps(tab)).custos[Terreno.LAMA] == 99.0
+    tab.definir_terreno((0, 0), Terreno.LAMA)
+    assert abrir_binario(caminho)[0].tipo_terreno((0, 0)) == Terreno.TERRA
+    assert pickle.loads(pickle.dumps(tab)).tipo_terreno((0, 0)) == Terreno.LAMA
+    with pytest.raises(TypeError):
+        abrir_binario(caminho, "r")[0].definir_terreno((0, 0), Terreno.LAMA)
+
+def test_arquivos_invalidos(tmp_path):
+    import pytest
+    ruim = tmp_path / "ruim.tabb"
+    for conteudo in (b"", b"XXXX" + bytes(60), bytes(64)):
+        ruim.write_bytes(conteudo)
+        with pytest.raises(ValueError):
+            abrir_binario(str(ruim))
+    erros = []
+    assert list(ler_cenarios([str(ruim)], lambda *e: erros.append(e[1]))) == [] and erros == [0]
+
+def test_validacao_dos_codigos_opcional(tmp_path):
+    import pytest
+    caminho = tmp_path / "t.tabb"
+    salvar_binario(carregar_tabuleiro(), str(caminho))
+    dados = bytearray(caminho.read_bytes())
+    dados[-1] = 200  # código de terreno que não existe
+    caminho.write_bytes(bytes(dados))
+    with pytest.raises(ValueError):
+        abrir_binario(str(caminho))
+    tab = abrir_binario(str(caminho), validar=False)[0]  # só o cabeçalho é conferido
+    assert (tab.linhas, tab.colunas) == (8, 8) and tab.celulas[-1] == 200
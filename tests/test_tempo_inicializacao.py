@@ -0,0 +1,8 @@
+from src.tempo_inicializacao import medir_importacao
+
+def test_modulos_sem_interface_nao_importam_pygame():
+    for modulo in ("main", "src.resolvedor_lote", "src.gerador_tabuleiro", "src.linha_do_tempo"):
+        medida = medir_importacao(modulo, repeticoes=1)
+        assert not medida["pygame"], modulo
+        assert medida["importacao_ms"] > 0
+    assert medir_importacao("src.interface_grafica", repeticoes=1)["pygame"]